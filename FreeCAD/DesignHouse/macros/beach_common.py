@@ -189,7 +189,7 @@ def attach_beach_metadata(obj, row, label, supplier="lowes", apply_color=True):
     else:
         # Fallback: manual property attachment
         for prop in ("sku_lowes", "url_lowes", "sku_hd", "url_hd", "supplier", "label"):
-            if prop not in obj.PropertiesList:
+            if not hasattr(obj, prop):
                 obj.addProperty("App::PropertyString", prop)
             val = row.get(prop, "")
             if val:
@@ -203,7 +203,7 @@ def attach_beach_metadata(obj, row, label, supplier="lowes", apply_color=True):
     for prop in ("price_each_usd", "price_per_ft_usd"):
         val = row.get(prop, "")
         if val:
-            if prop not in obj.PropertiesList:
+            if not hasattr(obj, prop):
                 obj.addProperty("App::PropertyString", prop)
             setattr(obj, prop, val)
 
@@ -251,8 +251,7 @@ def add_to_group(grp, objects):
     if not isinstance(objects, (list, tuple)):
         objects = [objects]
 
-    for obj in objects:
-        grp.addObject(obj)
+    grp.addObjects(objects)
 
     # Explicit Group assignment (some FreeCAD builds need this)
     grp.Group = list(grp.Group)  # Convert to list + reassign for compatibility
@@ -265,8 +265,7 @@ def create_lvl_beam_assembly_20ft(
 
     # Add all parts to assembly
     App.Console.PrintMessage(f"[beam_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     App.Console.PrintMessage(
         f"[beam_assemblies] ✓ LVL assembly complete: {assembly_name} "
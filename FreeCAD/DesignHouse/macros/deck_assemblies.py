@@ -8,7 +8,9 @@ Construction sequence:
 2. create_deck_surface_16x8() - Deck boards, posts (installed after walls)
 """
 
+import math
 import os
+from functools import lru_cache
 
 import Part
 
@@ -54,6 +56,10 @@ MIN_END_SEGMENT_IN = 24.0  # 2' minimum - shorter segments look bad and waste ma
 # Floating point tolerance for length comparisons (inches)
 LENGTH_TOLERANCE_IN = 0.1  # 1/10" tolerance for comparing board lengths
 
+# Progress messages on the FreeCAD console (set DECK_ASM_VERBOSE=0 for quiet batch builds;
+# errors are always printed)
+VERBOSE = os.environ.get("DECK_ASM_VERBOSE", "1").lower() not in ("0", "false", "no")
+
 # Deck board catalog label (matches lumber_catalog.csv)
 DECK_BOARD_LABEL = "deckboard_5_4x6x192_PT"  # 5/4x6x16' PT deck boards
 
@@ -63,6 +69,11 @@ SEAM_BOARD_WIDTH_IN = 5.5  # Same as deck board width
 DOUBLE_JOIST_SPACING_IN = 5.5  # Distance between double-joist pair (seam board width)
 
 
+def _log(msg):
+    """Print a progress message to the FreeCAD console unless VERBOSE is off."""
+    lc.log(msg, VERBOSE)
+
+
 def _calculate_seam_zones(
     total_length,
     max_board_length,
@@ -112,6 +123,8 @@ def _calculate_seam_zones(
         ]
         Where field segments show cut length (end - start) from stock_length boards.
     """
+    tolerance = LENGTH_TOLERANCE_IN
+    min_end_segment = MIN_END_SEGMENT_IN
     if total_length <= max_board_length:
         # Single run of field boards covers entire length - no seams needed
         return [
@@ -137,7 +150,7 @@ def _calculate_seam_zones(
         joist_positions.append(pos)
         pos += joist_spacing
 
-    while current_pos < total_length - LENGTH_TOLERANCE_IN:
+    while current_pos < total_length - tolerance:
         # Maximum field board run before needing a seam
         max_run = max_board_length
 
@@ -178,7 +191,7 @@ def _calculate_seam_zones(
 
             # Check if there's room for seam zone + meaningful field boards after
             space_after_seam = total_length - (field_end + seam_zone_width)
-            if space_after_seam < MIN_END_SEGMENT_IN and space_after_seam > 0:
+            if space_after_seam < min_end_segment and space_after_seam > 0:
                 # Would create short stub after seam - skip this position
                 continue
 
@@ -233,6 +246,43 @@ def _calculate_seam_zones(
     return segments
 
 
+@lru_cache(maxsize=None)
+def _layout_deck_boards(proj_y_in, deck_width, deck_gap, overhang=DECK_OVERHANG_IN):
+    """
+    Lay out deck board rows across a projection (boards run along X, stacked in Y).
+
+    The first board is shifted toward the house by the overhang. Full-width boards
+    step by width + gap until the next one would pass proj_y_in; the last row is
+    ripped to the remaining space, widened by the overhang. Rips of 1/4" or less
+    are dropped. Layouts are cached per argument set (the result is immutable).
+
+    Args:
+        proj_y_in: Deck projection in Y (inches)
+        deck_width: Actual deck board width (5.5" for 5/4x6)
+        deck_gap: Gap between boards (inches)
+        overhang: Overhang beyond framing on the outer edges (inches)
+
+    Returns:
+        Tuple of (name, y_start_in, width_in) per board, e.g.
+        (("Deck_1", -1.0, 5.5), ..., ("Deck_18_RIP", 94.625, 2.375))
+    """
+    step = deck_width + deck_gap
+    y0 = -overhang  # shift first board toward house by overhang
+
+    # Full-width rows in closed form: y0 + k * step for every k that still fits
+    n_full = max(math.floor((proj_y_in - y0 - deck_width) / step) + 1, 0)
+    ys = [y for y in (y0 + k * step for k in range(n_full)) if y + deck_width <= proj_y_in]
+    layout = [(f"Deck_{i}", y, deck_width) for i, y in enumerate(ys, start=1)]
+
+    # Rip last board to remaining space
+    rip_start = (ys[-1] + deck_width if ys else y0) + deck_gap
+    remaining = proj_y_in - rip_start + overhang  # widen rip by overhang
+    if remaining > 0.25:
+        layout.append((f"Deck_{len(ys) + 1}_RIP", rip_start, remaining))
+
+    return tuple(layout)
+
+
 def _calculate_splice_positions(total_length, max_board_length, joist_spacing, start_offset=0.0):
     """
     Calculate board splice positions that align with joist centers.
@@ -253,6 +303,7 @@ def _calculate_splice_positions(total_length, max_board_length, joist_spacing, s
         List of splice positions (X or Y coordinates where boards end/start)
         First position is 0.0 (start), last is total_length (end)
     """
+    tolerance = LENGTH_TOLERANCE_IN
 
     if total_length <= max_board_length:
         # Single board covers entire length - no splices needed
@@ -310,7 +361,7 @@ def _calculate_splice_positions(total_length, max_board_length, joist_spacing, s
     # If so, fall back to greedy algorithm
     needs_greedy = False
     for i in range(len(splices) - 1):
-        if splices[i + 1] - splices[i] > max_board_length + LENGTH_TOLERANCE_IN:
+        if splices[i + 1] - splices[i] > max_board_length + tolerance:
             needs_greedy = True
             break
 
@@ -319,7 +370,7 @@ def _calculate_splice_positions(total_length, max_board_length, joist_spacing, s
         splices = [0.0]
         current_pos = 0.0
 
-        while current_pos < total_length - LENGTH_TOLERANCE_IN:
+        while current_pos < total_length - tolerance:
             best_joist = None
             for joist_pos in joist_positions:
                 if joist_pos <= current_pos:
@@ -342,12 +393,39 @@ def _calculate_splice_positions(total_length, max_board_length, joist_spacing, s
                 break
 
         splices = sorted(set(splices))
-        if splices[-1] < total_length - LENGTH_TOLERANCE_IN:
+        if splices[-1] < total_length - tolerance:
             splices.append(total_length)
 
     return splices
 
 
+@lru_cache(maxsize=None)
+def _joist_centers(length_in, joist_thick, spacing=JOIST_SPACING_OC_IN):
+    """
+    Joist center positions along a run, on center from the first end joist.
+
+    The last joist is always flush with the far end, so the final bay may be
+    shorter than the spacing. Results are cached per (length, thickness,
+    spacing), so repeated deck builds in one session reuse the same tuple.
+
+    Args:
+        length_in: Run length (inches)
+        joist_thick: Joist thickness (1.5" for 2x)
+        spacing: On-center spacing (inches)
+
+    Returns:
+        Tuple of joist center positions (inches), first and last are the end joists
+    """
+    first_center = joist_thick / 2.0
+    last_center = length_in - (joist_thick / 2.0)
+    # Closed form (first + k * spacing) so centers never accumulate += drift
+    count = max(math.floor((last_center - first_center) / spacing) + 1, 0)
+    centers = [first_center + k * spacing for k in range(count)]
+    if not centers or centers[-1] < last_center - 1e-6:
+        centers.append(last_center)
+    return tuple(centers)
+
+
 def _create_deck_hangers(
     doc,
     joist_centers,
@@ -384,96 +462,92 @@ def _create_deck_hangers(
     Returns:
         List of hanger objects
     """
-    hangs = []
-
-    for idx, cx in enumerate(joist_centers, start=1):
-        if idx == 1 or idx == len(joist_centers):
-            continue  # skip end joists (they're rim joists)
-        try:
-            prefix = f"{name_prefix}_" if name_prefix else ""
-
-            # House rim hanger: joist meets south face of house rim at Y=0
-            # Joist is SOUTH of rim face, hanger opens NORTH toward rim
-            hangs.append(
-                lc.make_hanger_for_joist(
-                    doc,
-                    f"{prefix}Hanger_House_{idx}",
-                    joist_x_in=cx,  # Joist center X
-                    joist_y_in=0.0,  # Y where joist meets rim (south face of house rim)
-                    joist_z_in=0.0,  # Joist bottom Z (deck joists sit at Z=0)
-                    joist_thick_in=joist_thick,
-                    joist_depth_in=joist_depth,
-                    rim_face_position_in=0.0,  # South face of house rim at Y=0
-                    rim_axis="X",  # Rim runs E-W
-                    rim_side="south",  # Joist is south of rim face
-                    hanger_thickness_in=hanger_thickness,
-                    hanger_height_in=hanger_height,
-                    hanger_seat_depth_in=hanger_seat_depth,
-                    hanger_label=hanger_label,
-                    color=(0.6, 0.6, 0.7),
-                )
-            )
-            # Outboard rim hanger: joist meets north face of outboard rim at Y=proj_y_in
-            # Joist is NORTH of rim face, hanger opens SOUTH toward rim
-            hangs.append(
-                lc.make_hanger_for_joist(
-                    doc,
-                    f"{prefix}Hanger_Outboard_{idx}",
-                    joist_x_in=cx,  # Joist center X
-                    joist_y_in=proj_y_in,  # Y where joist meets rim (north face of outboard rim)
-                    joist_z_in=0.0,  # Joist bottom Z
-                    joist_thick_in=joist_thick,
-                    joist_depth_in=joist_depth,
-                    rim_face_position_in=proj_y_in,  # North face of outboard rim at Y=proj_y_in
-                    rim_axis="X",  # Rim runs E-W
-                    rim_side="north",  # Joist is north of rim face
-                    hanger_thickness_in=hanger_thickness,
-                    hanger_height_in=hanger_height,
-                    hanger_seat_depth_in=hanger_seat_depth,
-                    hanger_label=hanger_label,
-                    color=(0.6, 0.6, 0.7),
-                )
-            )
-        except Exception as e:
-            App.Console.PrintError(f"[deck_assemblies] Hanger build failed for joist {idx}: {e}\n")
+    prefix = f"{name_prefix}_" if name_prefix else ""
+    specs = []
+    for idx, cx in enumerate(joist_centers[1:-1], start=2):
+        # House rim hanger: joist meets south face of house rim at Y=0
+        # Joist is SOUTH of rim face, hanger opens NORTH toward rim
+        specs.append(
+            {
+                "name": f"{prefix}Hanger_House_{idx}",
+                "joist_x_in": cx,
+                "joist_y_in": 0.0,
+                "joist_z_in": 0.0,  # Deck joists sit at Z=0
+                "rim_face_position_in": 0.0,
+                "rim_axis": "X",  # Rim runs E-W
+                "rim_side": "south",
+            }
+        )
+        # Outboard rim hanger: joist meets north face of outboard rim at Y=proj_y_in
+        # Joist is NORTH of rim face, hanger opens SOUTH toward rim
+        specs.append(
+            {
+                "name": f"{prefix}Hanger_Outboard_{idx}",
+                "joist_x_in": cx,
+                "joist_y_in": proj_y_in,
+                "joist_z_in": 0.0,
+                "rim_face_position_in": proj_y_in,
+                "rim_axis": "X",
+                "rim_side": "north",
+            }
+        )
 
-    return hangs
+    # Every interior hanger is one of two orientations, so the batch call builds
+    # two fused solids and places copies of them. A failed hanger is logged and
+    # skipped; the rest of the batch is still built.
+    return lc.make_hangers_for_joists(
+        doc,
+        specs,
+        joist_thick_in=joist_thick,
+        joist_depth_in=joist_depth,
+        hanger_thickness_in=hanger_thickness,
+        hanger_height_in=hanger_height,
+        hanger_seat_depth_in=hanger_seat_depth,
+        hanger_label=hanger_label,
+        color=HANGER_COLOR,
+        skip_failed=True,
+    )
 
 
-def create_deck_joists_16x8(
+def _create_deck_joists(
     doc,
     catalog_rows,
-    assembly_name="Deck_Joists_16x8",
-    x_base=0.0,
-    y_base=0.0,
-    z_base=0.0,
-    supplier="lowes",
+    length_x_in,
+    proj_y_in,
+    rim_label,
+    joist_label,
+    assembly_name,
+    x_base,
+    y_base,
+    z_base,
+    supplier,
+    recompute,
+    cut_rim_to_length=False,
 ):
     """
-    Create a 16' x 8' deck joist framing assembly (joists, rims, hangers only).
-    This is installed BEFORE sheathing so workers can walk on it.
+    Build a deck joist framing assembly: house/outboard rims, joists @ 16" OC, hangers.
 
-    Design:
-        - 16' x 8' footprint (X=16', Y=8')
-        - House side rim at Y=0, joists project +Y (8')
-        - 2x12 joists @ 16" OC with rim/end boards
-        - Joist hangers on house rim and outboard rim
+    Shared by the create_deck_joists_* factories, which only differ in footprint
+    and rim stock.
 
     Args:
         doc: FreeCAD document
         catalog_rows: Catalog data (list of dicts)
+        length_x_in: Deck width along X (inches)
+        proj_y_in: Deck projection along Y, i.e. joist length (inches)
+        rim_label: Catalog label for the house and outboard rims
+        joist_label: Catalog label for the joists
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done
+        cut_rim_to_length: Rims are cut down from longer stock; size them to
+                           length_x_in and record cut_length_in for the BOM
 
     Returns:
         App::Part assembly containing joists, rims, and hangers
     """
-    # Parameters
-    length_x_in = 192.0  # 16'
-    proj_y_in = 96.0  # 8'
-    rim_label = "2x12x192"
-    joist_label = "2x12x96"
+    INCH = lc.inch(1.0)  # mm per inch
 
     # Find stock
     rim_row = lc.find_stock(catalog_rows, rim_label)
@@ -485,81 +559,85 @@ def create_deck_joists_16x8(
     # Dimensions
     rim_thick = float(rim_row["actual_thickness_in"])
     rim_depth = float(rim_row["actual_width_in"])
-    rim_len = float(rim_row["length_in"])
+    rim_len = length_x_in if cut_rim_to_length else float(rim_row["length_in"])
     joist_thick = float(joist_row["actual_thickness_in"])
     joist_depth = float(joist_row["actual_width_in"])
-    _joist_len = float(joist_row["length_in"])  # noqa: F841 - kept for reference
 
-    created = []
+    # Box sizes are the same for every rim/joist, so convert them to mm once
+    rim_dims = (rim_len * INCH, rim_thick * INCH, rim_depth * INCH)
+    joist_dims = (joist_thick * INCH, proj_y_in * INCH, joist_depth * INCH)
+
+    add_object = doc.addObject
+    vec = App.Vector
 
     def make_rim(name, y_local):
-        box = Part.makeBox(lc.inch(rim_len), lc.inch(rim_thick), lc.inch(rim_depth))
-        obj = doc.addObject("Part::Feature", name)
+        box = lc.cached_box(*rim_dims)
+        obj = add_object("Part::Feature", name)
         obj.Shape = box
-        obj.Placement.Base = App.Vector(0, lc.inch(y_local), 0)
-        lc.attach_metadata(obj, rim_row, rim_label, supplier=supplier)
+        obj.Placement = App.Placement(vec(0, y_local * INCH, 0), App.Rotation())
         return obj
 
     def make_joist(name, x_local):
-        box = Part.makeBox(lc.inch(joist_thick), lc.inch(proj_y_in), lc.inch(joist_depth))
-        obj = doc.addObject("Part::Feature", name)
+        box = lc.cached_box(*joist_dims)
+        obj = add_object("Part::Feature", name)
         obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), 0, 0)
-        lc.attach_metadata(obj, joist_row, joist_label, supplier=supplier)
+        obj.Placement = App.Placement(vec(x_local * INCH, 0, 0), App.Rotation())
         return obj
 
-    # Rims
-    rim_offset = joist_thick
-    created.append(make_rim("Rim_House", -rim_offset))
-    created.append(make_rim("Rim_Outboard", proj_y_in))
-
-    # Joists @ 16" OC along X
-    centers = []
-    first_center = joist_thick / 2.0
-    last_center = length_x_in - (joist_thick / 2.0)
-    c = first_center
-    while c < last_center - 1e-6:
-        centers.append(c)
-        c += JOIST_SPACING_OC_IN
-    if not centers or centers[-1] < last_center - 1e-6:
-        centers.append(last_center)
+    # No recomputes while the parts are added; the one below does a single graph pass
+    with lc.recomputes_frozen(doc):
+        # Rims
+        rim_offset = joist_thick
+        rims = [make_rim("Rim_House", -rim_offset), make_rim("Rim_Outboard", proj_y_in)]
+        lc.attach_metadata_bulk(
+            rims,
+            rim_row,
+            rim_label,
+            supplier=supplier,
+            cut_length_in=length_x_in if cut_rim_to_length else None,
+        )
 
-    for idx, cx in enumerate(centers, start=1):
-        x_pos = cx - (joist_thick / 2.0)
-        created.append(make_joist(f"Joist_{idx}", x_pos))
+        # Joists @ 16" OC along X
+        centers = _joist_centers(length_x_in, joist_thick)
+        joists = [
+            make_joist(f"Joist_{idx}", cx - (joist_thick / 2.0))
+            for idx, cx in enumerate(centers, start=1)
+        ]
+        lc.attach_metadata_bulk(joists, joist_row, joist_label, supplier=supplier)
 
-    # Hangers on house rim and outboard rim for each interior joist
-    hangs = _create_deck_hangers(
-        doc,
-        centers,
-        joist_thick,
-        joist_depth,
-        proj_y_in,
-        HANGER_THICKNESS_IN,
-        HANGER_HEIGHT_IN,
-        HANGER_SEAT_DEPTH_IN,
-        HANGER_LABEL,
-    )
-    created.extend(hangs)
+        # Hangers on house rim and outboard rim for each interior joist
+        hangs = _create_deck_hangers(
+            doc,
+            centers,
+            joist_thick,
+            joist_depth,
+            proj_y_in,
+            HANGER_THICKNESS_IN,
+            HANGER_HEIGHT_IN,
+            HANGER_SEAT_DEPTH_IN,
+            HANGER_LABEL,
+        )
+        created = [*rims, *joists, *hangs]
 
-    # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
-    assembly = doc.addObject("App::Part", assembly_name)
-    assembly.Label = assembly_name
+        # Create assembly (App::Part)
+        _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
+        assembly = doc.addObject("App::Part", assembly_name)
+        assembly.Label = assembly_name
 
-    # Add all parts to assembly
-    App.Console.PrintMessage(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+        # Add all parts to assembly
+        _log(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
+        assembly.addObjects(created)
 
-    # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+        # Apply global position offset
+        assembly.Placement = App.Placement(
+            App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+        )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({len(centers)} joists, 2 rims, {len(hangs)} hangers)\n"
     )
@@ -567,21 +645,22 @@ def create_deck_joists_16x8(
     return assembly
 
 
-def create_deck_joists_8x8(
+def create_deck_joists_16x8(
     doc,
     catalog_rows,
-    assembly_name="Deck_Joists_8x8",
+    assembly_name="Deck_Joists_16x8",
     x_base=0.0,
     y_base=0.0,
     z_base=0.0,
     supplier="lowes",
+    recompute=True,
 ):
     """
-    Create an 8' x 8' deck joist framing assembly (joists, rims, hangers only).
+    Create a 16' x 8' deck joist framing assembly (joists, rims, hangers only).
     This is installed BEFORE sheathing so workers can walk on it.
 
     Design:
-        - 8' x 8' footprint (X=8', Y=8')
+        - 16' x 8' footprint (X=16', Y=8')
         - House side rim at Y=0, joists project +Y (8')
         - 2x12 joists @ 16" OC with rim/end boards
         - Joist hangers on house rim and outboard rim
@@ -592,58 +671,74 @@ def create_deck_joists_8x8(
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing joists, rims, and hangers
     """
-    # Parameters
-    _length_x_in = 96.0  # 8' (not 16') - noqa: F841 - kept for reference
-    proj_y_in = 96.0  # 8'
-    _joist_spacing_oc_in = 16.0  # noqa: F841 - kept for reference
-    rim_label = "2x12x96"  # 8' rim (not 16')
-    joist_label = "2x12x96"
-    _hanger_label = "hanger_LU210"  # noqa: F841 - kept for reference
-    _hanger_thickness = 0.06  # noqa: F841 - kept for reference
-    _hanger_height = 7.8125  # noqa: F841 - kept for reference
-    _hanger_seat_depth = 2.0  # noqa: F841 - kept for reference
-
-    # Find stock
-    rim_row = lc.find_stock(catalog_rows, rim_label)
-    joist_row = lc.find_stock(catalog_rows, joist_label)
+    return _create_deck_joists(
+        doc,
+        catalog_rows,
+        length_x_in=192.0,  # 16'
+        proj_y_in=96.0,  # 8'
+        rim_label="2x12x192",
+        joist_label="2x12x96",
+        assembly_name=assembly_name,
+        x_base=x_base,
+        y_base=y_base,
+        z_base=z_base,
+        supplier=supplier,
+        recompute=recompute,
+    )
 
-    if not rim_row or not joist_row:
-        raise ValueError("Required rim/joist stock not found in catalog.")
 
-    # Dimensions
-    rim_thick = float(rim_row["actual_thickness_in"])
-    rim_depth = float(rim_row["actual_width_in"])
-    rim_len = float(rim_row["length_in"])
-    joist_thick = float(joist_row["actual_thickness_in"])
-    joist_depth = float(joist_row["actual_width_in"])
-    _joist_len = float(joist_row["length_in"])  # noqa: F841 - kept for reference
-
-    created = []
+def create_deck_joists_8x8(
+    doc,
+    catalog_rows,
+    assembly_name="Deck_Joists_8x8",
+    x_base=0.0,
+    y_base=0.0,
+    z_base=0.0,
+    supplier="lowes",
+    recompute=True,
+):
+    """
+    Create an 8' x 8' deck joist framing assembly (joists, rims, hangers only).
+    This is installed BEFORE sheathing so workers can walk on it.
 
-    def make_rim(name, y_local):
-        box = Part.makeBox(lc.inch(rim_len), lc.inch(rim_thick), lc.inch(rim_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(0, lc.inch(y_local), 0)
-        lc.attach_metadata(obj, rim_row, rim_label, supplier=supplier)
-        return obj
+    Design:
+        - 8' x 8' footprint (X=8', Y=8')
+        - House side rim at Y=0, joists project +Y (8')
+        - 2x12 joists @ 16" OC with rim/end boards
+        - Joist hangers on house rim and outboard rim
 
-    def make_joist(name, x_local):
-        box = Part.makeBox(lc.inch(joist_thick), lc.inch(proj_y_in), lc.inch(joist_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), 0, 0)
-        lc.attach_metadata(obj, joist_row, joist_label, supplier=supplier)
-        return obj
+    Args:
+        doc: FreeCAD document
+        catalog_rows: Catalog data (list of dicts)
+        assembly_name: Name for the assembly
+        x_base, y_base, z_base: Position offsets (inches)
+        supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
-    # Rims
-    rim_offset = joist_thick
-    created.append(make_rim("Rim_House", -rim_offset))
-    created.append(make_rim("Rim_Outboard", proj_y_in))
+    Returns:
+        App::Part assembly containing joists, rims, and hangers
+    """
+    return _create_deck_joists(
+        doc,
+        catalog_rows,
+        length_x_in=96.0,  # 8'
+        proj_y_in=96.0,  # 8'
+        rim_label="2x12x96",  # 8' rim (not 16')
+        joist_label="2x12x96",
+        assembly_name=assembly_name,
+        x_base=x_base,
+        y_base=y_base,
+        z_base=z_base,
+        supplier=supplier,
+        recompute=recompute,
+    )
 
 
 def create_deck_joists_8ft9in_x_8ft(
@@ -654,6 +749,7 @@ def create_deck_joists_8ft9in_x_8ft(
     y_base=0.0,
     z_base=0.0,
     supplier="lowes",
+    recompute=True,
 ):
     """
     Create an 8'9" x 8' deck joist framing assembly (joists, rims, hangers only).
@@ -672,113 +768,120 @@ def create_deck_joists_8ft9in_x_8ft(
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing joists, rims, and hangers
     """
-    # Parameters
-    length_x_in = 105.0  # 8'9" wide
-    proj_y_in = 96.0  # 8' deep
-    rim_house_outboard_label = "2x12x120"  # 10' boards for house/outboard rims (cut to 105")
-    joist_label = "2x12x96"  # 8' joists
+    return _create_deck_joists(
+        doc,
+        catalog_rows,
+        length_x_in=105.0,  # 8'9" wide
+        proj_y_in=96.0,  # 8' deep
+        rim_label="2x12x120",  # 10' boards for house/outboard rims (cut to 105")
+        joist_label="2x12x96",  # 8' joists
+        assembly_name=assembly_name,
+        x_base=x_base,
+        y_base=y_base,
+        z_base=z_base,
+        supplier=supplier,
+        recompute=recompute,
+        cut_rim_to_length=True,
+    )
 
-    # Find stock
-    rim_row = lc.find_stock(catalog_rows, rim_house_outboard_label)
-    joist_row = lc.find_stock(catalog_rows, joist_label)
 
-    if not rim_row or not joist_row:
-        raise ValueError("Required rim/joist stock not found in catalog.")
+# ============================================================
+# BOARD HELPERS
+# ============================================================
 
-    # Dimensions
-    rim_thick = float(rim_row["actual_thickness_in"])
-    rim_depth = float(rim_row["actual_width_in"])
-    joist_thick = float(joist_row["actual_thickness_in"])
-    joist_depth = float(joist_row["actual_width_in"])
-    _joist_len = float(joist_row["length_in"])  # noqa: F841 - kept for reference
 
-    created = []
+def _make_board(doc, name, dims_in, pos_in):
+    """
+    Create a rectangular board as a Part::Feature.
 
-    def make_rim_house_outboard(name, y_local):
-        """Make Rim_House or Rim_Outboard (105\" long, cut from 10' boards)"""
-        box = Part.makeBox(lc.inch(length_x_in), lc.inch(rim_thick), lc.inch(rim_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(0, lc.inch(y_local), 0)
-        lc.attach_metadata(obj, rim_row, rim_house_outboard_label, supplier=supplier)
-        try:
-            if "cut_length_in" not in obj.PropertiesList:
-                obj.addProperty("App::PropertyString", "cut_length_in")
-            obj.cut_length_in = f"{length_x_in}"
-        except Exception:
-            pass
-        return obj
+    The box comes from lc.cached_box(), so each size is built once and every board
+    gets its own copy: boards stay independent (safe to cut, trim or delete one) and
+    still expose .Shape to the BOM, snapshot and bbox tooling.
 
-    def make_joist(name, x_local):
-        """Make a joist (96\" long, running in Y direction)"""
-        box = Part.makeBox(lc.inch(joist_thick), lc.inch(proj_y_in), lc.inch(joist_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), 0, 0)
-        lc.attach_metadata(obj, joist_row, joist_label, supplier=supplier)
-        return obj
+    Args:
+        doc: FreeCAD document
+        name: Object name
+        dims_in: (x_length, y_width, z_thick) in inches
+        pos_in: (x, y, z) position in inches (assembly-local)
 
-    # Rims: House and Outboard are 105" long
-    rim_offset = joist_thick
-    created.append(make_rim_house_outboard("Rim_House", -rim_offset))
-    created.append(make_rim_house_outboard("Rim_Outboard", proj_y_in))
+    Returns:
+        Part::Feature
+    """
+    INCH = lc.inch(1.0)  # mm per inch
+    obj = doc.addObject("Part::Feature", name)
+    obj.Shape = lc.cached_box(dims_in[0] * INCH, dims_in[1] * INCH, dims_in[2] * INCH)
+    obj.Placement = App.Placement(
+        App.Vector(pos_in[0] * INCH, pos_in[1] * INCH, pos_in[2] * INCH), App.Rotation()
+    )
+    return obj
 
-    # Joists @ 16" OC along X
-    centers = []
-    first_center = joist_thick / 2.0
-    last_center = length_x_in - (joist_thick / 2.0)
-    c = first_center
-    while c < last_center - 1e-6:
-        centers.append(c)
-        c += JOIST_SPACING_OC_IN
-    if not centers or centers[-1] < last_center - 1e-6:
-        centers.append(last_center)
 
-    for idx, cx in enumerate(centers, start=1):
-        x_pos = cx - (joist_thick / 2.0)
-        created.append(make_joist(f"Joist_{idx}", x_pos))
+# Factories plan generated box parts as (x, y, z, lx, ly, lz, kind) tuples (inches,
+# assembly-local), run spatial queries on them (e.g. post/board overlap), then
+# create FreeCAD objects in a single pass.
+_KIND_RIM, _KIND_JOIST, _KIND_DECK, _KIND_POST = range(4)
 
-    # Hangers on house rim and outboard rim for each interior joist
-    hangs = _create_deck_hangers(
-        doc,
-        centers,
-        joist_thick,
-        joist_depth,
-        proj_y_in,
-        HANGER_THICKNESS_IN,
-        HANGER_HEIGHT_IN,
-        HANGER_SEAT_DEPTH_IN,
-        HANGER_LABEL,
-    )
-    created.extend(hangs)
 
-    # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
+def _make_side_edge_boards(
+    doc, edge_dims, length_x_in, y_start, z, include_left_edge, include_right_edge
+):
+    """
+    Create the picture-frame edge boards along the left and right ends of a deck.
+
+    Both edges run in Y and share one size, so they copy the same cached box.
+
+    Args:
+        doc: FreeCAD document
+        edge_dims: (width, length, thickness) of the edge boards (inches)
+        length_x_in: Deck length in X (inches); the right edge ends flush with it
+        y_start: Y of the edge boards' near end (inches)
+        z: Z of the edge boards' underside (inches)
+        include_left_edge: Add Edge_Left at X=0
+        include_right_edge: Add Edge_Right at X=length_x_in - width
+
+    Returns:
+        List of edge board objects (left first)
+    """
+    specs = (
+        ("Edge_Left", 0.0, include_left_edge),
+        ("Edge_Right", length_x_in - edge_dims[0], include_right_edge),
     )
-    assembly = doc.addObject("App::Part", assembly_name)
-    assembly.Label = assembly_name
+    return [
+        _make_board(doc, name, edge_dims, (x, y_start, z)) for name, x, wanted in specs if wanted
+    ]
 
-    # Add all parts to assembly
-    App.Console.PrintMessage(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
 
-    # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+def _materialize_parts(doc, parts, names):
+    """
+    Create one Part::Feature box per planned (x, y, z, lx, ly, lz, kind) row.
 
-    doc.recompute()
+    Each size is built once through lc.cached_box() and every row gets its own copy.
 
-    App.Console.PrintMessage(
-        f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
-        f"({len(centers)} joists, 2 rims, {len(hangs)} hangers)\n"
-    )
+    Args:
+        doc: FreeCAD document
+        parts: List of (x, y, z, lx, ly, lz, kind) tuples, position and size in inches
+        names: Object name per row
 
-    return assembly
+    Returns:
+        List of Part::Feature objects in row order
+    """
+    INCH = lc.inch(1.0)  # mm per inch
+
+    # One transaction for the whole batch coalesces the per-object undo/change events
+    objs = []
+    with lc.doc_transaction(doc, "Create deck parts"):
+        for (x, y, z, lx, ly, lz, _kind), name in zip(parts, names):
+            obj = doc.addObject("Part::Feature", name)
+            obj.Shape = lc.cached_box(lx * INCH, ly * INCH, lz * INCH)
+            obj.Placement = App.Placement(App.Vector(x * INCH, y * INCH, z * INCH), App.Rotation())
+            objs.append(obj)
+    return objs
 
 
 # ============================================================
@@ -830,15 +933,16 @@ def _make_mitered_edge_board(
     Returns:
         Part::Feature object with mitered shape
     """
+    INCH = lc.inch(1.0)  # mm per inch
     import Part
 
     # Create base board shape
     if edge_axis == "Y":
         # Board runs N-S (along Y axis)
-        base_box = Part.makeBox(lc.inch(deck_width), lc.inch(edge_length_in), lc.inch(deck_thick))
+        base_box = lc.cached_box(deck_width * INCH, edge_length_in * INCH, deck_thick * INCH)
     else:
         # Board runs E-W (along X axis)
-        base_box = Part.makeBox(lc.inch(edge_length_in), lc.inch(deck_width), lc.inch(deck_thick))
+        base_box = lc.cached_box(edge_length_in * INCH, deck_width * INCH, deck_thick * INCH)
 
     shape = base_box
 
@@ -889,23 +993,23 @@ def _make_mitered_edge_board(
                 # Left edge board: cut removes SE inner corner (at X=deck_width, Y=0)
                 # Triangle: (deck_width, 0) - (deck_width, deck_width) - (0, 0)
                 cut_points = [
-                    App.Vector(lc.inch(deck_width), 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), 0, -lc.inch(deck_thick)),
+                    App.Vector(deck_width * INCH, 0, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector(0, 0, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, 0, -deck_thick * INCH),
                 ]
             else:
                 # Right edge board: cut removes SW inner corner (at X=0, Y=0)
                 # Triangle: (0, 0) - (deck_width, 0) - (0, deck_width)
                 cut_points = [
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), 0, -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
+                    App.Vector(0, 0, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, 0, -deck_thick * INCH),
+                    App.Vector(0, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector(0, 0, -deck_thick * INCH),
                 ]
             cut_wire = Part.makePolygon(cut_points)
             cut_face = Part.Face(cut_wire)
-            cut_shape = cut_face.extrude(App.Vector(0, 0, lc.inch(deck_thick * 3)))
+            cut_shape = cut_face.extrude(App.Vector(0, 0, deck_thick * 3 * INCH))
             shape = shape.cut(cut_shape)
 
         if miter_end in ("back", "north"):
@@ -913,27 +1017,27 @@ def _make_mitered_edge_board(
                 # Left edge board: cut removes NE inner corner (at X=deck_width, Y=length)
                 # Triangle: (deck_width, length) - (0, length) - (deck_width, length-deck_width)
                 cut_points = [
-                    App.Vector(lc.inch(deck_width), lc.inch(edge_length_in), -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(edge_length_in), -lc.inch(deck_thick)),
+                    App.Vector(deck_width * INCH, edge_length_in * INCH, -deck_thick * INCH),
+                    App.Vector(0, edge_length_in * INCH, -deck_thick * INCH),
                     App.Vector(
-                        lc.inch(deck_width),
-                        lc.inch(edge_length_in - deck_width),
-                        -lc.inch(deck_thick),
+                        deck_width * INCH,
+                        (edge_length_in - deck_width) * INCH,
+                        -deck_thick * INCH,
                     ),
-                    App.Vector(lc.inch(deck_width), lc.inch(edge_length_in), -lc.inch(deck_thick)),
+                    App.Vector(deck_width * INCH, edge_length_in * INCH, -deck_thick * INCH),
                 ]
             else:
                 # Right edge board: cut removes NW inner corner (at X=0, Y=length)
                 # Triangle: (0, length) - (0, length-deck_width) - (deck_width, length)
                 cut_points = [
-                    App.Vector(0, lc.inch(edge_length_in), -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(edge_length_in - deck_width), -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), lc.inch(edge_length_in), -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(edge_length_in), -lc.inch(deck_thick)),
+                    App.Vector(0, edge_length_in * INCH, -deck_thick * INCH),
+                    App.Vector(0, (edge_length_in - deck_width) * INCH, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, edge_length_in * INCH, -deck_thick * INCH),
+                    App.Vector(0, edge_length_in * INCH, -deck_thick * INCH),
                 ]
             cut_wire = Part.makePolygon(cut_points)
             cut_face = Part.Face(cut_wire)
-            cut_shape = cut_face.extrude(App.Vector(0, 0, lc.inch(deck_thick * 3)))
+            cut_shape = cut_face.extrude(App.Vector(0, 0, deck_thick * 3 * INCH))
             shape = shape.cut(cut_shape)
 
     else:
@@ -957,23 +1061,23 @@ def _make_mitered_edge_board(
                 # Front edge board: cut removes NW inner corner (at X=0, Y=deck_width)
                 # Triangle: (0, deck_width) - (deck_width, deck_width) - (0, 0)
                 cut_points = [
-                    App.Vector(0, lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(deck_width), -lc.inch(deck_thick)),
+                    App.Vector(0, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector(0, 0, -deck_thick * INCH),
+                    App.Vector(0, deck_width * INCH, -deck_thick * INCH),
                 ]
             else:
                 # Back edge board: cut removes SW inner corner (at X=0, Y=0)
                 # Triangle: (0, 0) - (0, deck_width) - (deck_width, 0)
                 cut_points = [
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
-                    App.Vector(0, lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(deck_width), 0, -lc.inch(deck_thick)),
-                    App.Vector(0, 0, -lc.inch(deck_thick)),
+                    App.Vector(0, 0, -deck_thick * INCH),
+                    App.Vector(0, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector(deck_width * INCH, 0, -deck_thick * INCH),
+                    App.Vector(0, 0, -deck_thick * INCH),
                 ]
             cut_wire = Part.makePolygon(cut_points)
             cut_face = Part.Face(cut_wire)
-            cut_shape = cut_face.extrude(App.Vector(0, 0, lc.inch(deck_thick * 3)))
+            cut_shape = cut_face.extrude(App.Vector(0, 0, deck_thick * 3 * INCH))
             shape = shape.cut(cut_shape)
 
         if miter_end in ("right", "east"):
@@ -981,33 +1085,35 @@ def _make_mitered_edge_board(
                 # Front edge board: cut removes NE inner corner (at X=length, Y=deck_width)
                 # Triangle: (length, deck_width) - (length-deck_width, deck_width) - (length, 0)
                 cut_points = [
-                    App.Vector(lc.inch(edge_length_in), lc.inch(deck_width), -lc.inch(deck_thick)),
+                    App.Vector(edge_length_in * INCH, deck_width * INCH, -deck_thick * INCH),
                     App.Vector(
-                        lc.inch(edge_length_in - deck_width),
-                        lc.inch(deck_width),
-                        -lc.inch(deck_thick),
+                        (edge_length_in - deck_width) * INCH,
+                        deck_width * INCH,
+                        -deck_thick * INCH,
                     ),
-                    App.Vector(lc.inch(edge_length_in), 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(edge_length_in), lc.inch(deck_width), -lc.inch(deck_thick)),
+                    App.Vector(edge_length_in * INCH, 0, -deck_thick * INCH),
+                    App.Vector(edge_length_in * INCH, deck_width * INCH, -deck_thick * INCH),
                 ]
             else:
                 # Back edge board: cut removes SE inner corner (at X=length, Y=0)
                 # Triangle: (length, 0) - (length, deck_width) - (length-deck_width, 0)
                 cut_points = [
-                    App.Vector(lc.inch(edge_length_in), 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(edge_length_in), lc.inch(deck_width), -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(edge_length_in - deck_width), 0, -lc.inch(deck_thick)),
-                    App.Vector(lc.inch(edge_length_in), 0, -lc.inch(deck_thick)),
+                    App.Vector(edge_length_in * INCH, 0, -deck_thick * INCH),
+                    App.Vector(edge_length_in * INCH, deck_width * INCH, -deck_thick * INCH),
+                    App.Vector((edge_length_in - deck_width) * INCH, 0, -deck_thick * INCH),
+                    App.Vector(edge_length_in * INCH, 0, -deck_thick * INCH),
                 ]
             cut_wire = Part.makePolygon(cut_points)
             cut_face = Part.Face(cut_wire)
-            cut_shape = cut_face.extrude(App.Vector(0, 0, lc.inch(deck_thick * 3)))
+            cut_shape = cut_face.extrude(App.Vector(0, 0, deck_thick * 3 * INCH))
             shape = shape.cut(cut_shape)
 
     # Create FreeCAD object
     obj = doc.addObject("Part::Feature", name)
     obj.Shape = shape
-    obj.Placement.Base = App.Vector(lc.inch(x_pos), lc.inch(y_pos), lc.inch(board_z))
+    obj.Placement = App.Placement(
+        App.Vector(x_pos * INCH, y_pos * INCH, board_z * INCH), App.Rotation()
+    )
     lc.attach_metadata(obj, deck_row, deck_label, supplier=supplier)
 
     return obj
@@ -1042,6 +1148,8 @@ def _make_scarf_cut(
     """
     import math
 
+    INCH = lc.inch(1.0)  # mm per inch
+
     # Calculate the horizontal run of the angled cut
     # For a 22.5° angle, run = board_width * tan(22.5°) ≈ 0.414 * board_width
     angle_rad = math.radians(cut_angle_deg)
@@ -1054,52 +1162,52 @@ def _make_scarf_cut(
             # Keep right side: cut removes left portion at cut_position
             # Wedge: (cut_position - cut_run, 0) to (cut_position, board_width) to (cut_position - cut_run, board_width)
             cut_points = [
-                App.Vector(lc.inch(cut_position - cut_run), 0, -lc.inch(board_thick)),
-                App.Vector(lc.inch(cut_position), 0, -lc.inch(board_thick)),
-                App.Vector(lc.inch(cut_position), lc.inch(board_width), -lc.inch(board_thick)),
+                App.Vector((cut_position - cut_run) * INCH, 0, -board_thick * INCH),
+                App.Vector(cut_position * INCH, 0, -board_thick * INCH),
+                App.Vector(cut_position * INCH, board_width * INCH, -board_thick * INCH),
                 App.Vector(
-                    lc.inch(cut_position - cut_run), lc.inch(board_width), -lc.inch(board_thick)
+                    (cut_position - cut_run) * INCH, board_width * INCH, -board_thick * INCH
                 ),
-                App.Vector(lc.inch(cut_position - cut_run), 0, -lc.inch(board_thick)),
+                App.Vector((cut_position - cut_run) * INCH, 0, -board_thick * INCH),
             ]
         else:
             # Keep left side: cut removes right portion at cut_position
             cut_points = [
-                App.Vector(lc.inch(cut_position), 0, -lc.inch(board_thick)),
-                App.Vector(lc.inch(cut_position + cut_run), 0, -lc.inch(board_thick)),
+                App.Vector(cut_position * INCH, 0, -board_thick * INCH),
+                App.Vector((cut_position + cut_run) * INCH, 0, -board_thick * INCH),
                 App.Vector(
-                    lc.inch(cut_position + cut_run), lc.inch(board_width), -lc.inch(board_thick)
+                    (cut_position + cut_run) * INCH, board_width * INCH, -board_thick * INCH
                 ),
-                App.Vector(lc.inch(cut_position), lc.inch(board_width), -lc.inch(board_thick)),
-                App.Vector(lc.inch(cut_position), 0, -lc.inch(board_thick)),
+                App.Vector(cut_position * INCH, board_width * INCH, -board_thick * INCH),
+                App.Vector(cut_position * INCH, 0, -board_thick * INCH),
             ]
     else:
         # Board runs along Y axis, cut perpendicular creates X-Z face
         if cut_side == "right":
             cut_points = [
-                App.Vector(0, lc.inch(cut_position - cut_run), -lc.inch(board_thick)),
-                App.Vector(0, lc.inch(cut_position), -lc.inch(board_thick)),
-                App.Vector(lc.inch(board_width), lc.inch(cut_position), -lc.inch(board_thick)),
+                App.Vector(0, (cut_position - cut_run) * INCH, -board_thick * INCH),
+                App.Vector(0, cut_position * INCH, -board_thick * INCH),
+                App.Vector(board_width * INCH, cut_position * INCH, -board_thick * INCH),
                 App.Vector(
-                    lc.inch(board_width), lc.inch(cut_position - cut_run), -lc.inch(board_thick)
+                    board_width * INCH, (cut_position - cut_run) * INCH, -board_thick * INCH
                 ),
-                App.Vector(0, lc.inch(cut_position - cut_run), -lc.inch(board_thick)),
+                App.Vector(0, (cut_position - cut_run) * INCH, -board_thick * INCH),
             ]
         else:
             cut_points = [
-                App.Vector(0, lc.inch(cut_position), -lc.inch(board_thick)),
-                App.Vector(0, lc.inch(cut_position + cut_run), -lc.inch(board_thick)),
+                App.Vector(0, cut_position * INCH, -board_thick * INCH),
+                App.Vector(0, (cut_position + cut_run) * INCH, -board_thick * INCH),
                 App.Vector(
-                    lc.inch(board_width), lc.inch(cut_position + cut_run), -lc.inch(board_thick)
+                    board_width * INCH, (cut_position + cut_run) * INCH, -board_thick * INCH
                 ),
-                App.Vector(lc.inch(board_width), lc.inch(cut_position), -lc.inch(board_thick)),
-                App.Vector(0, lc.inch(cut_position), -lc.inch(board_thick)),
+                App.Vector(board_width * INCH, cut_position * INCH, -board_thick * INCH),
+                App.Vector(0, cut_position * INCH, -board_thick * INCH),
             ]
 
     try:
         cut_wire = Part.makePolygon(cut_points)
         cut_face = Part.Face(cut_wire)
-        cut_shape = cut_face.extrude(App.Vector(0, 0, lc.inch(board_thick * 3)))
+        cut_shape = cut_face.extrude(App.Vector(0, 0, board_thick * 3 * INCH))
         return shape.cut(cut_shape)
     except Exception:
         # If cut fails, return original shape
@@ -1139,6 +1247,7 @@ def _calculate_board_segments(
         List of (start_pos, length, has_miter_start, has_miter_end) tuples
         where positions are relative to the edge (0 = start of edge)
     """
+    tolerance = LENGTH_TOLERANCE_IN
     if total_length <= max_length:
         # Single board covers entire length
         return [(0.0, total_length, True, True)]
@@ -1158,7 +1267,7 @@ def _calculate_board_segments(
         segments = []
         current_pos = 0.0
 
-        while current_pos < total_length - LENGTH_TOLERANCE_IN:
+        while current_pos < total_length - tolerance:
             is_first = current_pos < 0.1
             remaining = total_length - current_pos
 
@@ -1319,6 +1428,7 @@ def _create_segmented_edge_boards(
     Returns:
         List of edge board objects
     """
+    INCH = lc.inch(1.0)  # mm per inch
     boards = []
 
     # Calculate segments for this edge (with optional joist alignment)
@@ -1373,16 +1483,16 @@ def _create_segmented_edge_boards(
             # No miters - simple rectangular board
             if edge_axis == "X":
                 board = doc.addObject("Part::Feature", seg_name)
-                board.Shape = Part.makeBox(
-                    lc.inch(seg_length), lc.inch(deck_width), lc.inch(deck_thick)
+                board.Shape = lc.cached_box(seg_length * INCH, deck_width * INCH, deck_thick * INCH)
+                board.Placement = App.Placement(
+                    App.Vector(seg_x * INCH, seg_y * INCH, board_z * INCH), App.Rotation()
                 )
-                board.Placement.Base = App.Vector(lc.inch(seg_x), lc.inch(seg_y), lc.inch(board_z))
             else:
                 board = doc.addObject("Part::Feature", seg_name)
-                board.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(seg_length), lc.inch(deck_thick)
+                board.Shape = lc.cached_box(deck_width * INCH, seg_length * INCH, deck_thick * INCH)
+                board.Placement = App.Placement(
+                    App.Vector(seg_x * INCH, seg_y * INCH, board_z * INCH), App.Rotation()
                 )
-                board.Placement.Base = App.Vector(lc.inch(seg_x), lc.inch(seg_y), lc.inch(board_z))
             lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
 
         boards.append(board)
@@ -1406,6 +1516,7 @@ def create_unified_deck_surface(
     joist_depth_in=11.25,
     picture_frame_ew_joist_offset=None,
     picture_frame_ns_joist_offset=None,
+    recompute=True,
 ):
     """
     Create a unified deck surface with picture frame edge boards.
@@ -1448,6 +1559,8 @@ def create_unified_deck_surface(
         picture_frame_ns_joist_offset: Distance from frame start to first joist for
                                        NS picture frame boards (left/right edges).
                                        If None, uses legacy center-split algorithm.
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing picture frame and field boards
@@ -1681,21 +1794,20 @@ def create_unified_deck_surface(
     created.extend(all_blocking)
 
     # Create assembly
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created unified deck surface: {assembly_name} (type: App::Part)\n"
-    )
+    _log(f"[deck_assemblies] Created unified deck surface: {assembly_name} (type: App::Part)\n")
     assembly = doc.addObject("App::Part", assembly_name)
     assembly.Label = assembly_name
 
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     # Apply Z offset
-    assembly.Placement.Base = App.Vector(0, 0, lc.inch(z_base))
+    assembly.Placement = App.Placement(App.Vector(0, 0, lc.inch(z_base)), App.Rotation())
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Unified deck surface complete: {assembly_name} "
         f"({len(edge_boards)} frame boards, {len(seam_boards)} seam boards, "
         f"{len(field_boards)} field boards, {len(all_blocking)} blocking)\n"
@@ -1763,6 +1875,10 @@ def _create_zone_field_boards(
     Returns:
         Tuple of (field_boards, seam_boards, blocking) lists
     """
+    INCH = lc.inch(1.0)  # mm per inch
+    make_box = lc.cached_box
+    vec = App.Vector
+
     field_boards = []
     seam_boards = []
     blocking = []
@@ -1798,10 +1914,10 @@ def _create_zone_field_boards(
                 seam_x = x_min + segment["start"]
                 seam_length = segment["end"] - segment["start"]
 
-                seam.Shape = Part.makeBox(
-                    lc.inch(seam_length), lc.inch(zone_depth), lc.inch(deck_thick)
+                seam.Shape = make_box(seam_length * INCH, zone_depth * INCH, deck_thick * INCH)
+                seam.Placement = App.Placement(
+                    vec(seam_x * INCH, y_min * INCH, board_z * INCH), App.Rotation()
                 )
-                seam.Placement.Base = App.Vector(lc.inch(seam_x), lc.inch(y_min), lc.inch(board_z))
                 lc.attach_metadata(seam, deck_row, deck_label, supplier=supplier)
                 seam_boards.append(seam)
 
@@ -1833,14 +1949,17 @@ def _create_zone_field_boards(
                         sister_name = f"{zone_name}_SisterJoist_{seam_count}"
                         sister = doc.addObject("Part::Feature", sister_name)
                         # Joist: thickness (X) × length (Y) × depth (Z)
-                        sister.Shape = Part.makeBox(
-                            lc.inch(joist_thick), lc.inch(sister_joist_length), lc.inch(joist_depth)
+                        sister.Shape = make_box(
+                            joist_thick * INCH, sister_joist_length * INCH, joist_depth * INCH
                         )
                         # Position at joist2 center (X centered on joist), inside rims
-                        sister.Placement.Base = App.Vector(
-                            lc.inch(joist2_x - joist_thick / 2.0),
-                            lc.inch(sister_joist_y_start),
-                            lc.inch(sister_joist_z),
+                        sister.Placement = App.Placement(
+                            vec(
+                                (joist2_x - joist_thick / 2.0) * INCH,
+                                sister_joist_y_start * INCH,
+                                sister_joist_z * INCH,
+                            ),
+                            App.Rotation(),
                         )
                         lc.attach_metadata(sister, joist_row, try_label, supplier=supplier)
                         blocking.append(sister)
@@ -1878,11 +1997,12 @@ def _create_zone_field_boards(
                         )
 
                     board = doc.addObject("Part::Feature", seg_name)
-                    board.Shape = Part.makeBox(
-                        lc.inch(seg_length), lc.inch(actual_width), lc.inch(deck_thick)
+                    board.Shape = make_box(
+                        seg_length * INCH, actual_width * INCH, deck_thick * INCH
                     )
-                    board.Placement.Base = App.Vector(
-                        lc.inch(x_min + seg_start), lc.inch(y_pos), lc.inch(board_z)
+                    board.Placement = App.Placement(
+                        vec((x_min + seg_start) * INCH, y_pos * INCH, board_z * INCH),
+                        App.Rotation(),
                     )
                     lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                     field_boards.append(board)
@@ -1917,10 +2037,10 @@ def _create_zone_field_boards(
                 seam_y = y_min + segment["start"]
                 seam_length = segment["end"] - segment["start"]
 
-                seam.Shape = Part.makeBox(
-                    lc.inch(zone_width), lc.inch(seam_length), lc.inch(deck_thick)
+                seam.Shape = make_box(zone_width * INCH, seam_length * INCH, deck_thick * INCH)
+                seam.Placement = App.Placement(
+                    vec(x_min * INCH, seam_y * INCH, board_z * INCH), App.Rotation()
                 )
-                seam.Placement.Base = App.Vector(lc.inch(x_min), lc.inch(seam_y), lc.inch(board_z))
                 lc.attach_metadata(seam, deck_row, deck_label, supplier=supplier)
                 seam_boards.append(seam)
 
@@ -1943,14 +2063,17 @@ def _create_zone_field_boards(
                         sister_name = f"{zone_name}_SisterJoist_{seam_count}"
                         sister = doc.addObject("Part::Feature", sister_name)
                         # Joist runs EW: length (X) × thickness (Y) × depth (Z)
-                        sister.Shape = Part.makeBox(
-                            lc.inch(zone_width), lc.inch(joist_thick), lc.inch(joist_depth)
+                        sister.Shape = make_box(
+                            zone_width * INCH, joist_thick * INCH, joist_depth * INCH
                         )
                         # Position at joist2 center (Y centered on joist)
-                        sister.Placement.Base = App.Vector(
-                            lc.inch(x_min),
-                            lc.inch(joist2_y - joist_thick / 2.0),
-                            lc.inch(sister_joist_z),
+                        sister.Placement = App.Placement(
+                            vec(
+                                x_min * INCH,
+                                (joist2_y - joist_thick / 2.0) * INCH,
+                                sister_joist_z * INCH,
+                            ),
+                            App.Rotation(),
                         )
                         lc.attach_metadata(sister, joist_row, try_label, supplier=supplier)
                         blocking.append(sister)
@@ -1995,11 +2118,12 @@ def _create_zone_field_boards(
                             )
 
                         board = doc.addObject("Part::Feature", seg_name)
-                        board.Shape = Part.makeBox(
-                            lc.inch(actual_width), lc.inch(seg_length), lc.inch(deck_thick)
+                        board.Shape = make_box(
+                            actual_width * INCH, seg_length * INCH, deck_thick * INCH
                         )
-                        board.Placement.Base = App.Vector(
-                            lc.inch(actual_x_pos), lc.inch(y_min + seg_start), lc.inch(board_z)
+                        board.Placement = App.Placement(
+                            vec(actual_x_pos * INCH, (y_min + seg_start) * INCH, board_z * INCH),
+                            App.Rotation(),
                         )
                         lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                         field_boards.append(board)
@@ -2040,11 +2164,12 @@ def _create_zone_field_boards(
                             )
 
                         board = doc.addObject("Part::Feature", seg_name)
-                        board.Shape = Part.makeBox(
-                            lc.inch(actual_width), lc.inch(seg_length), lc.inch(deck_thick)
+                        board.Shape = make_box(
+                            actual_width * INCH, seg_length * INCH, deck_thick * INCH
                         )
-                        board.Placement.Base = App.Vector(
-                            lc.inch(x_pos), lc.inch(y_min + seg_start), lc.inch(board_z)
+                        board.Placement = App.Placement(
+                            vec(x_pos * INCH, (y_min + seg_start) * INCH, board_z * INCH),
+                            App.Rotation(),
                         )
                         lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                         field_boards.append(board)
@@ -2081,6 +2206,7 @@ def create_deck_surface(
     miter_corners=False,
     post_positions=None,
     include_blocking=False,
+    recompute=True,
 ):
     """
     Create a deck surface assembly of any size with configurable board direction.
@@ -2134,10 +2260,13 @@ def create_deck_surface(
         miter_corners: If True, edge boards get 45-degree mitered corners
         post_positions: List of (x, y) tuples for railing post locations to cut around
         include_blocking: If True, add blocking under seam boards and edges (future)
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing deck boards and edge boards
     """
+    INCH = lc.inch(1.0)  # mm per inch
     # Convert to inches
     width_in = width_ft * 12.0
     depth_in = depth_ft * 12.0
@@ -2215,13 +2344,13 @@ def create_deck_surface(
             seam_length = width_in  # Full deck width
             for seam_y in seams:
                 seam_board = doc.addObject("Part::Feature", f"Seam_{len(seam_boards)+1}")
-                seam_board.Shape = Part.makeBox(
-                    lc.inch(seam_length), lc.inch(deck_width), lc.inch(deck_thick)
+                seam_board.Shape = lc.cached_box(
+                    seam_length * INCH, deck_width * INCH, deck_thick * INCH
                 )
-                seam_board.Placement.Base = App.Vector(
-                    0, lc.inch(seam_y - deck_width / 2.0), lc.inch(board_z)
+                seam_board.Placement = App.Placement(
+                    App.Vector(0, (seam_y - deck_width / 2.0) * INCH, board_z * INCH),
+                    App.Rotation(),
                 )
-                lc.attach_metadata(seam_board, deck_row, deck_label, supplier=supplier)
                 seam_boards.append(seam_board)
         else:
             # No seams - single zone spanning full depth (with overhangs)
@@ -2229,15 +2358,17 @@ def create_deck_surface(
 
         # Layout boards in each Y zone
         board_count = 0
+        step = deck_width + deck_gap
         for zone_y_start, zone_y_end in y_zones:
-            step = deck_width + deck_gap
-            y_pos = zone_y_start
+            # Board starts in closed form (zone_y_start + k * step); the last one
+            # in the zone is ripped to what is left, and slivers under 1/4" dropped
+            n_rows = max(math.ceil((zone_y_end - 0.1 - zone_y_start) / step), 0)
+            ys = [zone_y_start + k * step for k in range(n_rows)]
+            zone_boards = [(y, min(deck_width, zone_y_end - y)) for y in ys if y < zone_y_end - 0.1]
 
-            while y_pos < zone_y_end - 0.1:
-                board_length = min(deck_width, zone_y_end - y_pos)
+            for y_pos, board_length in zone_boards:
                 if board_length < 0.25:
-                    break
-
+                    continue
                 board_count += 1
                 if board_length < deck_width - 0.1:
                     # Ripped board at zone end
@@ -2245,15 +2376,13 @@ def create_deck_surface(
                 else:
                     board = doc.addObject("Part::Feature", f"Deck_{board_count}")
 
-                board.Shape = Part.makeBox(
-                    lc.inch(usable_width), lc.inch(board_length), lc.inch(deck_thick)
+                board.Shape = lc.cached_box(
+                    usable_width * INCH, board_length * INCH, deck_thick * INCH
                 )
-                board.Placement.Base = App.Vector(
-                    lc.inch(board_x_start), lc.inch(y_pos), lc.inch(board_z)
+                board.Placement = App.Placement(
+                    App.Vector(board_x_start * INCH, y_pos * INCH, board_z * INCH), App.Rotation()
                 )
-                lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                 boards.append(board)
-                y_pos += step
 
         # Edge boards for EW direction run N-S (along Y)
         edge_length = depth_in + 2 * DECK_OVERHANG_IN  # Extends overhang each direction
@@ -2283,11 +2412,11 @@ def create_deck_surface(
                 )
             else:
                 left_edge = doc.addObject("Part::Feature", "Edge_Left")
-                left_edge.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(edge_length), lc.inch(deck_thick)
+                left_edge.Shape = lc.cached_box(
+                    deck_width * INCH, edge_length * INCH, deck_thick * INCH
                 )
-                left_edge.Placement.Base = App.Vector(
-                    0, lc.inch(-DECK_OVERHANG_IN), lc.inch(board_z)
+                left_edge.Placement = App.Placement(
+                    App.Vector(0, -DECK_OVERHANG_IN * INCH, board_z * INCH), App.Rotation()
                 )
                 lc.attach_metadata(left_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(left_edge)
@@ -2317,11 +2446,14 @@ def create_deck_surface(
                 )
             else:
                 right_edge = doc.addObject("Part::Feature", "Edge_Right")
-                right_edge.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(edge_length), lc.inch(deck_thick)
+                right_edge.Shape = lc.cached_box(
+                    deck_width * INCH, edge_length * INCH, deck_thick * INCH
                 )
-                right_edge.Placement.Base = App.Vector(
-                    lc.inch(width_in - deck_width), lc.inch(-DECK_OVERHANG_IN), lc.inch(board_z)
+                right_edge.Placement = App.Placement(
+                    App.Vector(
+                        (width_in - deck_width) * INCH, -DECK_OVERHANG_IN * INCH, board_z * INCH
+                    ),
+                    App.Rotation(),
                 )
                 lc.attach_metadata(right_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(right_edge)
@@ -2355,38 +2487,32 @@ def create_deck_surface(
             else:
                 # No edge board: first full board overhangs
                 x_pos = width_in + DECK_OVERHANG_IN - deck_width
-            last_full_start = None
-
-            while True:
-                if x_pos < 0:
-                    # Rip last board to remaining space on left side (NO overhang on house side)
-                    rip_end = (
-                        last_full_start if last_full_start is not None else x_pos + deck_width
-                    ) - deck_gap
-                    remaining = rip_end  # From x=0 to last full board
-                    if remaining > 0.25:
-                        board_count += 1
-                        rip = doc.addObject("Part::Feature", f"Deck_{board_count}_RIP")
-                        rip.Shape = Part.makeBox(
-                            lc.inch(remaining), lc.inch(board_length), lc.inch(deck_thick)
-                        )
-                        rip.Placement.Base = App.Vector(0, lc.inch(board_y_start), lc.inch(board_z))
-                        lc.attach_metadata(rip, deck_row, deck_label, supplier=supplier)
-                        boards.append(rip)
-                    break
 
+            # Full boards step left (x_pos - k * step) while they start at or
+            # right of x=0
+            n_full = max(math.floor(x_pos / step) + 1, 0)
+            xs = [x for x in (x_pos - k * step for k in range(n_full)) if x >= 0]
+            for x in xs:
                 board_count += 1
                 board = doc.addObject("Part::Feature", f"Deck_{board_count}")
-                board.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(board_length), lc.inch(deck_thick)
+                board.Shape = lc.cached_box(
+                    deck_width * INCH, board_length * INCH, deck_thick * INCH
                 )
-                board.Placement.Base = App.Vector(
-                    lc.inch(x_pos), lc.inch(board_y_start), lc.inch(board_z)
+                board.Placement = App.Placement(
+                    App.Vector(x * INCH, board_y_start * INCH, board_z * INCH), App.Rotation()
                 )
-                lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                 boards.append(board)
-                last_full_start = x_pos
-                x_pos -= step
+
+            # Rip last board to remaining space on left side (NO overhang on house side)
+            remaining = (xs[-1] if xs else x_pos + deck_width) - deck_gap  # From x=0
+            if remaining > 0.25:
+                board_count += 1
+                rip = doc.addObject("Part::Feature", f"Deck_{board_count}_RIP")
+                rip.Shape = lc.cached_box(remaining * INCH, board_length * INCH, deck_thick * INCH)
+                rip.Placement = App.Placement(
+                    App.Vector(0, board_y_start * INCH, board_z * INCH), App.Rotation()
+                )
+                boards.append(rip)
         else:
             # Default: left_to_right - Start from LEFT (outer) edge, work toward RIGHT (house)
             # Rip cut ends up on RIGHT side (toward house, less visible)
@@ -2399,41 +2525,35 @@ def create_deck_surface(
             else:
                 # No edge board: first full board overhangs
                 x_pos = -DECK_OVERHANG_IN
-            last_full_end = None
-
-            while True:
-                next_x = x_pos + deck_width
-                if next_x > width_in:
-                    # Rip last board to remaining space on right side (NO overhang on house side)
-                    rip_start = (last_full_end if last_full_end is not None else x_pos) + deck_gap
-                    remaining = (
-                        width_in - rip_start
-                    )  # From last full board to width_in (no overhang)
-                    if remaining > 0.25:
-                        board_count += 1
-                        rip = doc.addObject("Part::Feature", f"Deck_{board_count}_RIP")
-                        rip.Shape = Part.makeBox(
-                            lc.inch(remaining), lc.inch(board_length), lc.inch(deck_thick)
-                        )
-                        rip.Placement.Base = App.Vector(
-                            lc.inch(rip_start), lc.inch(board_y_start), lc.inch(board_z)
-                        )
-                        lc.attach_metadata(rip, deck_row, deck_label, supplier=supplier)
-                        boards.append(rip)
-                    break
 
+            # Full boards step right (x_pos + k * step) while they end within width_in
+            n_full = max(math.floor((width_in - deck_width - x_pos) / step) + 1, 0)
+            xs = [
+                x for x in (x_pos + k * step for k in range(n_full)) if x + deck_width <= width_in
+            ]
+            for x in xs:
                 board_count += 1
                 board = doc.addObject("Part::Feature", f"Deck_{board_count}")
-                board.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(board_length), lc.inch(deck_thick)
+                board.Shape = lc.cached_box(
+                    deck_width * INCH, board_length * INCH, deck_thick * INCH
                 )
-                board.Placement.Base = App.Vector(
-                    lc.inch(x_pos), lc.inch(board_y_start), lc.inch(board_z)
+                board.Placement = App.Placement(
+                    App.Vector(x * INCH, board_y_start * INCH, board_z * INCH), App.Rotation()
                 )
-                lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
                 boards.append(board)
-                last_full_end = next_x
-                x_pos += step
+
+            # Rip last board to remaining space on right side (NO overhang on house side)
+            rip_start = (xs[-1] + deck_width if xs else x_pos) + deck_gap
+            remaining = width_in - rip_start  # From last full board to width_in (no overhang)
+            if remaining > 0.25:
+                board_count += 1
+                rip = doc.addObject("Part::Feature", f"Deck_{board_count}_RIP")
+                rip.Shape = lc.cached_box(remaining * INCH, board_length * INCH, deck_thick * INCH)
+                rip.Placement = App.Placement(
+                    App.Vector(rip_start * INCH, board_y_start * INCH, board_z * INCH),
+                    App.Rotation(),
+                )
+                boards.append(rip)
 
         # Edge boards for NS direction
         # Front/back edges run E-W (along X), left/right edges run N-S (along Y)
@@ -2464,11 +2584,11 @@ def create_deck_surface(
                 )
             else:
                 front_edge = doc.addObject("Part::Feature", "Edge_Front")
-                front_edge.Shape = Part.makeBox(
-                    lc.inch(edge_length_x), lc.inch(deck_width), lc.inch(deck_thick)
+                front_edge.Shape = lc.cached_box(
+                    edge_length_x * INCH, deck_width * INCH, deck_thick * INCH
                 )
-                front_edge.Placement.Base = App.Vector(
-                    lc.inch(-DECK_OVERHANG_IN), 0, lc.inch(board_z)
+                front_edge.Placement = App.Placement(
+                    App.Vector(-DECK_OVERHANG_IN * INCH, 0, board_z * INCH), App.Rotation()
                 )
                 lc.attach_metadata(front_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(front_edge)
@@ -2499,11 +2619,14 @@ def create_deck_surface(
                 )
             else:
                 back_edge = doc.addObject("Part::Feature", "Edge_Back")
-                back_edge.Shape = Part.makeBox(
-                    lc.inch(edge_length_x), lc.inch(deck_width), lc.inch(deck_thick)
+                back_edge.Shape = lc.cached_box(
+                    edge_length_x * INCH, deck_width * INCH, deck_thick * INCH
                 )
-                back_edge.Placement.Base = App.Vector(
-                    lc.inch(-DECK_OVERHANG_IN), lc.inch(depth_in - deck_width), lc.inch(board_z)
+                back_edge.Placement = App.Placement(
+                    App.Vector(
+                        -DECK_OVERHANG_IN * INCH, (depth_in - deck_width) * INCH, board_z * INCH
+                    ),
+                    App.Rotation(),
                 )
                 lc.attach_metadata(back_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(back_edge)
@@ -2534,11 +2657,12 @@ def create_deck_surface(
                 )
             else:
                 left_edge = doc.addObject("Part::Feature", "Edge_Left")
-                left_edge.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(edge_length_y), lc.inch(deck_thick)
+                left_edge.Shape = lc.cached_box(
+                    deck_width * INCH, edge_length_y * INCH, deck_thick * INCH
                 )
-                left_edge.Placement.Base = App.Vector(
-                    lc.inch(-DECK_OVERHANG_IN), lc.inch(-DECK_OVERHANG_IN), lc.inch(board_z)
+                left_edge.Placement = App.Placement(
+                    App.Vector(-DECK_OVERHANG_IN * INCH, -DECK_OVERHANG_IN * INCH, board_z * INCH),
+                    App.Rotation(),
                 )
                 lc.attach_metadata(left_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(left_edge)
@@ -2569,37 +2693,43 @@ def create_deck_surface(
                 )
             else:
                 right_edge = doc.addObject("Part::Feature", "Edge_Right")
-                right_edge.Shape = Part.makeBox(
-                    lc.inch(deck_width), lc.inch(edge_length_y), lc.inch(deck_thick)
+                right_edge.Shape = lc.cached_box(
+                    deck_width * INCH, edge_length_y * INCH, deck_thick * INCH
                 )
-                right_edge.Placement.Base = App.Vector(
-                    lc.inch(width_in - deck_width), lc.inch(-DECK_OVERHANG_IN), lc.inch(board_z)
+                right_edge.Placement = App.Placement(
+                    App.Vector(
+                        (width_in - deck_width) * INCH, -DECK_OVERHANG_IN * INCH, board_z * INCH
+                    ),
+                    App.Rotation(),
                 )
-            lc.attach_metadata(right_edge, deck_row, deck_label, supplier=supplier)
+                lc.attach_metadata(right_edge, deck_row, deck_label, supplier=supplier)
             edge_boards.append(right_edge)
 
+    # Field, rip and seam boards all come from one stock row; tag them in one pass
+    lc.attach_metadata_bulk(boards + seam_boards, deck_row, deck_label, supplier=supplier)
     created.extend(boards)
     created.extend(edge_boards)
     created.extend(seam_boards)
 
     # Create assembly
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
+    _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
     assembly = doc.addObject("App::Part", assembly_name)
     assembly.Label = assembly_name
 
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+    assembly.Placement = App.Placement(
+        App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+    )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
     direction_str = "E-W" if board_direction.upper() == "EW" else "N-S"
     seam_str = f", {len(seam_boards)} seam boards" if seam_boards else ""
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({width_ft:.0f}' x {depth_ft:.0f}', {len(boards)} boards {direction_str}, "
         f"{len(edge_boards)} edge boards{seam_str})\n"
@@ -2618,6 +2748,7 @@ def create_deck_surface_16x8(
     supplier="lowes",
     include_left_edge=True,
     include_right_edge=True,
+    recompute=True,
 ):
     """
     Create a 16' x 8' deck surface assembly (boards and posts only).
@@ -2635,10 +2766,15 @@ def create_deck_surface_16x8(
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing deck boards and posts
     """
+    INCH = lc.inch(1.0)  # mm per inch
+    overhang = DECK_OVERHANG_IN
+
     # Parameters
     length_x_in = 192.0  # 16'
     proj_y_in = 96.0  # 8'
@@ -2658,7 +2794,6 @@ def create_deck_surface_16x8(
     # Dimensions
     deck_thick = float(deck_row["actual_thickness_in"])
     deck_width = float(deck_row["actual_width_in"])
-    _deck_len = float(deck_row["length_in"])  # noqa: F841 - kept for reference
     deck_gap = DECK_BOARD_GAP_IN
     post_thick = float(post_row["actual_thickness_in"])
     post_width = float(post_row["actual_width_in"])
@@ -2674,114 +2809,80 @@ def create_deck_surface_16x8(
     if include_right_edge:
         board_length -= deck_width
 
-    def make_deck_board(name, y_local):
-        box = Part.makeBox(lc.inch(board_length), lc.inch(deck_width), lc.inch(deck_thick))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(
-            lc.inch(board_x_start), lc.inch(y_local), lc.inch(joist_depth)
+    def make_deck_board(name, y_local, width=deck_width):
+        obj = _make_board(
+            doc,
+            name,
+            (board_length, width, deck_thick),
+            (board_x_start, y_local, joist_depth),
         )
-        lc.attach_metadata(obj, deck_row, deck_label, supplier=supplier)
         return obj
 
     def make_post(name, x_local, y_local, z_local):
-        box = Part.makeBox(lc.inch(post_width), lc.inch(post_thick), lc.inch(post_height_in))
+        box = lc.cached_box(post_width * INCH, post_thick * INCH, post_height_in * INCH)
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), lc.inch(y_local), lc.inch(z_local))
-        lc.attach_metadata(obj, post_row, post_label, supplier=supplier)
-        try:
-            if "cut_length_in" not in obj.PropertiesList:
-                obj.addProperty("App::PropertyString", "cut_length_in")
-            obj.cut_length_in = f"{post_height_in}"
-        except Exception:
-            pass
+        obj.Placement = App.Placement(
+            App.Vector(x_local * INCH, y_local * INCH, z_local * INCH), App.Rotation()
+        )
+        lc.attach_metadata_bulk(
+            [obj], post_row, post_label, supplier=supplier, cut_length_in=post_height_in
+        )
         return obj
 
-    # Deck boards running along X, 1/8" gaps
-    boards = []
-    board_count = 0
-    step = deck_width + deck_gap
-    y_pos = -DECK_OVERHANG_IN  # shift first board toward house by overhang
-    last_full_end = None
-
-    while True:
-        next_y = y_pos + deck_width
-        if next_y > proj_y_in:
-            # Rip last board to remaining space
-            rip_start = (last_full_end if last_full_end is not None else y_pos) + deck_gap
-            remaining = proj_y_in - rip_start + DECK_OVERHANG_IN  # widen rip by overhang
-            if remaining > 0.25:
-                board_count += 1
-                rip = make_deck_board(f"Deck_{board_count}_RIP", rip_start)
-                rip.Shape = Part.makeBox(
-                    lc.inch(board_length), lc.inch(remaining), lc.inch(deck_thick)
-                )
-                rip.Placement.Base.x = lc.inch(board_x_start)
-                rip.Placement.Base.y = lc.inch(rip_start)
-                rip.Placement.Base.z = lc.inch(joist_depth)
-                boards.append(rip)
-            break
-        board_count += 1
-        boards.append(make_deck_board(f"Deck_{board_count}", y_pos))
-        last_full_end = next_y
-        y_pos += step
+    # No recomputes while the parts are added; the one below does a single graph pass
+    with lc.recomputes_frozen(doc):
+        with lc.doc_transaction(doc, "Create deck boards"):
+            # Deck boards running along X, 1/8" gaps (last row ripped to fit)
+            layout = _layout_deck_boards(proj_y_in, deck_width, deck_gap, overhang)
+            boards = [make_deck_board(name, y_pos, width=width) for name, y_pos, width in layout]
 
-    created.extend(boards)
+            created.extend(boards)
 
-    # Edge boards (picture frame): perpendicular boards at left and right edges
-    # These run along Y direction to square out the deck
-    # Only include edge boards on the outermost edges of the full deck assembly
-    edge_boards = []
+            # Edge boards (picture frame): perpendicular boards at left and right edges
+            # These run along Y direction to square out the deck
+            # Only include edge boards on the outermost edges of the full deck assembly
+            # 5.5" wide, extends overhang each direction
+            edge_dims = (deck_width, proj_y_in + 2 * overhang, deck_thick)
 
-    if include_left_edge:
-        # Left edge board (at X=0, runs from Y=-overhang to Y=proj_y_in+overhang)
-        left_edge = doc.addObject("Part::Feature", "Edge_Left")
-        left_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),  # 5.5" wide
-            lc.inch(proj_y_in + 2 * DECK_OVERHANG_IN),  # Extends overhang each direction
-            lc.inch(deck_thick),
-        )
-        left_edge.Placement.Base = App.Vector(0, lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth))
-        lc.attach_metadata(left_edge, deck_row, deck_label, supplier=supplier)
-        edge_boards.append(left_edge)
+            # Left edge at X=0, right edge at X=length_x_in - deck_width; both run Y=-overhang
+            # to Y=proj_y_in+overhang
+            edge_boards = _make_side_edge_boards(
+                doc,
+                edge_dims,
+                length_x_in,
+                -overhang,
+                joist_depth,
+                include_left_edge,
+                include_right_edge,
+            )
 
-    if include_right_edge:
-        # Right edge board (at X=length_x_in - deck_width, runs from Y=-overhang to Y=proj_y_in+overhang)
-        right_edge = doc.addObject("Part::Feature", "Edge_Right")
-        right_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),  # 5.5" wide
-            lc.inch(proj_y_in + 2 * DECK_OVERHANG_IN),  # Extends overhang each direction
-            lc.inch(deck_thick),
-        )
-        right_edge.Placement.Base = App.Vector(
-            lc.inch(length_x_in - deck_width), lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth)
-        )
-        lc.attach_metadata(right_edge, deck_row, deck_label, supplier=supplier)
-        edge_boards.append(right_edge)
+            created.extend(edge_boards)
 
-    created.extend(edge_boards)
+            # Deck and edge boards are all cut from the same stock
+            lc.attach_metadata_bulk(created, deck_row, deck_label, supplier=supplier)
 
-    # Posts removed - will be added later as a separate assembly
+        # Posts removed - will be added later as a separate assembly
 
-    # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
-    assembly = doc.addObject("App::Part", assembly_name)
-    assembly.Label = assembly_name
+        # Create assembly (App::Part)
+        _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
+        assembly = doc.addObject("App::Part", assembly_name)
+        assembly.Label = assembly_name
 
-    # Add all parts to assembly
-    App.Console.PrintMessage(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+        # Add all parts to assembly
+        _log(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
+        assembly.addObjects(created)
 
-    # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+        # Apply global position offset
+        assembly.Placement = App.Placement(
+            App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+        )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({len(boards)} deck boards, {len(edge_boards)} edge boards)\n"
     )
@@ -2804,6 +2905,7 @@ def create_deck_surface_filler(
     include_left_edge=False,
     include_right_edge=True,
     miter_corners=False,
+    recompute=True,
 ):
     """
     Create a narrow deck surface filler module.
@@ -2825,10 +2927,15 @@ def create_deck_surface_filler(
         include_left_edge: Include edge board on left side
         include_right_edge: Include edge board on right side
         miter_corners: If True, edge boards get 45-degree mitered corners
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing deck boards and optional edge boards
     """
+    INCH = lc.inch(1.0)  # mm per inch
+    overhang = DECK_OVERHANG_IN
+
     # Parameters
     length_x_in = width_in
     proj_y_in = depth_ft * 12.0
@@ -2856,99 +2963,67 @@ def create_deck_surface_filler(
     if include_right_edge:
         board_length -= deck_width
 
-    # If filler is narrower than board width, just use edge board(s)
-    if board_length <= 0:
-        App.Console.PrintMessage(
-            f'[deck_assemblies] Filler {assembly_name} is narrow ({width_in:.1f}"), using edge boards only\n'
-        )
-    else:
-
-        def make_deck_board(name, y_local):
-            box = Part.makeBox(lc.inch(board_length), lc.inch(deck_width), lc.inch(deck_thick))
-            obj = doc.addObject("Part::Feature", name)
-            obj.Shape = box
-            obj.Placement.Base = App.Vector(
-                lc.inch(board_x_start), lc.inch(y_local), lc.inch(joist_depth)
-            )
-            lc.attach_metadata(obj, deck_row, deck_label, supplier=supplier)
-            return obj
+    # No recomputes while the parts are added; the one below does a single graph pass
+    with lc.recomputes_frozen(doc):
+        with lc.doc_transaction(doc, "Create deck boards"):
+            # If filler is narrower than board width, just use edge board(s)
+            if board_length <= 0:
+                _log(
+                    f'[deck_assemblies] Filler {assembly_name} is narrow ({width_in:.1f}"), using edge boards only\n'
+                )
+            else:
 
-        # Deck boards running along X, 1/8" gaps
-        boards = []
-        board_count = 0
-        step = deck_width + deck_gap
-        y_pos = -DECK_OVERHANG_IN  # shift first board toward house by overhang
-        last_full_end = None
-
-        while True:
-            next_y = y_pos + deck_width
-            if next_y > proj_y_in:
-                # Rip last board to remaining space
-                rip_start = (last_full_end if last_full_end is not None else y_pos) + deck_gap
-                remaining = proj_y_in - rip_start + DECK_OVERHANG_IN  # widen rip by overhang
-                if remaining > 0.25:
-                    board_count += 1
-                    rip = make_deck_board(f"Deck_{board_count}_RIP", rip_start)
-                    rip.Shape = Part.makeBox(
-                        lc.inch(board_length), lc.inch(remaining), lc.inch(deck_thick)
+                def make_deck_board(name, y_local, width=deck_width):
+                    obj = _make_board(
+                        doc,
+                        name,
+                        (board_length, width, deck_thick),
+                        (board_x_start, y_local, joist_depth),
                     )
-                    rip.Placement.Base.x = lc.inch(board_x_start)
-                    rip.Placement.Base.y = lc.inch(rip_start)
-                    rip.Placement.Base.z = lc.inch(joist_depth)
-                    boards.append(rip)
-                break
-            board_count += 1
-            boards.append(make_deck_board(f"Deck_{board_count}", y_pos))
-            last_full_end = next_y
-            y_pos += step
+                    return obj
 
-        created.extend(boards)
+                # Deck boards running along X, 1/8" gaps (last row ripped to fit)
+                layout = _layout_deck_boards(proj_y_in, deck_width, deck_gap, overhang)
+                boards = [
+                    make_deck_board(name, y_pos, width=width) for name, y_pos, width in layout
+                ]
 
-    # Edge boards (picture frame): perpendicular boards at left and right edges
-    edge_boards = []
+                created.extend(boards)
 
-    if include_left_edge:
-        left_edge = doc.addObject("Part::Feature", "Edge_Left")
-        left_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),
-            lc.inch(proj_y_in + 2 * DECK_OVERHANG_IN),
-            lc.inch(deck_thick),
-        )
-        left_edge.Placement.Base = App.Vector(0, lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth))
-        lc.attach_metadata(left_edge, deck_row, deck_label, supplier=supplier)
-        edge_boards.append(left_edge)
+            # Edge boards (picture frame): perpendicular boards at left and right edges
+            edge_dims = (deck_width, proj_y_in + 2 * overhang, deck_thick)
+            edge_boards = _make_side_edge_boards(
+                doc,
+                edge_dims,
+                length_x_in,
+                -overhang,
+                joist_depth,
+                include_left_edge,
+                include_right_edge,
+            )
 
-    if include_right_edge:
-        right_edge = doc.addObject("Part::Feature", "Edge_Right")
-        right_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),
-            lc.inch(proj_y_in + 2 * DECK_OVERHANG_IN),
-            lc.inch(deck_thick),
-        )
-        right_edge.Placement.Base = App.Vector(
-            lc.inch(length_x_in - deck_width), lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth)
-        )
-        lc.attach_metadata(right_edge, deck_row, deck_label, supplier=supplier)
-        edge_boards.append(right_edge)
+            created.extend(edge_boards)
 
-    created.extend(edge_boards)
+            # Deck and edge boards are all cut from the same stock
+            lc.attach_metadata_bulk(created, deck_row, deck_label, supplier=supplier)
 
-    # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
-    assembly = doc.addObject("App::Part", assembly_name)
-    assembly.Label = assembly_name
+        # Create assembly (App::Part)
+        _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
+        assembly = doc.addObject("App::Part", assembly_name)
+        assembly.Label = assembly_name
 
-    for obj in created:
-        assembly.addObject(obj)
+        assembly.addObjects(created)
 
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+        assembly.Placement = App.Placement(
+            App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+        )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    num_boards = len([o for o in created if o not in edge_boards])
-    App.Console.PrintMessage(
+    num_boards = len(created) - len(edge_boards)
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({num_boards} deck boards, {len(edge_boards)} edge boards, {width_in:.1f}\" x {depth_ft}' filler)\n"
     )
@@ -2966,6 +3041,7 @@ def create_deck_surface_8ft9in_x_8ft(
     supplier="lowes",
     include_left_edge=False,
     include_right_edge=False,
+    recompute=True,
 ):
     """
     Create an 8'9" x 8' deck surface assembly (boards only, no posts).
@@ -2983,10 +3059,14 @@ def create_deck_surface_8ft9in_x_8ft(
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing deck boards and posts
     """
+    INCH = lc.inch(1.0)  # mm per inch
+
     # Parameters
     length_x_in = 105.0  # 8'9" wide
     proj_y_in = 96.0  # 8' deep
@@ -3025,135 +3105,92 @@ def create_deck_surface_8ft9in_x_8ft(
     if include_right_edge:
         board_length -= deck_width
 
-    def make_deck_board_main(name, y_local):
+    def make_deck_board_main(name, y_local, width=deck_width):
         """Main deck boards running along X (trimmed to fit between edge boards)"""
-        box = Part.makeBox(lc.inch(board_length), lc.inch(deck_width), lc.inch(deck_thick))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(
-            lc.inch(board_x_start), lc.inch(y_local), lc.inch(joist_depth)
+        obj = _make_board(
+            doc,
+            name,
+            (board_length, width, deck_thick),
+            (board_x_start, y_local, joist_depth),
         )
-        lc.attach_metadata(obj, deck_row_main, deck_label_main, supplier=supplier)
-        try:
-            if "cut_length_in" not in obj.PropertiesList:
-                obj.addProperty("App::PropertyString", "cut_length_in")
-            obj.cut_length_in = f"{board_length}"
-        except Exception:
-            pass
         return obj
 
     def make_post(name, x_local, y_local, z_local):
-        box = Part.makeBox(lc.inch(post_width), lc.inch(post_thick), lc.inch(post_height_in))
+        box = lc.cached_box(post_width * INCH, post_thick * INCH, post_height_in * INCH)
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), lc.inch(y_local), lc.inch(z_local))
-        lc.attach_metadata(obj, post_row, post_label, supplier=supplier)
-        try:
-            if "cut_length_in" not in obj.PropertiesList:
-                obj.addProperty("App::PropertyString", "cut_length_in")
-            obj.cut_length_in = f"{post_height_in}"
-        except Exception:
-            pass
+        obj.Placement = App.Placement(
+            App.Vector(x_local * INCH, y_local * INCH, z_local * INCH), App.Rotation()
+        )
+        lc.attach_metadata_bulk(
+            [obj], post_row, post_label, supplier=supplier, cut_length_in=post_height_in
+        )
         return obj
 
-    # Deck boards running along X, 1/8" gaps
-    boards = []
-    board_count = 0
-    step = deck_width + deck_gap
-    y_pos = -DECK_OVERHANG_IN  # shift first board toward house by overhang
-    last_full_end = None
-
-    while True:
-        next_y = y_pos + deck_width
-        if next_y > proj_y_in:
-            # Rip last board to remaining space
-            rip_start = (last_full_end if last_full_end is not None else y_pos) + deck_gap
-            remaining = proj_y_in - rip_start + DECK_OVERHANG_IN  # widen rip by overhang
-            if remaining > 0.25:
-                board_count += 1
-                rip = make_deck_board_main(f"Deck_{board_count}_RIP", rip_start)
-                rip.Shape = Part.makeBox(
-                    lc.inch(board_length), lc.inch(remaining), lc.inch(deck_thick)
-                )
-                rip.Placement.Base.x = lc.inch(board_x_start)
-                rip.Placement.Base.y = lc.inch(rip_start)
-                rip.Placement.Base.z = lc.inch(joist_depth)
-                boards.append(rip)
-            break
-        board_count += 1
-        boards.append(make_deck_board_main(f"Deck_{board_count}", y_pos))
-        last_full_end = next_y
-        y_pos += step
-
-    created.extend(boards)
-
-    # Edge boards (picture frame): perpendicular boards at left and right edges
-    # These run along Y direction to square out the deck
-    # Only include edge boards on the outermost edges of the full deck assembly
-    edge_boards = []
+    # No recomputes while the parts are added; the one below does a single graph pass
+    with lc.recomputes_frozen(doc):
+        with lc.doc_transaction(doc, "Create deck boards"):
+            # Deck boards running along X, 1/8" gaps
+            layout = _layout_deck_boards(proj_y_in, deck_width, deck_gap)
+            boards = [
+                make_deck_board_main(name, y_pos, width=width) for name, y_pos, width in layout
+            ]
 
-    if include_left_edge:
-        # Left edge board (at X=0, runs from Y=-overhang to Y=proj_y_in+overhang)
-        edge_length = proj_y_in + 2 * DECK_OVERHANG_IN
-        left_edge = doc.addObject("Part::Feature", "Edge_Left")
-        left_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),  # 5.5" wide
-            lc.inch(edge_length),  # Extends overhang each direction
-            lc.inch(deck_thick),
-        )
-        left_edge.Placement.Base = App.Vector(0, lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth))
-        lc.attach_metadata(left_edge, deck_row_edge, deck_label_edge, supplier=supplier)
-        try:
-            if "cut_length_in" not in left_edge.PropertiesList:
-                left_edge.addProperty("App::PropertyString", "cut_length_in")
-            left_edge.cut_length_in = f"{edge_length}"
-        except Exception:
-            pass
-        edge_boards.append(left_edge)
+            created.extend(boards)
+            lc.attach_metadata_bulk(
+                boards,
+                deck_row_main,
+                deck_label_main,
+                supplier=supplier,
+                cut_length_in=board_length,
+            )
 
-    if include_right_edge:
-        # Right edge board (at X=length_x_in - deck_width, runs from Y=-overhang to Y=proj_y_in+overhang)
-        edge_length = proj_y_in + 2 * DECK_OVERHANG_IN
-        right_edge = doc.addObject("Part::Feature", "Edge_Right")
-        right_edge.Shape = Part.makeBox(
-            lc.inch(deck_width),  # 5.5" wide
-            lc.inch(edge_length),  # Extends overhang each direction
-            lc.inch(deck_thick),
-        )
-        right_edge.Placement.Base = App.Vector(
-            lc.inch(length_x_in - deck_width), lc.inch(-DECK_OVERHANG_IN), lc.inch(joist_depth)
-        )
-        lc.attach_metadata(right_edge, deck_row_edge, deck_label_edge, supplier=supplier)
-        try:
-            if "cut_length_in" not in right_edge.PropertiesList:
-                right_edge.addProperty("App::PropertyString", "cut_length_in")
-            right_edge.cut_length_in = f"{edge_length}"
-        except Exception:
-            pass
-        edge_boards.append(right_edge)
+            # Edge boards (picture frame): perpendicular boards at left and right edges
+            # These run along Y direction to square out the deck
+            # Only include edge boards on the outermost edges of the full deck assembly
+            # 5.5" wide, extends overhang each direction
+            edge_length = proj_y_in + 2 * DECK_OVERHANG_IN
+            edge_dims = (deck_width, edge_length, deck_thick)
+            edge_boards = _make_side_edge_boards(
+                doc,
+                edge_dims,
+                length_x_in,
+                -DECK_OVERHANG_IN,
+                joist_depth,
+                include_left_edge,
+                include_right_edge,
+            )
 
-    created.extend(edge_boards)
+            created.extend(edge_boards)
+            lc.attach_metadata_bulk(
+                edge_boards,
+                deck_row_edge,
+                deck_label_edge,
+                supplier=supplier,
+                cut_length_in=edge_length,
+            )
 
-    # Posts removed - will be added later as a separate assembly
+        # Posts removed - will be added later as a separate assembly
 
-    # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
-    assembly = doc.addObject("App::Part", assembly_name)
-    assembly.Label = assembly_name
+        # Create assembly (App::Part)
+        _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
+        assembly = doc.addObject("App::Part", assembly_name)
+        assembly.Label = assembly_name
 
-    # Add all parts to assembly
-    App.Console.PrintMessage(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+        # Add all parts to assembly
+        _log(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
+        assembly.addObjects(created)
 
-    # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+        # Apply global position offset
+        assembly.Placement = App.Placement(
+            App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+        )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({len(boards)} deck boards, {len(edge_boards)} edge boards)\n"
     )
@@ -3169,6 +3206,7 @@ def create_deck_16x8(
     y_base=0.0,
     z_base=0.0,
     supplier="lowes",
+    recompute=True,
 ):
     """
     Create a 16' x 8' deck module as an App::Part assembly.
@@ -3187,10 +3225,14 @@ def create_deck_16x8(
         assembly_name: Name for the assembly
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference ("lowes" or "hd")
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing all deck components
     """
+    INCH = lc.inch(1.0)  # mm per inch
+
     # Parameters
     length_x_in = 192.0  # 16'
     proj_y_in = 96.0  # 8'
@@ -3218,162 +3260,105 @@ def create_deck_16x8(
     rim_len = float(rim_row["length_in"])  # 192"
     joist_thick = float(joist_row["actual_thickness_in"])
     joist_depth = float(joist_row["actual_width_in"])
-    _joist_len = float(joist_row["length_in"])  # 96" - noqa: F841 - kept for reference
     deck_thick = float(deck_row["actual_thickness_in"])  # 1.0"
     deck_width = float(deck_row["actual_width_in"])  # 5.5"
     deck_len = float(deck_row["length_in"])  # 192"
     deck_gap = DECK_BOARD_GAP_IN
     post_thick = float(post_row["actual_thickness_in"])  # 5.5"
     post_width = float(post_row["actual_width_in"])  # 5.5"
-    _post_len = float(post_row["length_in"])  # 144" stock - noqa: F841 - kept for reference
     post_height_in = joist_depth  # flush to deck board underside
 
-    created = []
+    # Plan every box part into one layout list first, then materialize in one pass
+    names = []
+    parts = []
 
-    def make_rim(name, y_local):
-        box = Part.makeBox(lc.inch(rim_len), lc.inch(rim_thick), lc.inch(rim_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(0, lc.inch(y_local), 0)
-        lc.attach_metadata(obj, rim_row, rim_label, supplier=supplier)
-        return obj
-
-    def make_joist(name, x_local):
-        box = Part.makeBox(lc.inch(joist_thick), lc.inch(proj_y_in), lc.inch(joist_depth))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), 0, 0)
-        lc.attach_metadata(obj, joist_row, joist_label, supplier=supplier)
-        return obj
-
-    def make_deck_board(name, y_local):
-        box = Part.makeBox(lc.inch(deck_len), lc.inch(deck_width), lc.inch(deck_thick))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(0, lc.inch(y_local), lc.inch(joist_depth))
-        lc.attach_metadata(obj, deck_row, deck_label, supplier=supplier)
-        return obj
-
-    def make_post(name, x_local, y_local, z_local):
-        box = Part.makeBox(lc.inch(post_width), lc.inch(post_thick), lc.inch(post_height_in))
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = box
-        obj.Placement.Base = App.Vector(lc.inch(x_local), lc.inch(y_local), lc.inch(z_local))
-        lc.attach_metadata(obj, post_row, post_label, supplier=supplier)
-        try:
-            if "cut_length_in" not in obj.PropertiesList:
-                obj.addProperty("App::PropertyString", "cut_length_in")
-            obj.cut_length_in = f"{post_height_in}"
-        except Exception:
-            pass
-        return obj
+    def plan(name, kind, x, y, z, lx, ly, lz):
+        names.append(name)
+        parts.append((x, y, z, lx, ly, lz, kind))
 
     # Rims
     rim_offset = joist_thick
-    created.append(make_rim("Rim_House", -rim_offset))
-    created.append(make_rim("Rim_Outboard", proj_y_in))
+    plan("Rim_House", _KIND_RIM, 0.0, -rim_offset, 0.0, rim_len, rim_thick, rim_depth)
+    plan("Rim_Outboard", _KIND_RIM, 0.0, proj_y_in, 0.0, rim_len, rim_thick, rim_depth)
 
     # Joists @ 16" OC along X
-    centers = []
-    first_center = joist_thick / 2.0
-    last_center = length_x_in - (joist_thick / 2.0)
-    c = first_center
-    while c < last_center - 1e-6:
-        centers.append(c)
-        c += JOIST_SPACING_OC_IN
-    if not centers or centers[-1] < last_center - 1e-6:
-        centers.append(last_center)
+    centers = _joist_centers(length_x_in, joist_thick)
 
     for idx, cx in enumerate(centers, start=1):
         x_pos = cx - (joist_thick / 2.0)
-        created.append(make_joist(f"Joist_{idx}", x_pos))
+        plan(f"Joist_{idx}", _KIND_JOIST, x_pos, 0.0, 0.0, joist_thick, proj_y_in, joist_depth)
 
     # Deck boards running along X, 1/8" gaps
-    boards = []
-    board_count = 0
-    step = deck_width + deck_gap
-    y_pos = -DECK_OVERHANG_IN  # shift first board toward house by overhang
-    last_full_end = None
-
-    while True:
-        next_y = y_pos + deck_width
-        if next_y > proj_y_in:
-            # Rip last board to remaining space
-            rip_start = (last_full_end if last_full_end is not None else y_pos) + deck_gap
-            remaining = proj_y_in - rip_start + DECK_OVERHANG_IN  # widen rip by overhang
-            if remaining > 0.25:
-                board_count += 1
-                rip = make_deck_board(f"Deck_{board_count}_RIP", rip_start)
-                rip.Shape = Part.makeBox(lc.inch(deck_len), lc.inch(remaining), lc.inch(deck_thick))
-                rip.Placement.Base.y = lc.inch(rip_start)
-                rip.Placement.Base.z = lc.inch(joist_depth)
-                boards.append(rip)
-            break
-        board_count += 1
-        boards.append(make_deck_board(f"Deck_{board_count}", y_pos))
-        last_full_end = next_y
-        y_pos += step
-
-    created.extend(boards)
+    for name, y_pos, width in _layout_deck_boards(proj_y_in, deck_width, deck_gap):
+        plan(name, _KIND_DECK, 0.0, y_pos, joist_depth, deck_len, width, deck_thick)
 
     # Posts: four corners + two intermediate along outboard rim
-    posts = []
     z_post_base = 0.0
-    posts.append(make_post("Post_Front_Left", 1.5, -1.5, z_post_base))
-    posts.append(make_post("Post_Front_Right", length_x_in - post_width - 1.5, -1.5, z_post_base))
-    posts.append(make_post("Post_Outboard_Left", 1.5, proj_y_in - post_thick, z_post_base))
-    posts.append(
-        make_post(
-            "Post_Outboard_Right",
-            length_x_in - post_width - 1.5,
-            proj_y_in - post_thick,
-            z_post_base,
-        )
-    )
-
+    post_x_right = length_x_in - post_width - 1.5
+    post_y_outboard = proj_y_in - post_thick
+    post_positions = [
+        ("Post_Front_Left", 1.5, -1.5),
+        ("Post_Front_Right", post_x_right, -1.5),
+        ("Post_Outboard_Left", 1.5, post_y_outboard),
+        ("Post_Outboard_Right", post_x_right, post_y_outboard),
+    ]
     # Two intermediate posts along outboard rim
     mid_positions = [72.75, 120.75]
     for i, x_mid in enumerate(mid_positions, start=1):
-        posts.append(
-            make_post(f"Post_Outboard_Mid_{i}", x_mid, proj_y_in - post_thick, z_post_base)
-        )
+        post_positions.append((f"Post_Outboard_Mid_{i}", x_mid, post_y_outboard))
+    for name, x_pos, y_pos in post_positions:
+        plan(name, _KIND_POST, x_pos, y_pos, z_post_base, post_width, post_thick, post_height_in)
+
+    deck_parts = [p for p in parts if p[6] == _KIND_DECK]
+    post_parts = [p for p in parts if p[6] == _KIND_POST]
+
+    # board index -> posts whose footprint overlaps it in plan (X and Y), so no
+    # hole is built or boolean attempted for a post that misses the board; only
+    # the overlapping pairs reach OCCT.
+    post_hits = {}
+    for bi, (bx0, by0, _bz, blx, bly, _blz, _k) in enumerate(deck_parts):
+        for pi, (px0, py0, _pz, plx, ply, _plz, _k) in enumerate(post_parts):
+            if py0 <= by0 + bly and py0 + ply >= by0 and px0 <= bx0 + blx and px0 + plx >= bx0:
+                post_hits.setdefault(bi, []).append(pi)
+
+    created = _materialize_parts(doc, parts, names)
+
+    def objs_of(kind):
+        return [obj for obj, p in zip(created, parts) if p[6] == kind]
+
+    boards = objs_of(_KIND_DECK)
+    posts = objs_of(_KIND_POST)
+
+    # Cut deck boards for post penetrations (overlaps found on the layout above)
+    def cut_boards_for_posts(boards, deck_parts, post_parts, post_hits):
+        for bi, hits in post_hits.items():
+            board = boards[bi]
+            bz = deck_parts[bi][2]
+            try:
+                holes = []
+                for pi in hits:
+                    px, py, _pz, plx, ply, _plz, _k = post_parts[pi]
+                    # Hole solids only differ by position: one cached box per post footprint
+                    hole = lc.cached_box(plx * INCH, ply * INCH, deck_thick * 2.0 * INCH)
+                    hole.Placement.Base = App.Vector(
+                        px * INCH, py * INCH, (bz - deck_thick * 0.5) * INCH
+                    )
+                    holes.append(hole)
+                # One boolean per board, however many posts pass through it
+                tool = holes[0] if len(holes) == 1 else Part.makeCompound(holes)
+                board.Shape = board.Shape.cut(tool)
+            except Exception as e:
+                App.Console.PrintWarning(
+                    f"[deck_assemblies] Post cut failed on {board.Name}, board left uncut: {e}\n"
+                )
 
-    created.extend(posts)
-
-    # Cut deck boards for post penetrations
-    def cut_board_for_posts(board, posts):
-        try:
-            b = board.Shape
-        except Exception:
-            return board
-        by = board.Placement.Base.y / lc.inch(1)
-        bw = b.BoundBox.YLength / lc.inch(1)
-        bz = board.Placement.Base.z / lc.inch(1)
-        cuts = []
-        for p in posts:
-            px = p.Placement.Base.x / lc.inch(1)
-            py = p.Placement.Base.y / lc.inch(1)
-            _pz = p.Placement.Base.z / lc.inch(1)  # noqa: F841 - kept for reference
-            if py > by + bw or (py + post_thick) < by:
-                continue
-            hole = Part.makeBox(lc.inch(post_width), lc.inch(post_thick), lc.inch(deck_thick * 2.0))
-            hole.Placement.Base = App.Vector(
-                lc.inch(px), lc.inch(py), lc.inch(bz - deck_thick * 0.5)
-            )
-            cuts.append(hole)
-        if not cuts:
-            return board
-        try:
-            new_shape = board.Shape
-            for h in cuts:
-                new_shape = new_shape.cut(h)
-            board.Shape = new_shape
-        except Exception:
-            pass
-        return board
-
-    for b in boards:
-        cut_board_for_posts(b, posts)
+    cut_boards_for_posts(boards, deck_parts, post_parts, post_hits)
+    lc.attach_metadata_bulk(objs_of(_KIND_RIM), rim_row, rim_label, supplier=supplier)
+    lc.attach_metadata_bulk(objs_of(_KIND_JOIST), joist_row, joist_label, supplier=supplier)
+    lc.attach_metadata_bulk(boards, deck_row, deck_label, supplier=supplier)
+    lc.attach_metadata_bulk(
+        posts, post_row, post_label, supplier=supplier, cut_length_in=post_height_in
+    )
 
     # Hangers on house rim and outboard rim for each interior joist
     hangs = _create_deck_hangers(
@@ -3390,23 +3375,24 @@ def create_deck_16x8(
     created.extend(hangs)
 
     # Create assembly (App::Part)
-    App.Console.PrintMessage(
-        f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n"
-    )
+    _log(f"[deck_assemblies] Created assembly: {assembly_name} (type: App::Part)\n")
     assembly = doc.addObject("App::Part", assembly_name)
     assembly.Label = assembly_name
 
     # Add all parts to assembly
-    App.Console.PrintMessage(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+    _log(f"[deck_assemblies] Adding {len(created)} parts to assembly...\n")
+    assembly.addObjects(created)
 
     # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+    assembly.Placement = App.Placement(
+        App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+    )
 
-    doc.recompute()
+    lc.purge_touched(created)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({len(centers)} joists, {len(boards)} deck boards, {len(posts)} posts, {len(hangs)} hangers)\n"
     )
@@ -3423,6 +3409,7 @@ def create_deck_surface_perpendicular_over_stair(
     y_base=0.0,
     z_base=0.0,
     supplier="lowes",
+    recompute=True,
 ):
     """
     Create perpendicular deck boards (running north-south) over stair opening.
@@ -3442,10 +3429,14 @@ def create_deck_surface_perpendicular_over_stair(
             - stair_y_snap_ft: Y position where top tread south edge meets rim
         x_base, y_base, z_base: Position offsets (inches)
         supplier: Supplier preference
+        recompute: Recompute the document when done (pass False when batching
+                   several builds and recompute once at the end)
 
     Returns:
         App::Part assembly containing perpendicular deck boards
     """
+    INCH = lc.inch(1.0)  # mm per inch
+
     if stair_config is None:
         raise ValueError("stair_config required for perpendicular stair deck boards")
 
@@ -3483,34 +3474,35 @@ def create_deck_surface_perpendicular_over_stair(
         y_offset_in = stair_y_snap_ft * 12.0 + (i * board_pitch)
 
         board = doc.addObject("Part::Feature", f"{assembly_name}_Board_{i+1}")
-        board_box = Part.makeBox(
-            lc.inch(board_length_in),  # Length in X direction (east-west, 3' stair width)
-            lc.inch(deck_width),  # Width in Y direction (north-south, 5.5" nominal)
-            lc.inch(deck_thick),  # Thickness in Z direction (1.0")
+        board_box = lc.cached_box(
+            board_length_in * INCH,  # Length in X direction (east-west, 3' stair width)
+            deck_width * INCH,  # Width in Y direction (north-south, 5.5" nominal)
+            deck_thick * INCH,  # Thickness in Z direction (1.0")
         )
         board_box.Placement.Base = App.Vector(
             0.0,  # X position (will be offset by x_base in assembly placement)
-            lc.inch(
-                y_offset_in - (stair_y_snap_ft * 12.0)
-            ),  # Y position relative to assembly origin
+            (y_offset_in - (stair_y_snap_ft * 12.0))
+            * INCH,  # Y position relative to assembly origin
             0.0,  # Z position (will be offset by z_base in assembly placement)
         )
         board.Shape = board_box
-
-        # Attach metadata
-        lc.attach_metadata(board, deck_row, deck_label, supplier=supplier)
         boards.append(board)
 
+    lc.attach_metadata_bulk(boards, deck_row, deck_label, supplier=supplier)
+
     # Add all boards to assembly
-    for board in boards:
-        assembly.addObject(board)
+    assembly.addObjects(boards)
 
     # Apply global position offset
-    assembly.Placement.Base = App.Vector(lc.inch(x_base), lc.inch(y_base), lc.inch(z_base))
+    assembly.Placement = App.Placement(
+        App.Vector(x_base * INCH, y_base * INCH, z_base * INCH), App.Rotation()
+    )
 
-    doc.recompute()
+    lc.purge_touched(boards)
+    if recompute:
+        doc.recompute()
 
-    App.Console.PrintMessage(
+    _log(
         f"[deck_assemblies] ✓ Assembly complete: {assembly_name} "
         f"({len(boards)} perpendicular deck boards over stair opening)\n"
     )
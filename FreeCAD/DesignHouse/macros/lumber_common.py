@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 # Shared helpers for FreeCAD lumber macros
 
+import contextlib
 import csv
+import functools
 import os
 import sys
 
@@ -11,6 +13,9 @@ import FreeCAD as App
 
 # Debug/verbosity switches (can be overridden with env vars)
 COLOR_DEBUG = os.environ.get("LUMBER_COLOR_DEBUG", "").lower() in ("1", "true", "yes")
+# Hanger pieces only touch, so a compound looks the same as a fused solid without the
+# boolean; set LUMBER_HANGER_COMPOUND=0 to fuse them into one solid instead
+HANGER_USE_COMPOUND = os.environ.get("LUMBER_HANGER_COMPOUND", "1").lower() in ("1", "true", "yes")
 
 # -----------------------
 # Color palette helpers
@@ -33,21 +38,54 @@ def clamp(val, lo=0.0, hi=1.0):
     return max(lo, min(hi, val))
 
 
-def shade_color(base, length_in):
-    """Discrete shade bands so 8', 12', 14', 16' are clearly distinct."""
+# Nominal prefixes longest-first, so a longer key always wins over a shorter prefix of it
+_NOMINAL_PREFIXES = tuple(sorted(NOMINAL_COLORS, key=lambda k: -len(k)))
+_DEFAULT_BASE_COLOR = (0.8, 0.8, 0.8)
+
+# Shade factor per length band (see _length_band)
+_BAND_FACTORS = (1.20, 1.00, 0.80, 0.60)
+
+
+def _length_band(length_in):
+    """Return the shade band index for a length, or None for no shading."""
     if not length_in:
-        return base
+        return None
     if length_in <= 100:  # ~8'
-        factor = 1.20
-    elif length_in <= 130:  # ~10'
-        factor = 1.00
-    elif length_in <= 170:  # ~14'
-        factor = 0.80
-    else:  # 16'+
-        factor = 0.60
+        return 0
+    if length_in <= 130:  # ~10'
+        return 1
+    if length_in <= 170:  # ~14'
+        return 2
+    return 3  # 16'+
+
+
+def _shade(base, band):
+    if band is None:
+        return base
+    factor = _BAND_FACTORS[band]
     return tuple(clamp(c * factor, 0.0, 1.0) for c in base)
 
 
+def shade_color(base, length_in):
+    """Discrete shade bands so 8', 12', 14', 16' are clearly distinct."""
+    return _shade(base, _length_band(length_in))
+
+
+# Every (nominal prefix, band) color, shaded once at import; prefix None = default color
+_SHADED = {
+    (key, band): _shade(NOMINAL_COLORS[key] if key else _DEFAULT_BASE_COLOR, band)
+    for key in _NOMINAL_PREFIXES + (None,)
+    for band in (None, 0, 1, 2, 3)
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _color_for(nominal, band):
+    """Shaded color for a lowercased nominal and length band (cached; inputs repeat a lot)."""
+    prefix = next((key for key in _NOMINAL_PREFIXES if nominal.startswith(key)), None)
+    return _SHADED[(prefix, band)]
+
+
 def color_for_row(row):
     """Pick a color based on nominal and shade by length."""
     if not row:
@@ -57,15 +95,7 @@ def color_for_row(row):
         length_in = float(row.get("length_in", 0) or 0)
     except Exception:
         length_in = None
-
-    base = None
-    for key, val in NOMINAL_COLORS.items():
-        if nominal.startswith(key):
-            base = val
-            break
-    if base is None:
-        base = (0.8, 0.8, 0.8)
-    return shade_color(base, length_in)
+    return _color_for(nominal, _length_band(length_in))
 
 
 def ensure_macro_path():
@@ -85,6 +115,32 @@ def inch(x):
     return x * MM_PER_INCH
 
 
+# Box prototypes keyed by size in mm. A build uses only a handful of distinct
+# lumber sizes, so each is made once and every caller gets a copy.
+_BOX_CACHE = {}
+
+
+def cached_box(dx, dy, dz):
+    """
+    Return a box shape of the given size (mm), built once per unique size.
+
+    Sizes are rounded to 1e-6 mm so inch conversions of equal lengths share an
+    entry. Callers get their own copy, so moving or cutting it never touches the
+    cached prototype.
+
+    Args:
+        dx, dy, dz: Box size in mm
+
+    Returns:
+        Part.Shape box at the origin
+    """
+    key = (round(dx, 6), round(dy, 6), round(dz, 6))
+    proto = _BOX_CACHE.get(key)
+    if proto is None:
+        proto = _BOX_CACHE[key] = Part.makeBox(*key)
+    return proto.copy()
+
+
 def resolve_catalog(candidates):
     for p in candidates:
         if os.path.isfile(p):
@@ -92,12 +148,35 @@ def resolve_catalog(candidates):
     raise FileNotFoundError(f"Could not find lumber_catalog.csv. Checked: {candidates}")
 
 
+class _CatalogRows(list):
+    """Catalog rows plus a {label: row} dict (first row per label) for find_stock()."""
+
+    by_label = None
+
+
 def load_catalog(path):
-    with open(path, newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+    """Read the catalog CSV; every call parses the file and returns its own rows.
+
+    The label dict is built once here, so find_stock() on the returned rows is a
+    dict lookup instead of a scan.
+    """
+    # 64 KB buffer: the whole catalog (~14 KB) comes in with one read
+    with open(path, newline="", encoding="utf-8", buffering=1 << 16) as f:
+        rows = _CatalogRows(csv.DictReader(f))
+    rows.by_label = {}
+    for r in rows:
+        rows.by_label.setdefault(r.get("label"), r)  # first match wins, like a scan
+    return rows
 
 
 def find_stock(rows, label):
+    """Return the first catalog row with this label (None if missing).
+
+    Rows from load_catalog() use their label dict; any other sequence is scanned.
+    """
+    by_label = getattr(rows, "by_label", None)
+    if by_label is not None:
+        return by_label.get(label)
     for r in rows:
         if r.get("label") == label:
             return r
@@ -107,12 +186,18 @@ def find_stock(rows, label):
 def attach_metadata(obj, row, label, supplier="lowes"):
     if not row:
         return
-    for key in ("sku_lowes", "url_lowes", "sku_hd", "url_hd"):
-        if key not in obj.PropertiesList:
+    values = (
+        ("sku_lowes", row.get("sku_lowes", "")),
+        ("url_lowes", row.get("url_lowes", "")),
+        ("sku_hd", row.get("sku_hd", "")),
+        ("url_hd", row.get("url_hd", "")),
+        ("supplier", supplier),
+        ("label", label),
+    )
+    for key, val in values:
+        if not hasattr(obj, key):
             obj.addProperty("App::PropertyString", key)
-        obj.__setattr__(key, row.get(key, ""))
-    obj.addProperty("App::PropertyString", "supplier").supplier = supplier
-    obj.addProperty("App::PropertyString", "label").label = label
+        setattr(obj, key, val)
     try:
         col = color_for_row(row)
         if col and hasattr(obj, "ViewObject"):
@@ -129,12 +214,60 @@ def attach_metadata(obj, row, label, supplier="lowes"):
         pass
 
 
+def attach_metadata_bulk(objs, row, label, supplier="lowes", cut_length_in=None):
+    """Attach the same catalog metadata to many objects cut from one stock row.
+
+    Same properties as attach_metadata(), but property values and color are
+    resolved once for the batch and only properties that are actually missing
+    get added.
+
+    Args:
+        objs: Objects to tag (Part::Feature or App::Link)
+        row: Catalog row (dict) shared by all objects
+        label: Catalog label for BOM
+        supplier: Supplier preference ("lowes" or "hd")
+        cut_length_in: Optional cut length (inches) stored as a float "cut_length_in"
+    """
+    if not row or not objs:
+        return
+    values = [
+        ("App::PropertyString", key, row.get(key, ""))
+        for key in ("sku_lowes", "url_lowes", "sku_hd", "url_hd")
+    ]
+    values.append(("App::PropertyString", "supplier", supplier))
+    values.append(("App::PropertyString", "label", label))
+    if cut_length_in is not None:
+        values.append(("App::PropertyFloat", "cut_length_in", float(cut_length_in)))
+    try:
+        col = color_for_row(row)
+    except Exception:
+        col = None
+    if COLOR_DEBUG:
+        App.Console.PrintMessage(
+            f"[color-debug] label={label} nominal={row.get('nominal','?')} "
+            f"length_in={row.get('length_in', '?')} color={col} count={len(objs)}\n"
+        )
+
+    for obj in objs:
+        for prop_type, key, val in values:
+            if not hasattr(obj, key):
+                obj.addProperty(prop_type, key)
+            setattr(obj, key, val)
+        if col:
+            try:
+                obj.ViewObject.ShapeColor = col
+            except Exception:
+                pass
+
+
 def clear_group(doc, name):
     # Remove any object whose Name or Label matches the desired group name
+    # (direct lookups instead of scanning doc.Objects)
     targets = []
-    for obj in doc.Objects:
-        if obj.Name == name or obj.Label == name:
-            targets.append(obj)
+    named = doc.getObject(name)
+    if named is not None:
+        targets.append(named)
+    targets.extend(obj for obj in doc.getObjectsByLabel(name) if obj is not named)
     for old in targets:
         if hasattr(old, "Group"):
             for c in list(old.Group):
@@ -142,6 +275,70 @@ def clear_group(doc, name):
         doc.removeObject(old.Name)
 
 
+def _join_hanger_pieces(seat, pieces):
+    """Combine a hanger seat with its side/flange boxes (compound or fused solid)."""
+    if HANGER_USE_COMPOUND:
+        return Part.makeCompound([seat] + pieces)
+    return seat.fuse(pieces)
+
+
+def _u_hanger_boxes(thick, hanger_thickness, hanger_height, hanger_seat_depth, axis):
+    """Boxes of a U-shape hanger at the origin: seat, sideL/sideR, flangeL/flangeR."""
+    INCH = inch(1.0)  # mm per inch
+    bh = hanger_height
+    bd = hanger_seat_depth
+    bt = hanger_thickness
+    z0 = -bt  # drop seat below joist bottom
+
+    # Build at origin in local coordinates: A-axis = seat length, B-axis = joist thickness, Z up
+    # Each piece: (name, size in inches, base in inches, rotation or None)
+    if axis == "Y":
+        # Local A (seat length) -> world Y, Local B (joist thickness) -> world X
+        rot90 = App.Rotation(App.Vector(0, 0, 1), 90)
+        specs = (
+            ("seat", (thick, bd, bt), (0, 0, z0), None),  # X=thickness, Y=length
+            ("sideL", (thick, bt, bh), (0, 0, z0), rot90),  # shift back -bt in X
+            ("sideR", (thick, bt, bh), (thick + bt, 0, z0), rot90),  # far side +X by thickness
+            ("flangeL", (thick, bt, bh), (-(bt + thick), 0, z0), None),  # rim flange X=-bt-thick
+            ("flangeR", (thick, bt, bh), (thick + bt, 0, z0), None),  # far flange at X=thick+bt
+        )
+    else:
+        # axis == "X": local A -> world X, local B -> world Y
+        specs = (
+            ("seat", (bd, thick, bt), (0, 0, z0), None),
+            ("sideL", (bd, bt, bh), (0, -bt, z0), None),
+            ("sideR", (bd, bt, bh), (0, thick, z0), None),
+            ("flangeL", (bt, thick, bh), (0, -(bt + thick), z0), None),  # rim side, y=-bt-thick
+            ("flangeR", (bt, thick, bh), (0, thick + bt, z0), None),  # far side at Y=thick+bt
+        )
+
+    boxes = {}
+    for piece, (dx, dy, dz), (bx, by, bz), rot in specs:
+        box = Part.makeBox(dx * INCH, dy * INCH, dz * INCH)
+        box.Placement = App.Placement(
+            App.Vector(bx * INCH, by * INCH, bz * INCH), rot or App.Rotation()
+        )
+        boxes[piece] = box
+    return boxes
+
+
+def _u_hanger_placement(x_pos, y_center, thick, hanger_thickness, direction, axis):
+    """World placement of a joined U-shape hanger (see make_hanger for the conventions)."""
+    INCH = inch(1.0)  # mm per inch
+    if axis == "Y":
+        # Rotate to flip rim/far orientation when extending toward -Y
+        rot_z = 0 if direction > 0 else 180
+        # Translate: center on joist thickness (world X = y_center), rim face at world Y = x_pos
+        tx = (y_center - (thick / 2.0)) * INCH  # no extra offset
+        ty = x_pos * INCH
+        return App.Placement(App.Vector(tx, ty, 0), App.Rotation(App.Vector(0, 0, 1), rot_z))
+    tx = x_pos * INCH  # rim flange at x_pos
+    # Y offset: direction=-1 needs to shift +Y by (bt + thick) to align properly
+    y_offset = (hanger_thickness + thick) if direction < 0 else 0
+    ty = (y_center - (thick / 2.0) + y_offset) * INCH  # center on joist thickness
+    return App.Placement(App.Vector(tx, ty, 0), App.Rotation())
+
+
 def make_hanger(
     doc,
     name,
@@ -167,64 +364,9 @@ def make_hanger(
 
     When debug_components is True, return a colored group of sub-parts instead of a fused solid (used by test macro).
     """
-    bh = hanger_height
-    bd = hanger_seat_depth
-    bt = hanger_thickness
-    z0 = -bt  # drop seat below joist bottom
     direction = 1 if direction >= 0 else -1
     axis = (axis or "X").upper()
-
-    # Build at origin in local coordinates: A-axis = seat length, B-axis = joist thickness, Z up
-    if axis == "Y":
-        # Local A (seat length) -> world Y, Local B (joist thickness) -> world X
-        seat = Part.makeBox(inch(thick), inch(bd), inch(bt))  # X=thickness, Y=length
-        seat.Placement.Base = App.Vector(0, 0, inch(z0))
-        sideL = Part.makeBox(inch(thick), inch(bt), inch(bh))
-        sideL.Placement.Base = App.Vector(0, 0, inch(z0))  # shift back -bt in X
-        sideL.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), 90)
-        sideR = Part.makeBox(inch(thick), inch(bt), inch(bh))
-        sideR.Placement.Base = App.Vector(
-            inch(thick + bt), 0, inch(z0)
-        )  # far side shift +X by hanger thickness
-        sideR.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), 90)
-        flangeL = Part.makeBox(inch(thick), inch(bt), inch(bh))
-        flangeL.Placement.Base = App.Vector(
-            -inch(bt + thick), 0, inch(z0)
-        )  # rim flange at X=-bt-thick
-        flangeR = Part.makeBox(inch(thick), inch(bt), inch(bh))
-        flangeR.Placement.Base = App.Vector(
-            inch(thick + bt), 0, inch(z0)
-        )  # far flange at X=thick+bt
-
-        assembled = seat.fuse([sideL, sideR, flangeL, flangeR])
-        # Rotate to flip rim/far orientation when extending toward -Y
-        rot_z = 0 if direction > 0 else 180
-        assembled.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), rot_z)
-        # Translate: center on joist thickness (world X = y_center), rim face to world Y = x_pos
-        tx = inch(y_center - (thick / 2.0))  # center on joist thickness (no extra offset)
-        ty = inch(x_pos)
-        assembled.Placement.Base = App.Vector(tx, ty, 0)
-    else:
-        # axis == "X": local A -> world X, local B -> world Y
-        seat = Part.makeBox(inch(bd), inch(thick), inch(bt))
-        seat.Placement.Base = App.Vector(0, 0, inch(z0))
-        sideL = Part.makeBox(inch(bd), inch(bt), inch(bh))
-        sideL.Placement.Base = App.Vector(0, -inch(bt), inch(z0))
-        sideR = Part.makeBox(inch(bd), inch(bt), inch(bh))
-        sideR.Placement.Base = App.Vector(0, inch(thick), inch(z0))
-        flangeL = Part.makeBox(inch(bt), inch(thick), inch(bh))
-        flangeL.Placement.Base = App.Vector(
-            0, -inch(bt + thick), inch(z0)
-        )  # rim side at x=0, y=-bt-thick
-        flangeR = Part.makeBox(inch(bt), inch(thick), inch(bh))
-        flangeR.Placement.Base = App.Vector(0, inch(thick + bt), inch(z0))  # far side at Y=thick+bt
-
-        assembled = seat.fuse([sideL, sideR, flangeL, flangeR])
-        tx = inch(x_pos)  # rim flange at x_pos
-        # Y offset: direction=-1 needs to shift +Y by (bt + thick) to align properly
-        y_offset = (bt + thick) if direction < 0 else 0
-        ty = inch(y_center - (thick / 2.0) + y_offset)  # center on joist thickness
-        assembled.Placement.Base = App.Vector(tx, ty, 0)
+    boxes = _u_hanger_boxes(thick, hanger_thickness, hanger_height, hanger_seat_depth, axis)
 
     if debug_components:
         # Build individual colored parts and group them for visual debugging.
@@ -238,13 +380,7 @@ def make_hanger(
         if color:
             for k in colors:
                 colors[k] = color
-        pieces = [
-            ("flangeL", flangeL),
-            ("seat", seat),
-            ("sideL", sideL),
-            ("sideR", sideR),
-            ("flangeR", flangeR),
-        ]
+        pieces = [(k, boxes[k]) for k in ("flangeL", "seat", "sideL", "sideR", "flangeR")]
 
         grp = doc.addObject("App::DocumentObjectGroup", name)
         grp.Label = name
@@ -263,24 +399,65 @@ def make_hanger(
             except Exception:
                 pass
             objs.append(part_obj)
-            grp.addObject(part_obj)
-        grp.Group = objs
+        grp.addObjects(objs)
         return grp
     else:
-        obj = doc.addObject("Part::Feature", name)
-        obj.Shape = assembled
-        obj.addProperty("App::PropertyString", "supplier").supplier = "lowes"
-        obj.addProperty("App::PropertyString", "label").label = hanger_label
-        # Default to hardware palette if no color provided
-        final_color = (
-            color if color is not None else NOMINAL_COLORS.get("hardware", (0.7, 0.7, 0.7))
+        # Only the joined hanger is needed here; debug mode above uses the loose boxes
+        assembled = _join_hanger_pieces(
+            boxes["seat"], [boxes["sideL"], boxes["sideR"], boxes["flangeL"], boxes["flangeR"]]
         )
-        if final_color:
-            try:
-                obj.ViewObject.ShapeColor = final_color
-            except Exception:
-                pass
-        return obj
+        assembled.Placement = _u_hanger_placement(
+            x_pos, y_center, thick, hanger_thickness, direction, axis
+        )
+        return _hanger_feature(doc, name, assembled, hanger_label, color)
+
+
+def make_hangers(
+    doc,
+    specs,
+    thick,
+    hanger_thickness,
+    hanger_height,
+    hanger_seat_depth,
+    hanger_label="hanger",
+    axis="X",
+    color=None,
+):
+    """
+    Create many U-shape hangers of one size along one axis in a single call.
+
+    Same geometry and placement as make_hanger(), but the hanger solid is built
+    once and every hanger gets a placed copy of it.
+
+    Args:
+        doc: FreeCAD document
+        specs: List of dicts, one per hanger, with keys name, x_pos, y_center and
+               optional direction (meaning as in make_hanger, default +1)
+        thick: Joist thickness (inches)
+        hanger_thickness: Metal thickness (inches)
+        hanger_height: Height of side flanges (inches)
+        hanger_seat_depth: Depth of seat (inches)
+        hanger_label: Catalog label for BOM
+        axis: "X" or "Y", shared by every hanger in the batch
+        color: Optional color tuple
+
+    Returns:
+        List of Part::Feature objects in spec order
+    """
+    axis = (axis or "X").upper()
+    boxes = _u_hanger_boxes(thick, hanger_thickness, hanger_height, hanger_seat_depth, axis)
+    proto = _join_hanger_pieces(
+        boxes["seat"], [boxes["sideL"], boxes["sideR"], boxes["flangeL"], boxes["flangeR"]]
+    )
+    hangers = []
+    for spec in specs:
+        direction = 1 if spec.get("direction", 1) >= 0 else -1
+        shape = proto.copy()
+        shape.Placement = _u_hanger_placement(
+            spec["x_pos"], spec["y_center"], thick, hanger_thickness, direction, axis
+        )
+        hangers.append(_hanger_feature(doc, spec["name"], shape, hanger_label, color))
+    return hangers
 
 
 def make_hanger_for_joist(
@@ -352,10 +529,42 @@ def make_hanger_for_joist(
             rim_side="south",       # Joist is south of rim face
         )
     """
+    assembled = _joist_hanger_shape(
+        joist_x_in,
+        joist_y_in,
+        joist_z_in,
+        joist_thick_in,
+        rim_face_position_in,
+        rim_axis,
+        rim_side,
+        hanger_thickness_in,
+        hanger_height_in,
+        hanger_seat_depth_in,
+    )
+    return _hanger_feature(doc, name, assembled, hanger_label, color)
+
+
+def _joist_hanger_shape(
+    joist_x_in,
+    joist_y_in,
+    joist_z_in,
+    joist_thick_in,
+    rim_face_position_in,
+    rim_axis,
+    rim_side,
+    hanger_thickness_in,
+    hanger_height_in,
+    hanger_seat_depth_in,
+):
+    """Hanger shape for make_hanger_for_joist (same arguments, inches)."""
+    INCH = inch(1.0)  # mm per inch
     bt = hanger_thickness_in
     bh = hanger_height_in
     bd = hanger_seat_depth_in
     jt = joist_thick_in
+    # Normalize orientation names once
+    rim_axis = (rim_axis or "X").upper()
+    rim_side = rim_side.lower()
 
     # Seat top is at joist bottom Z
     seat_top_z = joist_z_in
@@ -366,11 +575,11 @@ def make_hanger_for_joist(
     # Side flanges: on either side of joist
     # Rim flange: against rim face
 
-    if rim_axis.upper() == "X":
+    if rim_axis == "X":
         # Rim runs E-W (X direction), joist runs N-S (Y direction)
         # Hanger seat extends in Y direction toward rim
 
-        if rim_side.lower() in ("south", "front"):
+        if rim_side in ("south", "front"):
             # Joist is SOUTH of rim, hanger opens to NORTH (toward rim)
             # Seat extends from joist end toward rim (in +Y direction)
             seat_y_start = joist_y_in
@@ -388,45 +597,57 @@ def make_hanger_for_joist(
 
         # Seat box (under joist)
         seat = Part.makeBox(
-            inch(jt),  # X = joist thickness
-            inch(bd),  # Y = seat depth
-            inch(bt),  # Z = hanger thickness
+            jt * INCH,  # X = joist thickness
+            bd * INCH,  # Y = seat depth
+            bt * INCH,  # Z = hanger thickness
         )
-        seat.Placement.Base = App.Vector(
-            inch(joist_x_in - jt / 2.0),
-            inch(min(seat_y_start, seat_y_end)),
-            inch(seat_bottom_z),
+        seat.Placement = App.Placement(
+            App.Vector(
+                (joist_x_in - jt / 2.0) * INCH,
+                min(seat_y_start, seat_y_end) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
         # Side flanges (on east and west sides of joist)
-        side_west = Part.makeBox(inch(bt), inch(bd), inch(bh))
-        side_west.Placement.Base = App.Vector(
-            inch(joist_x_in - jt / 2.0 - bt),
-            inch(min(seat_y_start, seat_y_end)),
-            inch(seat_bottom_z),
+        side_west = Part.makeBox(bt * INCH, bd * INCH, bh * INCH)
+        side_west.Placement = App.Placement(
+            App.Vector(
+                (joist_x_in - jt / 2.0 - bt) * INCH,
+                min(seat_y_start, seat_y_end) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
-        side_east = Part.makeBox(inch(bt), inch(bd), inch(bh))
-        side_east.Placement.Base = App.Vector(
-            inch(joist_x_in + jt / 2.0),
-            inch(min(seat_y_start, seat_y_end)),
-            inch(seat_bottom_z),
+        side_east = Part.makeBox(bt * INCH, bd * INCH, bh * INCH)
+        side_east.Placement = App.Placement(
+            App.Vector(
+                (joist_x_in + jt / 2.0) * INCH,
+                min(seat_y_start, seat_y_end) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
         # Rim flange (against rim, spans joist width + side flanges)
         flange_width = jt + 2 * bt  # Joist width + both side flanges
-        rim_flange = Part.makeBox(inch(flange_width), inch(bt), inch(bh))
-        rim_flange.Placement.Base = App.Vector(
-            inch(joist_x_in - jt / 2.0 - bt),
-            inch(flange_y - bt) if rim_side.lower() in ("south", "front") else inch(flange_y),
-            inch(seat_bottom_z),
+        rim_flange = Part.makeBox(flange_width * INCH, bt * INCH, bh * INCH)
+        rim_flange.Placement = App.Placement(
+            App.Vector(
+                (joist_x_in - jt / 2.0 - bt) * INCH,
+                (flange_y - bt) * INCH if rim_side in ("south", "front") else flange_y * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
     else:
         # Rim runs N-S (Y direction), joist runs E-W (X direction)
         # Hanger seat extends in X direction toward rim
 
-        if rim_side.lower() in ("west", "left"):
+        if rim_side in ("west", "left"):
             # Joist is WEST of rim, hanger opens to EAST (toward rim)
             seat_x_start = joist_x_in
             seat_x_end = joist_x_in + bd
@@ -438,45 +659,59 @@ def make_hanger_for_joist(
             flange_x = rim_face_position_in
 
         # Seat box
-        seat = Part.makeBox(inch(bd), inch(jt), inch(bt))
-        seat.Placement.Base = App.Vector(
-            inch(min(seat_x_start, seat_x_end)),
-            inch(joist_y_in - jt / 2.0),
-            inch(seat_bottom_z),
+        seat = Part.makeBox(bd * INCH, jt * INCH, bt * INCH)
+        seat.Placement = App.Placement(
+            App.Vector(
+                min(seat_x_start, seat_x_end) * INCH,
+                (joist_y_in - jt / 2.0) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
         # Side flanges (on north and south sides of joist)
-        side_south = Part.makeBox(inch(bd), inch(bt), inch(bh))
-        side_south.Placement.Base = App.Vector(
-            inch(min(seat_x_start, seat_x_end)),
-            inch(joist_y_in - jt / 2.0 - bt),
-            inch(seat_bottom_z),
+        side_south = Part.makeBox(bd * INCH, bt * INCH, bh * INCH)
+        side_south.Placement = App.Placement(
+            App.Vector(
+                min(seat_x_start, seat_x_end) * INCH,
+                (joist_y_in - jt / 2.0 - bt) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
-        side_north = Part.makeBox(inch(bd), inch(bt), inch(bh))
-        side_north.Placement.Base = App.Vector(
-            inch(min(seat_x_start, seat_x_end)),
-            inch(joist_y_in + jt / 2.0),
-            inch(seat_bottom_z),
+        side_north = Part.makeBox(bd * INCH, bt * INCH, bh * INCH)
+        side_north.Placement = App.Placement(
+            App.Vector(
+                min(seat_x_start, seat_x_end) * INCH,
+                (joist_y_in + jt / 2.0) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
         # Rim flange
         flange_height_span = jt + 2 * bt
-        rim_flange = Part.makeBox(inch(bt), inch(flange_height_span), inch(bh))
-        rim_flange.Placement.Base = App.Vector(
-            inch(flange_x - bt) if rim_side.lower() in ("west", "left") else inch(flange_x),
-            inch(joist_y_in - jt / 2.0 - bt),
-            inch(seat_bottom_z),
+        rim_flange = Part.makeBox(bt * INCH, flange_height_span * INCH, bh * INCH)
+        rim_flange.Placement = App.Placement(
+            App.Vector(
+                (flange_x - bt) * INCH if rim_side in ("west", "left") else flange_x * INCH,
+                (joist_y_in - jt / 2.0 - bt) * INCH,
+                seat_bottom_z * INCH,
+            ),
+            App.Rotation(),
         )
 
-    # Fuse all parts
-    if rim_axis.upper() == "X":
-        assembled = seat.fuse([side_west, side_east, rim_flange])
-    else:
-        assembled = seat.fuse([side_south, side_north, rim_flange])
+    # Join all parts
+    if rim_axis == "X":
+        return _join_hanger_pieces(seat, [side_west, side_east, rim_flange])
+    return _join_hanger_pieces(seat, [side_south, side_north, rim_flange])
+
 
+def _hanger_feature(doc, name, shape, hanger_label, color=None):
+    """Wrap a hanger solid in a Part::Feature tagged for the BOM."""
     obj = doc.addObject("Part::Feature", name)
-    obj.Shape = assembled
+    obj.Shape = shape
     obj.addProperty("App::PropertyString", "supplier").supplier = "lowes"
     obj.addProperty("App::PropertyString", "label").label = hanger_label
 
@@ -490,11 +725,170 @@ def make_hanger_for_joist(
     return obj
 
 
+def _hanger_from_spec(
+    doc,
+    spec,
+    prototypes,
+    joist_thick_in,
+    hanger_thickness_in,
+    hanger_height_in,
+    hanger_seat_depth_in,
+    hanger_label,
+    color,
+):
+    """One make_hangers_for_joists() hanger; prototypes caches the solid per orientation."""
+    INCH = inch(1.0)  # mm per inch
+    x, y, z = spec["joist_x_in"], spec["joist_y_in"], spec["joist_z_in"]
+    rim_axis = spec["rim_axis"].upper()
+    rim_side = spec["rim_side"].lower()
+    # Rim face offset from the joist end, along the joist
+    face_offset = spec["rim_face_position_in"] - (y if rim_axis == "X" else x)
+    key = (rim_axis, rim_side, face_offset)
+    proto = prototypes.get(key)
+    if proto is None:
+        proto = prototypes[key] = _joist_hanger_shape(
+            0.0,
+            0.0,
+            0.0,
+            joist_thick_in,
+            face_offset,
+            rim_axis,
+            rim_side,
+            hanger_thickness_in,
+            hanger_height_in,
+            hanger_seat_depth_in,
+        )
+    # Setting the copy's Placement only changes its location, so every
+    # hanger of this orientation shares the prototype's topology
+    shape = proto.copy()
+    shape.Placement = App.Placement(App.Vector(x * INCH, y * INCH, z * INCH), App.Rotation())
+    return _hanger_feature(doc, spec["name"], shape, hanger_label, color)
+
+
+def make_hangers_for_joists(
+    doc,
+    specs,
+    joist_thick_in,
+    joist_depth_in,
+    hanger_thickness_in=0.06,
+    hanger_height_in=7.8125,
+    hanger_seat_depth_in=2.0,
+    hanger_label="hanger_LU210",
+    color=None,
+    skip_failed=False,
+):
+    """
+    Create many joist hangers of one size in a single call.
+
+    Same placement rules as make_hanger_for_joist(), but the fused hanger solid is
+    built once per orientation (rim axis, rim side, rim face offset from the joist
+    end) and every hanger gets a translated copy of it.
+
+    Args:
+        doc: FreeCAD document
+        specs: List of dicts, one per hanger, with keys name, joist_x_in,
+               joist_y_in, joist_z_in, rim_face_position_in, rim_axis, rim_side
+               (meaning as in make_hanger_for_joist)
+        joist_thick_in: Joist thickness (1.5" for 2x lumber)
+        joist_depth_in: Joist depth (11.25" for 2x12)
+        hanger_thickness_in: Metal thickness (default 0.06")
+        hanger_height_in: Height of side flanges (default 7.8125")
+        hanger_seat_depth_in: Depth of seat (default 2.0")
+        hanger_label: Catalog label for BOM
+        color: Optional color tuple
+        skip_failed: Log and skip a spec whose hanger fails to build instead of
+                     raising, so one bad joist doesn't drop the whole batch
+
+    Returns:
+        List of Part::Feature objects in spec order (failed specs left out)
+    """
+    prototypes = {}
+    hangers = []
+    for spec in specs:
+        try:
+            hangers.append(
+                _hanger_from_spec(
+                    doc,
+                    spec,
+                    prototypes,
+                    joist_thick_in,
+                    hanger_thickness_in,
+                    hanger_height_in,
+                    hanger_seat_depth_in,
+                    hanger_label,
+                    color,
+                )
+            )
+        except Exception as e:
+            if not skip_failed:
+                raise
+            App.Console.PrintError(
+                f"[lumber_common] Hanger build failed for {spec.get('name', '?')}: {e}\n"
+            )
+    return hangers
+
+
 # ============================================================
 # ASSEMBLY HELPERS (App::Part with Bounding Box Support)
 # ============================================================
 
 
+def log(msg, verbose=True):
+    """Print a progress message to the FreeCAD console when verbose is on.
+
+    Each macro module passes its own VERBOSE flag, so quiet batch builds can be
+    selected per module.
+    """
+    if verbose:
+        App.Console.PrintMessage(msg)
+
+
+def purge_touched(objs):
+    """Clear the touched flag on Part::Features whose Shape was assigned directly.
+
+    These features are not parametric, so re-executing them in doc.recompute()
+    only rebuilds what was just set; once purged, recompute only has to visit the
+    assembly containers that still need it. Anything else (App::Link, groups,
+    containers) keeps its flag, since it still has to execute to place or
+    collect its children.
+
+    Args:
+        objs: Objects created by a factory; only Part::Features are purged
+    """
+    for obj in objs:
+        if obj.TypeId == "Part::Feature":
+            obj.purgeTouched()
+
+
+@contextlib.contextmanager
+def doc_transaction(doc, name):
+    """Group the objects created in the block into one undoable transaction.
+
+    The transaction is committed even if the block raises, so the document is
+    never left with an open transaction.
+    """
+    doc.openTransaction(name)
+    try:
+        yield
+    finally:
+        doc.commitTransaction()
+
+
+@contextlib.contextmanager
+def recomputes_frozen(doc):
+    """Freeze document recomputes for the block, then restore the previous state.
+
+    Objects added in the block still get touched, but nothing is recomputed until
+    the caller's single doc.recompute() after the block.
+    """
+    was_frozen = getattr(doc, "RecomputesFrozen", False)
+    doc.RecomputesFrozen = True
+    try:
+        yield
+    finally:
+        doc.RecomputesFrozen = was_frozen
+
+
 def create_assembly(doc, name, label=None):
     """Create App::Part assembly container (NOT DocumentObjectGroup).
 
@@ -522,8 +916,9 @@ def create_assembly(doc, name, label=None):
 def get_assembly_bbox(assembly):
     """Get bounding box of an App::Part assembly.
 
-    Only includes Part::Feature objects (excludes LCS, DocumentObjectGroup, etc.)
-    to avoid infinite bounding boxes from coordinate system markers.
+    Only includes Part::Feature objects and App::Link instances of them (excludes
+    LCS, DocumentObjectGroup, etc.) to avoid infinite bounding boxes from
+    coordinate system markers.
 
     Args:
         assembly: App::Part object
@@ -538,15 +933,19 @@ def get_assembly_bbox(assembly):
     """
     bbox = App.BoundBox()
 
-    def add_shapes_recursive(obj):
-        """Recursively add shapes from Part::Feature objects only."""
-        if hasattr(obj, "Shape") and obj.TypeId == "Part::Feature":
+    # Walk the tree with an explicit stack (no recursion per nested group)
+    stack = [assembly]
+    while stack:
+        obj = stack.pop()
+        type_id = obj.TypeId
+        if type_id == "Part::Feature" and hasattr(obj, "Shape"):
             bbox.add(obj.Shape.BoundBox)
-        if hasattr(obj, "Group"):
-            for child in obj.Group:
-                add_shapes_recursive(child)
-
-    add_shapes_recursive(assembly)
+        elif type_id == "App::Link":
+            # Link shape = linked geometry at the link's own placement
+            bbox.add(Part.getShape(obj).BoundBox)
+        group = getattr(obj, "Group", None)
+        if group:
+            stack.extend(group)
     return bbox
 
 
@@ -592,6 +991,26 @@ def add_lcs_markers(assembly, corners=None):
     return lcs_objects
 
 
+# Corner name -> (use XMax, use YMax); corners sit on the bbox bottom (ZMin)
+_CORNER_SIDES = {
+    "bottom_left": (False, False),
+    "bottom_right": (True, False),
+    "top_left": (False, True),
+    "top_right": (True, True),
+}
+
+
+def _bbox_corner(bbox, corner, offset=None):
+    """Return the (x, y, z) of a named bbox corner, optionally shifted by offset."""
+    use_xmax, use_ymax = _CORNER_SIDES[corner]
+    x = bbox.XMax if use_xmax else bbox.XMin
+    y = bbox.YMax if use_ymax else bbox.YMin
+    z = bbox.ZMin
+    if offset is not None:
+        return x + offset.x, y + offset.y, z + offset.z
+    return x, y, z
+
+
 def snap_assembly_corner_to_corner(
     assembly,
     target_assembly,
@@ -616,64 +1035,17 @@ def snap_assembly_corner_to_corner(
 
         # Result: 0.0000mm gap (perfect alignment)
     """
-    # Get bounding boxes
+    # Get bounding boxes (local: moving a module keeps its local box)
     target_bbox = get_assembly_bbox(target_assembly)
     assembly_bbox_local = get_assembly_bbox(assembly)
 
-    # Apply target assembly's placement to get global coordinates
-    target_placement = target_assembly.Placement.Base
-
-    # Get target corner coordinates (in global space)
-    corner_map_target = {
-        "bottom_left": (
-            target_bbox.XMin + target_placement.x,
-            target_bbox.YMin + target_placement.y,
-            target_bbox.ZMin + target_placement.z,
-        ),
-        "bottom_right": (
-            target_bbox.XMax + target_placement.x,
-            target_bbox.YMin + target_placement.y,
-            target_bbox.ZMin + target_placement.z,
-        ),
-        "top_left": (
-            target_bbox.XMin + target_placement.x,
-            target_bbox.YMax + target_placement.y,
-            target_bbox.ZMin + target_placement.z,
-        ),
-        "top_right": (
-            target_bbox.XMax + target_placement.x,
-            target_bbox.YMax + target_placement.y,
-            target_bbox.ZMin + target_placement.z,
-        ),
-    }
-
-    target_x, target_y, target_z = corner_map_target[target_corner]
-
-    # Calculate offset from assembly's origin to its corner (in local space)
-    corner_offset_map = {
-        "bottom_left": (
-            assembly_bbox_local.XMin,
-            assembly_bbox_local.YMin,
-            assembly_bbox_local.ZMin,
-        ),
-        "bottom_right": (
-            assembly_bbox_local.XMax,
-            assembly_bbox_local.YMin,
-            assembly_bbox_local.ZMin,
-        ),
-        "top_left": (
-            assembly_bbox_local.XMin,
-            assembly_bbox_local.YMax,
-            assembly_bbox_local.ZMin,
-        ),
-        "top_right": (
-            assembly_bbox_local.XMax,
-            assembly_bbox_local.YMax,
-            assembly_bbox_local.ZMin,
-        ),
-    }
+    # Target corner in global space (bbox is local, so add the target's placement)
+    target_x, target_y, target_z = _bbox_corner(
+        target_bbox, target_corner, target_assembly.Placement.Base
+    )
 
-    offset_x, offset_y, offset_z = corner_offset_map[assembly_corner]
+    # Offset from assembly's origin to its corner (in local space)
+    offset_x, offset_y, offset_z = _bbox_corner(assembly_bbox_local, assembly_corner)
 
     # Position assembly so its corner aligns with target corner
     assembly.Placement.Base = App.Vector(
@@ -9,14 +9,23 @@ that can be instantiated multiple times without name conflicts or exec() issues.
 For Luke Dombrowski. Stay Alive.
 """
 
+import math
+import os
+
 import Part
 from lumber_common import (
     attach_metadata,
+    attach_metadata_bulk,
+    cached_box,
     create_assembly,
+    doc_transaction,
     find_stock,
     get_assembly_bbox,
     inch,
-    make_hanger_for_joist,
+    log,
+    make_hangers,
+    make_hangers_for_joists,
+    purge_touched,
 )
 from lumber_common import (
     make_hanger as make_hanger_helper,
@@ -24,6 +33,47 @@ from lumber_common import (
 
 import FreeCAD as App
 
+# Progress messages on the FreeCAD console (set PARTS_VERBOSE=0 for quiet batch builds;
+# warnings are always printed)
+VERBOSE = os.environ.get("PARTS_VERBOSE", "1").lower() not in ("0", "false", "no")
+
+
+# Shared identity rotation for axis-aligned placements (Placement copies it)
+_IDENTITY_ROT = App.Rotation()
+
+# Half turn about Z for hangers facing -X (multiply() returns a new rotation)
+_ROT_Z_180 = App.Rotation(App.Vector(0, 0, 1), 180)
+
+
+def _log(msg):
+    """Print a progress message to the FreeCAD console unless VERBOSE is off."""
+    log(msg, VERBOSE)
+
+
+def _add_lcs_markers(assembly, assembly_name, x_in, y_in, short_labels=True):
+    """
+    Add the four corner LCS markers (Origin, BottomRight, TopLeft, TopRight).
+
+    Args:
+        assembly: App::Part to hold the markers
+        assembly_name: Prefix for the marker object names
+        x_in, y_in: Module footprint in inches (markers sit at Z=0)
+        short_labels: Label markers "LCS_<corner>" (joist modules); if False the
+                      label stays the unique object name (front deck modules)
+    """
+    corners = (
+        ("Origin", 0.0, 0.0),
+        ("BottomRight", x_in, 0.0),
+        ("TopLeft", 0.0, y_in),
+        ("TopRight", x_in, y_in),
+    )
+    for corner, x, y in corners:
+        name = f"{assembly_name}_LCS_{corner}"
+        lcs = assembly.newObject("PartDesign::CoordinateSystem", name)
+        lcs.Label = f"LCS_{corner}" if short_labels else name
+        lcs.Placement = App.Placement(App.Vector(inch(x), inch(y), 0), _IDENTITY_ROT)
+
+
 # ============================================================
 # PARAMETERIZED JOIST MODULE FUNCTION
 # ============================================================
@@ -99,145 +149,139 @@ def create_joist_module(
     width = float(joist_row["actual_width_in"])  # 11.25" for 2x12
     joist_stock_length = float(joist_row["length_in"])
 
+    INCH = inch(1.0)  # mm per inch
+
     # Helper functions
     def make_box(length, thickness, depth):
-        return Part.makeBox(inch(length), inch(thickness), inch(depth))
+        return cached_box(length * INCH, thickness * INCH, depth * INCH)
 
-    def make_joist(name, y_pos, length=joist_stock_length, depth=width, joist_thick=thick):
-        box = make_box(length, joist_thick, depth)
-        shape = doc.addObject("Part::Feature", name)
-        shape.Shape = box
-        # Place joists inside rims: start at X=thick (left rim's right face)
-        shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - joist_thick / 2.0), 0)
-        attach_metadata(shape, joist_row, joist_label_use, supplier="lowes")
-        return shape
+    def make_board(name, size_in, pos_in, row_objs):
+        """Axis-aligned board of size_in at pos_in (inches); row_objs picks its stock row."""
+        obj = doc.addObject("Part::Feature", name)
+        obj.Shape = make_box(*size_in)
+        obj.Placement = App.Placement(
+            App.Vector(pos_in[0] * INCH, pos_in[1] * INCH, pos_in[2] * INCH), App.Rotation()
+        )
+        row_objs.append(obj)  # catalog metadata is attached in one pass per row
+        return obj
 
-    def make_rim(name, x_pos, length=module_width_in, depth=width, rim_thick=thick):
-        box = Part.makeBox(inch(rim_thick), inch(length), inch(depth))
-        shape = doc.addObject("Part::Feature", name)
-        shape.Shape = box
-        shape.Placement.Base = App.Vector(inch(x_pos - rim_thick / 2.0), 0, 0)
-        attach_metadata(shape, rim_row, rim_label_use, supplier="lowes")
-        return shape
+    joist_objs = []
+    rim_objs = []
 
-    def make_hanger(name, x_pos, y_center, facing=1):
-        h = make_hanger_helper(
+    # One transaction for the whole build coalesces the per-object change events
+    with doc_transaction(doc, assembly_name):
+        created = []
+
+        # Rims (4 sides)
+        # Left/Right rims: run along Y direction (module_width_in), rim stock
+        rim_size = (thick, module_width_in, width)
+        created.append(make_board(f"{assembly_name}_Rim_Left", rim_size, (0, 0, 0), rim_objs))
+        created.append(
+            make_board(
+                f"{assembly_name}_Rim_Right", rim_size, (module_length_in - thick, 0, 0), rim_objs
+            )
+        )
+        # Front/Back rims: run along X direction between the side rims, so they are cut
+        # from the same (module-length) stock as the joists
+        front_back_size = (module_length_in - 2 * thick, thick, width)
+        created.append(
+            make_board(f"{assembly_name}_Rim_Front", front_back_size, (thick, 0, 0), joist_objs)
+        )
+        created.append(
+            make_board(
+                f"{assembly_name}_Rim_Back",
+                front_back_size,
+                (thick, module_width_in - thick, 0),
+                joist_objs,
+            )
+        )
+
+        # Interior joists (special spacing for sheathing alignment)
+        # First joist at 14.5" from front rim (allows 4x8 sheathing to land on centers)
+        # Subsequent joists at 16" OC
+        first_spacing = 14.5  # Distance from front rim center to first joist center
+        first_center = thick / 2.0 + first_spacing
+
+        # Remaining joists at 16" OC, up to one spacing short of the back rim; counted
+        # up front so each center is first_center + i * spacing_oc (no running sum)
+        last_center = module_width_in - thick / 2.0 - spacing_oc
+        n_more = max(0, math.floor((last_center - first_center) / spacing_oc))
+        positions = [first_center + i * spacing_oc for i in range(n_more + 1)]
+
+        for idx, y_pos in enumerate(positions, start=1):
+            # Place joists inside rims: start at X=thick (left rim's right face)
+            created.append(
+                make_board(
+                    f"{assembly_name}_Joist_{idx}",
+                    (joist_stock_length, thick, width),
+                    (thick, y_pos - thick / 2.0, 0),
+                    joist_objs,
+                )
+            )
+
+        # Hangers on left/right rims
+        left_base_x = thick  # Left rim's right face
+        right_base_x = module_length_in - thick  # Right rim's left face
+        hanger_specs = []
+        for idx, y_pos in enumerate(positions, start=1):
+            hanger_specs.append(
+                {
+                    "name": f"{assembly_name}_Hanger_L_{idx}",
+                    "x_pos": left_base_x,
+                    "y_center": y_pos,
+                    "direction": 1,
+                }
+            )
+            hanger_specs.append(
+                {
+                    "name": f"{assembly_name}_Hanger_R_{idx}",
+                    "x_pos": right_base_x,
+                    "y_center": y_pos,
+                    "direction": -1,
+                }
+            )
+
+        # All hangers share one size, so build them in one batch
+        hanger_objs = make_hangers(
             doc,
-            name,
-            x_pos,
-            y_center,
+            hanger_specs,
             thick,
             hanger_thickness,
             hanger_height,
             hanger_seat_depth,
             hanger_label,
-            direction=facing,
             color=hanger_color,
         )
-        if facing < 0:
-            pl = h.Placement
-            pl.Rotation = App.Rotation(App.Vector(0, 0, 1), 180).multiply(pl.Rotation)
-            h.Placement = pl
-        return h
+        for h, spec in zip(hanger_objs, hanger_specs):
+            if spec["direction"] < 0:
+                pl = h.Placement
+                pl.Rotation = _ROT_Z_180.multiply(pl.Rotation)
+                h.Placement = pl
 
-    created = []
-
-    # Rims (4 sides)
-    # Left/Right rims: run along Y direction (module_width_in)
-    created.append(make_rim(f"{assembly_name}_Rim_Left", thick / 2.0, module_width_in))
-    created.append(
-        make_rim(f"{assembly_name}_Rim_Right", module_length_in - (thick / 2.0), module_width_in)
-    )
-    # Front/Back rims: run along X direction (module_length_in - 2*thick)
-    front_back_length = module_length_in - 2 * thick
-    created.append(make_joist(f"{assembly_name}_Rim_Front", thick / 2.0, length=front_back_length))
-    created.append(
-        make_joist(
-            f"{assembly_name}_Rim_Back",
-            module_width_in - (thick / 2.0),
-            length=front_back_length,
-        )
-    )
-
-    # Interior joists (special spacing for sheathing alignment)
-    # First joist at 14.5" from front rim (allows 4x8 sheathing to land on centers)
-    # Subsequent joists at 16" OC
-    positions = []
-    first_spacing = 14.5  # Distance from front rim center to first joist center
-    first_center = thick / 2.0 + first_spacing
-    positions.append(first_center)
-
-    # Remaining joists at 16" OC
-    y_pos = first_center + spacing_oc
-    while y_pos <= module_width_in - thick / 2.0 - spacing_oc:
-        positions.append(y_pos)
-        y_pos += spacing_oc
-
-    for idx, y_pos in enumerate(positions, start=1):
-        created.append(make_joist(f"{assembly_name}_Joist_{idx}", y_pos, joist_stock_length))
-
-    # Hangers on left/right rims
-    left_base_x = thick  # Left rim's right face
-    right_base_x = module_length_in - thick  # Right rim's left face
-    hanger_objs = []
-    for idx, y_pos in enumerate(positions, start=1):
-        hanger_objs.append(
-            make_hanger(f"{assembly_name}_Hanger_L_{idx}", left_base_x, y_pos, facing=1)
-        )
-        hanger_objs.append(
-            make_hanger(f"{assembly_name}_Hanger_R_{idx}", right_base_x, y_pos, facing=-1)
-        )
-
-    created.extend(hanger_objs)
+        attach_metadata_bulk(joist_objs, joist_row, joist_label_use, supplier="lowes")
+        attach_metadata_bulk(rim_objs, rim_row, rim_label_use, supplier="lowes")
+        purge_touched(created + hanger_objs)
 
     # Create assembly
-    App.Console.PrintMessage(f"[parts] Creating assembly '{assembly_name}'...\n")
+    _log(f"[parts] Creating assembly '{assembly_name}'...\n")
 
     # Remove existing assembly if present
     existing = doc.getObject(assembly_name)
     if existing:
         doc.removeObject(existing.Name)
-        App.Console.PrintMessage(f"[parts] Removed existing assembly '{assembly_name}'.\n")
+        _log(f"[parts] Removed existing assembly '{assembly_name}'.\n")
 
     assembly = create_assembly(doc, assembly_name)
 
-    # Add LCS markers for snapping
-    lcs_origin = assembly.newObject("PartDesign::CoordinateSystem", f"{assembly_name}_LCS_Origin")
-    lcs_origin.Label = "LCS_Origin"
-    lcs_origin.Placement = App.Placement(App.Vector(0, 0, 0), App.Rotation())
-
-    lcs_bottom_right = assembly.newObject(
-        "PartDesign::CoordinateSystem", f"{assembly_name}_LCS_BottomRight"
-    )
-    lcs_bottom_right.Label = "LCS_BottomRight"
-    lcs_bottom_right.Placement = App.Placement(
-        App.Vector(inch(module_length_in), 0, 0), App.Rotation()
-    )
-
-    lcs_top_left = assembly.newObject(
-        "PartDesign::CoordinateSystem", f"{assembly_name}_LCS_TopLeft"
-    )
-    lcs_top_left.Label = "LCS_TopLeft"
-    lcs_top_left.Placement = App.Placement(App.Vector(0, inch(module_width_in), 0), App.Rotation())
-
-    lcs_top_right = assembly.newObject(
-        "PartDesign::CoordinateSystem", f"{assembly_name}_LCS_TopRight"
-    )
-    lcs_top_right.Label = "LCS_TopRight"
-    lcs_top_right.Placement = App.Placement(
-        App.Vector(inch(module_length_in), inch(module_width_in), 0), App.Rotation()
-    )
+    _add_lcs_markers(assembly, assembly_name, module_length_in, module_width_in)
 
     # Create hardware subgroup
     hanger_grp = assembly.newObject("App::DocumentObjectGroup", f"{assembly_name}_Hardware")
     hanger_grp.Label = "Hardware"
-    for h in hanger_objs:
-        hanger_grp.addObject(h)
+    hanger_grp.addObjects(hanger_objs)
 
-    # Add all parts to assembly
-    for obj in created:
-        if obj not in hanger_objs:
-            assembly.addObject(obj)
+    # Add all parts to assembly (hangers live in the hardware group)
+    assembly.addObjects(created)
 
     # Add hardware group to assembly
     assembly.addObject(hanger_grp)
@@ -245,7 +289,7 @@ def create_joist_module(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[parts] ✓ Assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -268,6 +312,7 @@ def create_deck_module_front(
     make_pressure_treated=True,
     hanger_label="hanger_LU210",
     blocking_positions_in=None,
+    recompute=True,
 ):
     """
     Create a front deck joist assembly with rotated orientation.
@@ -289,6 +334,8 @@ def create_deck_module_front(
         blocking_positions_in: List of Y positions (inches from module origin) for blocking.
                               Blocking runs E-W between joists to support perpendicular
                               seam boards on the deck surface. Pass None for no blocking.
+        recompute: Recompute the document when done. Pass False when building
+                   several modules and recomputing once at the end.
 
     Returns:
         App::Part assembly with LCS markers for snapping
@@ -325,15 +372,15 @@ def create_deck_module_front(
     depth = float(joist_row["actual_width_in"])  # 11.25" for 2x12
 
     def make_box(x_len, y_len, z_len):
-        return Part.makeBox(inch(x_len), inch(y_len), inch(z_len))
+        return cached_box(inch(x_len), inch(y_len), inch(z_len))
 
     def make_rim_x(name, y_pos, length=module_x_in):
         """Create rim running in X direction (front/back of deck)."""
         box = make_box(length, thick, depth)
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = box
-        obj.Placement.Base = App.Vector(0, inch(y_pos - thick / 2.0), 0)
-        attach_metadata(obj, rim_row, rim_label_use, supplier="lowes")
+        obj.Placement = App.Placement(App.Vector(0, inch(y_pos - thick / 2.0), 0), App.Rotation())
+        rim_objs.append(obj)
         return obj
 
     def make_joist_y(name, x_pos, length_in):
@@ -342,189 +389,173 @@ def create_deck_module_front(
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = box
         # Place joists inside rims: start at Y=thick (front rim's back face)
-        obj.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), inch(thick), 0)
-        attach_metadata(obj, joist_row, joist_label_use, supplier="lowes")
-        return obj
-
-    def make_hanger_y_front(name, x_center):
-        """Create hanger for Y-running joist at front rim (joist south end)."""
-        # Joist starts at Y = thick (inside front rim)
-        # Front rim face (south side) is at Y = thick
-        return make_hanger_for_joist(
-            doc,
-            name,
-            joist_x_in=x_center,
-            joist_y_in=thick,  # Y where joist meets front rim
-            joist_z_in=0.0,  # Joist bottom Z
-            joist_thick_in=thick,
-            joist_depth_in=depth,
-            rim_face_position_in=thick,  # South face of front rim
-            rim_axis="X",  # Front rim runs E-W
-            rim_side="south",  # Joist is south of rim interior face
-            hanger_thickness_in=hanger_thickness,
-            hanger_height_in=hanger_height,
-            hanger_seat_depth_in=hanger_seat_depth,
-            hanger_label=hanger_label,
+        obj.Placement = App.Placement(
+            App.Vector(inch(x_pos - thick / 2.0), inch(thick), 0), App.Rotation()
         )
+        joist_objs.append(obj)
+        return obj
 
-    def make_hanger_y_back(name, x_center, module_y):
-        """Create hanger for Y-running joist at back rim (joist north end)."""
-        # Joist ends at Y = module_y - thick (inside back rim)
-        # Back rim face (north side) is at Y = module_y - thick
-        return make_hanger_for_joist(
-            doc,
-            name,
-            joist_x_in=x_center,
-            joist_y_in=module_y - thick,  # Y where joist meets back rim
-            joist_z_in=0.0,  # Joist bottom Z
-            joist_thick_in=thick,
-            joist_depth_in=depth,
-            rim_face_position_in=module_y - thick,  # North face of back rim
-            rim_axis="X",  # Back rim runs E-W
-            rim_side="north",  # Joist is north of rim interior face
-            hanger_thickness_in=hanger_thickness,
-            hanger_height_in=hanger_height,
-            hanger_seat_depth_in=hanger_seat_depth,
-            hanger_label=hanger_label,
-        )
-
-    created = []
-
-    # Front and back rims (run in X direction)
-    created.append(make_rim_x(f"{assembly_name}_Rim_Front", thick / 2.0))
-    created.append(make_rim_x(f"{assembly_name}_Rim_Back", module_y_in - thick / 2.0))
-
-    # Left and right end joists (run in Y direction, connect front/back rims)
-    joist_run = module_y_in - 2 * thick  # Length between rims
-    created.append(make_joist_y(f"{assembly_name}_Joist_Left", thick / 2.0, joist_run))
-    created.append(
-        make_joist_y(f"{assembly_name}_Joist_Right", module_x_in - thick / 2.0, joist_run)
-    )
-
-    # Interior joists at 16" OC (only if module is wide enough)
-    positions = []
-    first_spacing = 14.5  # First joist at 14.5" from left edge
-    first_center = thick / 2.0 + first_spacing
-
-    # Only add interior joists if they fit within the module bounds
-    # Module must be wide enough to fit: left joist + first_spacing + interior joist + clearance + right joist
-    min_width_for_interior = thick + first_spacing + thick + 3.0 + thick  # ~22.5"
-    if module_x_in >= min_width_for_interior:
-        positions.append(first_center)
+    # Boards are tagged per stock row once the frame is built
+    rim_objs = []
+    joist_objs = []
 
-        # Remaining joists at 16" OC
-        next_center = first_center + spacing_oc
-        while next_center < module_x_in - thick / 2.0 - 3.0:  # Leave 3" minimum to right joist
-            positions.append(next_center)
-            next_center += spacing_oc
+    # One transaction for the whole build coalesces the per-object change events
+    with doc_transaction(doc, assembly_name):
+        created = []
 
-    # Hardware group
-    hanger_grp = doc.addObject("App::DocumentObjectGroup", f"{assembly_name}_Hangers")
+        # Front and back rims (run in X direction)
+        created.append(make_rim_x(f"{assembly_name}_Rim_Front", thick / 2.0))
+        created.append(make_rim_x(f"{assembly_name}_Rim_Back", module_y_in - thick / 2.0))
 
-    for i, x_center in enumerate(positions):
-        joist = make_joist_y(f"{assembly_name}_Joist_{i+1}", x_center, joist_run)
-        created.append(joist)
-        # Hangers at front and back rims
-        hanger_grp.addObject(make_hanger_y_front(f"{assembly_name}_Hanger_Front_{i+1}", x_center))
-        hanger_grp.addObject(
-            make_hanger_y_back(f"{assembly_name}_Hanger_Back_{i+1}", x_center, module_y_in)
+        # Left and right end joists (run in Y direction, connect front/back rims)
+        joist_run = module_y_in - 2 * thick  # Length between rims
+        created.append(make_joist_y(f"{assembly_name}_Joist_Left", thick / 2.0, joist_run))
+        created.append(
+            make_joist_y(f"{assembly_name}_Joist_Right", module_x_in - thick / 2.0, joist_run)
         )
 
-    # Blocking between joists at specified Y positions (for seam board support)
-    # Blocking runs E-W (X direction) between adjacent joists
-    blocking_pieces = []
-    if blocking_positions_in:
-        # Collect all joist X centers (including left/right end joists)
-        all_joist_x = [thick / 2.0] + positions + [module_x_in - thick / 2.0]
-        all_joist_x = sorted(all_joist_x)
-
-        # Find blocking stock (use 2x12 cut to fit between joists)
-        blocking_label = "2x12x96"  # 8' stock, field cut to ~14.5"
-        blocking_label_use = blocking_label + "_PT" if make_pressure_treated else blocking_label
-        blocking_row = find_stock(catalog_rows, blocking_label_use)
-        if not blocking_row:
-            App.Console.PrintWarning(
-                f"[parts] Blocking stock '{blocking_label_use}' not found, skipping blocking\n"
+        # Interior joists at 16" OC (only if module is wide enough)
+        positions = []
+        first_spacing = 14.5  # First joist at 14.5" from left edge
+        first_center = thick / 2.0 + first_spacing
+
+        # Only add interior joists if they fit within the module bounds
+        # Module must be wide enough to fit: left joist + first_spacing + interior joist + clearance + right joist
+        min_width_for_interior = thick + first_spacing + thick + 3.0 + thick  # ~22.5"
+        if module_x_in >= min_width_for_interior:
+            # First joist plus the rest at 16" OC, all strictly short of the limit
+            limit = module_x_in - thick / 2.0 - 3.0  # Leave 3" minimum to right joist
+            n_joists = max(1, math.ceil((limit - first_center) / spacing_oc))
+            positions = [first_center + i * spacing_oc for i in range(n_joists)]
+
+        # Hardware group
+        hanger_grp = doc.addObject("App::DocumentObjectGroup", f"{assembly_name}_Hangers")
+
+        hanger_specs = []
+        for i, x_center in enumerate(positions):
+            joist = make_joist_y(f"{assembly_name}_Joist_{i+1}", x_center, joist_run)
+            created.append(joist)
+            # Hangers at front and back rims (joist ends meet the rim faces at
+            # Y = thick and Y = module_y - thick)
+            hanger_specs.append(
+                {
+                    "name": f"{assembly_name}_Hanger_Front_{i+1}",
+                    "joist_x_in": x_center,
+                    "joist_y_in": thick,
+                    "joist_z_in": 0.0,
+                    "rim_face_position_in": thick,
+                    "rim_axis": "X",
+                    "rim_side": "south",
+                }
             )
-        else:
-            blocking_thick = float(blocking_row["actual_thickness_in"])  # 1.5"
-            blocking_depth = float(blocking_row["actual_width_in"])  # 11.25"
-
-            for y_pos_in in blocking_positions_in:
-                # Filter: only create blocking within the joist run area
-                # (between front rim back face and back rim front face)
-                if y_pos_in <= thick or y_pos_in >= module_y_in - thick:
-                    continue
-
-                # Create blocking between each pair of adjacent joists
-                # Stagger alternating blocks for face-nailing access
-                for j in range(len(all_joist_x) - 1):
-                    left_joist_x = all_joist_x[j]
-                    right_joist_x = all_joist_x[j + 1]
-
-                    # Blocking fits between joist faces
-                    blocking_x_start = left_joist_x + thick / 2.0
-                    blocking_x_end = right_joist_x - thick / 2.0
-                    blocking_length = blocking_x_end - blocking_x_start
-
-                    if blocking_length > 0.5:  # Only create if there's room
-                        block = make_box(blocking_length, blocking_thick, blocking_depth)
-                        block_obj = doc.addObject(
-                            "Part::Feature", f"{assembly_name}_Block_{len(blocking_pieces)+1}"
-                        )
-                        block_obj.Shape = block
-                        # Stagger every other block by blocking thickness for face-nailing
-                        # Even-indexed blocks are at base Y, odd-indexed are offset by blocking_thick
-                        y_offset = blocking_thick if (j % 2 == 1) else 0.0
-                        block_obj.Placement.Base = App.Vector(
-                            inch(blocking_x_start),
-                            inch(y_pos_in - blocking_thick / 2.0 + y_offset),
-                            0,
-                        )
-                        attach_metadata(
-                            block_obj, blocking_row, blocking_label_use, supplier="lowes"
-                        )
-                        blocking_pieces.append(block_obj)
-                        created.append(block_obj)
-
-        if blocking_pieces:
-            pos_list = ", ".join([str(int(p)) + "in" for p in blocking_positions_in])
-            App.Console.PrintMessage(
-                f"[parts]   Added {len(blocking_pieces)} blocking pieces at Y positions: [{pos_list}]\n"
+            hanger_specs.append(
+                {
+                    "name": f"{assembly_name}_Hanger_Back_{i+1}",
+                    "joist_x_in": x_center,
+                    "joist_y_in": module_y_in - thick,
+                    "joist_z_in": 0.0,
+                    "rim_face_position_in": module_y_in - thick,
+                    "rim_axis": "X",
+                    "rim_side": "north",
+                }
             )
 
-    # Create assembly
-    assembly = create_assembly(doc, assembly_name)
-    for obj in created:
-        if hasattr(obj, "Shape"):
-            assembly.addObject(obj)
-    assembly.addObject(hanger_grp)
+        # All hangers share one size, so build them in one batch
+        hanger_grp.addObjects(
+            make_hangers_for_joists(
+                doc,
+                hanger_specs,
+                joist_thick_in=thick,
+                joist_depth_in=depth,
+                hanger_thickness_in=hanger_thickness,
+                hanger_height_in=hanger_height,
+                hanger_seat_depth_in=hanger_seat_depth,
+                hanger_label=hanger_label,
+            )
+        )
 
-    # Add LCS markers for snapping
-    # Origin at (0, 0, 0) - bottom-left-front corner
-    lcs_origin = doc.addObject("PartDesign::CoordinateSystem", f"{assembly_name}_LCS_Origin")
-    lcs_origin.Placement.Base = App.Vector(0, 0, 0)
-    assembly.addObject(lcs_origin)
+        # Blocking between joists at specified Y positions (for seam board support)
+        # Blocking runs E-W (X direction) between adjacent joists
+        blocking_pieces = []
+        if blocking_positions_in:
+            # Collect all joist X centers (including left/right end joists)
+            all_joist_x = [thick / 2.0] + positions + [module_x_in - thick / 2.0]
+            all_joist_x = sorted(all_joist_x)
+
+            # Find blocking stock (use 2x12 cut to fit between joists)
+            blocking_label = "2x12x96"  # 8' stock, field cut to ~14.5"
+            blocking_label_use = blocking_label + "_PT" if make_pressure_treated else blocking_label
+            blocking_row = find_stock(catalog_rows, blocking_label_use)
+            if not blocking_row:
+                App.Console.PrintWarning(
+                    f"[parts] Blocking stock '{blocking_label_use}' not found, skipping blocking\n"
+                )
+            else:
+                blocking_thick = float(blocking_row["actual_thickness_in"])  # 1.5"
+                blocking_depth = float(blocking_row["actual_width_in"])  # 11.25"
+
+                for y_pos_in in blocking_positions_in:
+                    # Filter: only create blocking within the joist run area
+                    # (between front rim back face and back rim front face)
+                    if y_pos_in <= thick or y_pos_in >= module_y_in - thick:
+                        continue
+
+                    # Create blocking between each pair of adjacent joists
+                    # Stagger alternating blocks for face-nailing access
+                    for j in range(len(all_joist_x) - 1):
+                        left_joist_x = all_joist_x[j]
+                        right_joist_x = all_joist_x[j + 1]
+
+                        # Blocking fits between joist faces
+                        blocking_x_start = left_joist_x + thick / 2.0
+                        blocking_x_end = right_joist_x - thick / 2.0
+                        blocking_length = blocking_x_end - blocking_x_start
+
+                        if blocking_length > 0.5:  # Only create if there's room
+                            block = make_box(blocking_length, blocking_thick, blocking_depth)
+                            block_obj = doc.addObject(
+                                "Part::Feature", f"{assembly_name}_Block_{len(blocking_pieces)+1}"
+                            )
+                            block_obj.Shape = block
+                            # Stagger every other block by blocking thickness for face-nailing
+                            # Even-indexed blocks are at base Y, odd-indexed are offset by blocking_thick
+                            y_offset = blocking_thick if (j % 2 == 1) else 0.0
+                            block_obj.Placement = App.Placement(
+                                App.Vector(
+                                    inch(blocking_x_start),
+                                    inch(y_pos_in - blocking_thick / 2.0 + y_offset),
+                                    0,
+                                ),
+                                App.Rotation(),
+                            )
+                            blocking_pieces.append(block_obj)
+                            created.append(block_obj)
+
+            if blocking_pieces:
+                attach_metadata_bulk(
+                    blocking_pieces, blocking_row, blocking_label_use, supplier="lowes"
+                )
+                pos_list = ", ".join([str(int(p)) + "in" for p in blocking_positions_in])
+                _log(
+                    f"[parts]   Added {len(blocking_pieces)} blocking pieces at Y positions: [{pos_list}]\n"
+                )
 
-    # BottomRight at (module_x_in, 0, 0)
-    lcs_br = doc.addObject("PartDesign::CoordinateSystem", f"{assembly_name}_LCS_BottomRight")
-    lcs_br.Placement.Base = App.Vector(inch(module_x_in), 0, 0)
-    assembly.addObject(lcs_br)
+        attach_metadata_bulk(rim_objs, rim_row, rim_label_use, supplier="lowes")
+        attach_metadata_bulk(joist_objs, joist_row, joist_label_use, supplier="lowes")
+        purge_touched(created + hanger_grp.Group)
 
-    # TopLeft at (0, module_y_in, 0)
-    lcs_tl = doc.addObject("PartDesign::CoordinateSystem", f"{assembly_name}_LCS_TopLeft")
-    lcs_tl.Placement.Base = App.Vector(0, inch(module_y_in), 0)
-    assembly.addObject(lcs_tl)
+    # Create assembly
+    assembly = create_assembly(doc, assembly_name)
+    assembly.addObjects([obj for obj in created if hasattr(obj, "Shape")])
+    assembly.addObject(hanger_grp)
 
-    # TopRight at (module_x_in, module_y_in, 0)
-    lcs_tr = doc.addObject("PartDesign::CoordinateSystem", f"{assembly_name}_LCS_TopRight")
-    lcs_tr.Placement.Base = App.Vector(inch(module_x_in), inch(module_y_in), 0)
-    assembly.addObject(lcs_tr)
+    _add_lcs_markers(assembly, assembly_name, module_x_in, module_y_in, short_labels=False)
 
-    doc.recompute()
+    if recompute:
+        doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f"[parts] ✓ Front deck '{assembly_name}' complete: "
         f'{bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
@@ -539,6 +570,7 @@ def create_deck_module_front_16x12(
     make_pressure_treated=True,
     hanger_label="hanger_LU210",
     blocking_positions_in=None,
+    recompute=True,
 ):
     """
     Create a 16x12 front deck module (16' rims E-W, 12' joists N-S).
@@ -563,6 +595,7 @@ def create_deck_module_front_16x12(
         make_pressure_treated=make_pressure_treated,
         hanger_label=hanger_label,
         blocking_positions_in=blocking_positions_in,
+        recompute=recompute,
     )
 
 
@@ -573,6 +606,7 @@ def create_deck_module_front_16x8(
     make_pressure_treated=True,
     hanger_label="hanger_LU210",
     blocking_positions_in=None,
+    recompute=True,
 ):
     """
     Create a 16x8 front deck module (16' rims E-W, 8' joists N-S).
@@ -593,6 +627,7 @@ def create_deck_module_front_16x8(
         make_pressure_treated=make_pressure_treated,
         hanger_label=hanger_label,
         blocking_positions_in=blocking_positions_in,
+        recompute=recompute,
     )
 
 
@@ -603,6 +638,7 @@ def create_deck_module_front_16x4(
     make_pressure_treated=True,
     hanger_label="hanger_LU210",
     blocking_positions_in=None,
+    recompute=True,
 ):
     """
     Create a 16x4 front deck module (16' rims E-W, 4' joists N-S).
@@ -628,6 +664,7 @@ def create_deck_module_front_16x4(
         make_pressure_treated=make_pressure_treated,
         hanger_label=hanger_label,
         blocking_positions_in=blocking_positions_in,
+        recompute=recompute,
     )
 
 
@@ -713,7 +750,6 @@ def create_joist_module_16x16(
         shape.Shape = box
         # Place joists inside rims: start at X=thick (left rim's right face)
         shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(shape, row, label_to_use, supplier="lowes")
         return shape
 
     def make_rim(name, x_pos, length=module_width, depth=width, thick=thick):
@@ -721,7 +757,6 @@ def create_joist_module_16x16(
         shape = doc.addObject("Part::Feature", name)
         shape.Shape = box
         shape.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), 0, 0)
-        attach_metadata(shape, row, label_to_use, supplier="lowes")
         return shape
 
     def make_hanger(name, x_pos, y_center, facing=1):
@@ -740,7 +775,7 @@ def create_joist_module_16x16(
         )
         if facing < 0:
             pl = h.Placement
-            pl.Rotation = App.Rotation(App.Vector(0, 0, 1), 180).multiply(pl.Rotation)
+            pl.Rotation = _ROT_Z_180.multiply(pl.Rotation)
             h.Placement = pl
         return h
 
@@ -781,6 +816,9 @@ def create_joist_module_16x16(
     for idx, y_pos in enumerate(positions, start=1):
         created.append(make_joist(f"{assembly_name}_Joist_{idx}", y_pos, stock_length))
 
+    # Rims and joists are all cut from the same stock row
+    attach_metadata_bulk(created, row, label_to_use, supplier="lowes")
+
     # Hangers on left/right rims
     # Hanger positions: helper function adds/subtracts hanger_thickness based on direction
     left_base_x = thick  # Left rim's right face
@@ -794,16 +832,14 @@ def create_joist_module_16x16(
             make_hanger(f"{assembly_name}_Hanger_R_{idx}", right_base_x, y_pos, facing=-1)
         )
 
-    created.extend(hanger_objs)
-
     # Create assembly
-    App.Console.PrintMessage(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
+    _log(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
 
     # Remove existing assembly if present
     existing = doc.getObject(assembly_name)
     if existing:
         doc.removeObject(existing.Name)
-        App.Console.PrintMessage(f"[joist_modules] Removed existing assembly '{assembly_name}'.\n")
+        _log(f"[joist_modules] Removed existing assembly '{assembly_name}'.\n")
 
     assembly = create_assembly(doc, assembly_name)
 
@@ -837,13 +873,10 @@ def create_joist_module_16x16(
     # Create hardware subgroup
     hanger_grp = assembly.newObject("App::DocumentObjectGroup", f"{assembly_name}_Hardware")
     hanger_grp.Label = "Hardware"
-    for h in hanger_objs:
-        hanger_grp.addObject(h)
+    hanger_grp.addObjects(hanger_objs)
 
     # Add all parts to assembly
-    for obj in created:
-        if obj not in hanger_objs:
-            assembly.addObject(obj)
+    assembly.addObjects(created)
 
     # Add hardware group to assembly
     assembly.addObject(hanger_grp)
@@ -851,7 +884,7 @@ def create_joist_module_16x16(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[joist_modules] ✓ Assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -926,7 +959,6 @@ def create_joist_module_16x16_stair_cutout(
         shape.Shape = box
         # Place joists inside rims: start at X=thick (left rim's right face)
         shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(shape, row, label_to_use, supplier="lowes")
         return shape
 
     def make_rim(name, x_pos, length=module_width, depth=width, thick=thick):
@@ -934,7 +966,6 @@ def create_joist_module_16x16_stair_cutout(
         shape = doc.addObject("Part::Feature", name)
         shape.Shape = box
         shape.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), 0, 0)
-        attach_metadata(shape, row, label_to_use, supplier="lowes")
         return shape
 
     def make_hanger(name, x_pos, y_center, facing=1):
@@ -953,7 +984,7 @@ def create_joist_module_16x16_stair_cutout(
         )
         if facing < 0:
             pl = h.Placement
-            pl.Rotation = App.Rotation(App.Vector(0, 0, 1), 180).multiply(pl.Rotation)
+            pl.Rotation = _ROT_Z_180.multiply(pl.Rotation)
             h.Placement = pl
         return h
 
@@ -1052,7 +1083,7 @@ def create_joist_module_16x16_stair_cutout(
     stair_rim_left_face_x = shortened_joist_end_x
     stair_rim_x = stair_rim_left_face_x  # Left face of rim (used directly in Placement.Base)
 
-    App.Console.PrintMessage(
+    _log(
         f'[parts] Stair cutout: shortening first {joists_to_shorten_count} joists to {shortened_joist_length:.1f}" for stairs\n'
     )
 
@@ -1087,8 +1118,6 @@ def create_joist_module_16x16_stair_cutout(
                 make_hanger(f"{assembly_name}_Hanger_R_{idx}", right_base_x, y_pos, facing=-1)
             )
 
-    created.extend(hanger_objs)
-
     # Add stair cutout rim joist (frames the stair opening)
     # CRITICAL: Stair rim position was calculated above (stair_rim_x) before creating joists
     # This ensures shortened joists end exactly at the rim's left face
@@ -1113,7 +1142,6 @@ def create_joist_module_16x16_stair_cutout(
     stair_rim_box = Part.makeBox(inch(thick), inch(stair_rim_length), inch(width))
     stair_rim.Shape = stair_rim_box
     stair_rim.Placement.Base = App.Vector(inch(stair_rim_x), inch(stair_rim_y_start), 0)
-    attach_metadata(stair_rim, row, label_to_use, supplier="lowes")
     created.append(stair_rim)
 
     # Add hangers on stair rim
@@ -1178,7 +1206,6 @@ def create_joist_module_16x16_stair_cutout(
     stair_rim_right_box = Part.makeBox(inch(thick), inch(stair_rim_length), inch(width))
     stair_rim_right.Shape = stair_rim_right_box
     stair_rim_right.Placement.Base = App.Vector(inch(stair_rim_right_x), inch(stair_rim_y_start), 0)
-    attach_metadata(stair_rim_right, row, label_to_use, supplier="lowes")
     created.append(stair_rim_right)
 
     # Hangers at right stair rim ends
@@ -1221,21 +1248,23 @@ def create_joist_module_16x16_stair_cutout(
             inch(y_pos - thick / 2.0),  # Center on Y position
             0,
         )
-        attach_metadata(baby_joist, row, label_to_use, supplier="lowes")
         created.append(baby_joist)
 
-    App.Console.PrintMessage(
+    _log(
         f'[parts] Added {joists_to_shorten_count} baby joists ({baby_joist_length:.1f}" long) between right stair rim and outer rim\n'
     )
 
+    # Rims, joists, stair rims and baby joists are all cut from the same stock row
+    attach_metadata_bulk(created, row, label_to_use, supplier="lowes")
+
     # Create assembly (same structure as create_joist_module_16x16)
-    App.Console.PrintMessage(f"[parts] Creating stair-cutout assembly '{assembly_name}'...\n")
+    _log(f"[parts] Creating stair-cutout assembly '{assembly_name}'...\n")
 
     # Remove existing assembly if present
     existing = doc.getObject(assembly_name)
     if existing:
         doc.removeObject(existing.Name)
-        App.Console.PrintMessage(f"[parts] Removed existing assembly '{assembly_name}'.\n")
+        _log(f"[parts] Removed existing assembly '{assembly_name}'.\n")
 
     assembly = create_assembly(doc, assembly_name)
 
@@ -1269,13 +1298,10 @@ def create_joist_module_16x16_stair_cutout(
     # Create hardware subgroup
     hanger_grp = assembly.newObject("App::DocumentObjectGroup", f"{assembly_name}_Hardware")
     hanger_grp.Label = "Hardware"
-    for h in hanger_objs:
-        hanger_grp.addObject(h)
+    hanger_grp.addObjects(hanger_objs)
 
     # Add all parts to assembly
-    for obj in created:
-        if obj not in hanger_objs:
-            assembly.addObject(obj)
+    assembly.addObjects(created)
 
     # Add hardware group to assembly
     assembly.addObject(hanger_grp)
@@ -1283,7 +1309,7 @@ def create_joist_module_16x16_stair_cutout(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[parts] ✓ Stair-cutout assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -1338,6 +1364,10 @@ def create_joist_module_16x8(
     stock_length = float(row["length_in"])
 
     # Helper functions
+    # Boards are tagged per stock row once the frame is built
+    joist_objs = []
+    rim_objs = []
+
     def make_box(length, thickness, depth):
         return Part.makeBox(inch(length), inch(thickness), inch(depth))
 
@@ -1347,7 +1377,7 @@ def create_joist_module_16x8(
         shape.Shape = box
         # Place joists inside rims: start at X=thick (left rim's right face)
         shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(shape, row, label_to_use, supplier="lowes")
+        joist_objs.append(shape)
         return shape
 
     def make_rim(name, x_pos, length=module_width, depth=width, thick=thick):
@@ -1355,7 +1385,7 @@ def create_joist_module_16x8(
         shape = doc.addObject("Part::Feature", name)
         shape.Shape = box
         shape.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), 0, 0)
-        attach_metadata(shape, rim_row, rim_label_to_use, supplier="lowes")
+        rim_objs.append(shape)
         return shape
 
     def make_hanger(name, x_pos, y_center, facing=1):
@@ -1374,7 +1404,7 @@ def create_joist_module_16x8(
         )
         if facing < 0:
             pl = h.Placement
-            pl.Rotation = App.Rotation(App.Vector(0, 0, 1), 180).multiply(pl.Rotation)
+            pl.Rotation = _ROT_Z_180.multiply(pl.Rotation)
             h.Placement = pl
         return h
 
@@ -1405,6 +1435,9 @@ def create_joist_module_16x8(
     for idx, y_pos in enumerate(positions, start=1):
         created.append(make_joist(f"{assembly_name}_Joist_{idx}", y_pos, stock_length))
 
+    attach_metadata_bulk(rim_objs, rim_row, rim_label_to_use, supplier="lowes")
+    attach_metadata_bulk(joist_objs, row, label_to_use, supplier="lowes")
+
     # Hangers on rims (skip first/last joist)
     # Hanger positions: helper function adds/subtracts hanger_thickness based on direction
     left_base_x = thick  # Left rim's right face
@@ -1420,15 +1453,13 @@ def create_joist_module_16x8(
             make_hanger(f"{assembly_name}_Hanger_R_{idx}", right_base_x, y_pos, facing=-1)
         )
 
-    created.extend(hanger_objs)
-
     # Create assembly
-    App.Console.PrintMessage(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
+    _log(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
 
     existing = doc.getObject(assembly_name)
     if existing:
         doc.removeObject(existing.Name)
-        App.Console.PrintMessage(f"[joist_modules] Removed existing assembly '{assembly_name}'.\n")
+        _log(f"[joist_modules] Removed existing assembly '{assembly_name}'.\n")
 
     assembly = create_assembly(doc, assembly_name)
 
@@ -1462,20 +1493,17 @@ def create_joist_module_16x8(
     # Create hardware subgroup
     hanger_grp = assembly.newObject("App::DocumentObjectGroup", f"{assembly_name}_Hardware")
     hanger_grp.Label = "Hardware"
-    for h in hanger_objs:
-        hanger_grp.addObject(h)
+    hanger_grp.addObjects(hanger_objs)
 
     # Add all parts to assembly
-    for obj in created:
-        if obj not in hanger_objs:
-            assembly.addObject(obj)
+    assembly.addObjects(created)
 
     assembly.addObject(hanger_grp)
 
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[joist_modules] ✓ Assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -1517,7 +1545,7 @@ def create_joist_module_8x16(
     hanger_seat_depth = 2.0
     hanger_color = None
 
-    App.Console.PrintMessage(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
+    _log(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
 
     # Resolve stock for joists and long rims (16' stock)
     stock_key = stock_label + ("_PT" if make_pressure_treated else "")
@@ -1536,19 +1564,23 @@ def create_joist_module_8x16(
     depth = float(joist_stock["actual_width_in"])  # 11.25" for 2x12
     short_rim_length = float(short_rim_stock["length_in"])  # 96" for 8' stock
 
+    # Boards are tagged per stock row once the frame is built (16' rims count as joists)
+    joist_objs = []
+    short_rim_objs = []
+
     # Helper functions for part creation
     def make_joist(name, y_pos, length_in):
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = Part.makeBox(inch(length_in), inch(thick), inch(depth))
         obj.Placement.Base = App.Vector(0, inch(y_pos - thick / 2.0), 0)
-        attach_metadata(obj, joist_stock, stock_key)
+        joist_objs.append(obj)
         return obj
 
     def make_rim(name, x_pos, length_in):
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = Part.makeBox(inch(thick), inch(length_in), inch(depth))
         obj.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), 0, 0)
-        attach_metadata(obj, joist_stock, stock_key)
+        joist_objs.append(obj)
         return obj
 
     def make_short_rim(name, y_pos, length_in):
@@ -1557,7 +1589,7 @@ def create_joist_module_8x16(
         obj.Shape = Part.makeBox(inch(length_in), inch(thick), inch(depth))
         # Start at X=thick (right face of left rim) to span interior width
         obj.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(obj, short_rim_stock, short_rim_key)
+        short_rim_objs.append(obj)
         return obj
 
     def make_hanger(name, x_pos, y_center, facing=1):
@@ -1575,7 +1607,7 @@ def create_joist_module_8x16(
             color=hanger_color,
         )
         if facing < 0:
-            h.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), 180)
+            h.Placement.Rotation = _ROT_Z_180
         return h
 
     # Create assembly container
@@ -1620,9 +1652,12 @@ def create_joist_module_8x16(
         shape.Shape = Part.makeBox(inch(module_length - 2 * thick), inch(thick), inch(depth))
         # Place joists inside rims: start at X=thick (left rim's right face)
         shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(shape, joist_stock, stock_key)
+        joist_objs.append(shape)
         created.append(shape)
 
+    attach_metadata_bulk(joist_objs, joist_stock, stock_key)
+    attach_metadata_bulk(short_rim_objs, short_rim_stock, short_rim_key)
+
     # Hangers at left and right rim faces
     # Hanger positions: helper function adds/subtracts hanger_thickness based on direction
     left_base_x = thick  # Left rim's right face
@@ -1643,8 +1678,7 @@ def create_joist_module_8x16(
         else:
             joist_grp.addObject(obj)
 
-    for obj in hanger_objs:
-        hanger_grp.addObject(obj)
+    hanger_grp.addObjects(hanger_objs)
 
     # Add groups to assembly
     assembly.addObject(rim_grp)
@@ -1654,7 +1688,7 @@ def create_joist_module_8x16(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[joist_modules] ✓ Assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -1696,7 +1730,7 @@ def create_joist_module_8x8(
     hanger_seat_depth = 2.0
     hanger_color = None
 
-    App.Console.PrintMessage(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
+    _log(f"[joist_modules] Creating assembly '{assembly_name}'...\n")
 
     # Resolve stock
     stock_key = stock_label + ("_PT" if make_pressure_treated else "")
@@ -1714,14 +1748,12 @@ def create_joist_module_8x8(
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = Part.makeBox(inch(length_in), inch(thick), inch(depth))
         obj.Placement.Base = App.Vector(inch(x_offset), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(obj, joist_stock, stock_key)
         return obj
 
     def make_rim(name, x_pos, length_in):
         obj = doc.addObject("Part::Feature", name)
         obj.Shape = Part.makeBox(inch(thick), inch(length_in), inch(depth))
         obj.Placement.Base = App.Vector(inch(x_pos - thick / 2.0), 0, 0)
-        attach_metadata(obj, joist_stock, stock_key)
         return obj
 
     def make_hanger(name, x_pos, y_center, facing=1):
@@ -1739,7 +1771,7 @@ def create_joist_module_8x8(
             color=hanger_color,
         )
         if facing < 0:
-            h.Placement.Rotation = App.Rotation(App.Vector(0, 0, 1), 180)
+            h.Placement.Rotation = _ROT_Z_180
         return h
 
     # Create assembly container
@@ -1793,9 +1825,11 @@ def create_joist_module_8x8(
         shape.Shape = Part.makeBox(inch(module_length - 2 * thick), inch(thick), inch(depth))
         # Place joists inside rims: start at X=thick (left rim's right face)
         shape.Placement.Base = App.Vector(inch(thick), inch(y_pos - thick / 2.0), 0)
-        attach_metadata(shape, joist_stock, stock_key)
         created.append(shape)
 
+    # Rims and joists are all cut from the same stock row
+    attach_metadata_bulk(created, joist_stock, stock_key)
+
     # Hangers at left and right rim faces
     left_base_x = thick  # Left rim's right face
     right_base_x = module_length - thick  # Right rim's left face
@@ -1815,8 +1849,7 @@ def create_joist_module_8x8(
         else:
             joist_grp.addObject(obj)
 
-    for obj in hanger_objs:
-        hanger_grp.addObject(obj)
+    hanger_grp.addObjects(hanger_objs)
 
     # Add groups to assembly
     assembly.addObject(rim_grp)
@@ -1826,7 +1859,7 @@ def create_joist_module_8x8(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f'[joist_modules] ✓ Assembly \'{assembly_name}\' complete: {bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
 
@@ -1949,7 +1982,7 @@ def create_second_floor_module_20x12(
         total_y_in = rim_thick + joist_run + rim_thick  # 1.75 + 144 + 1.75 = 147.5"
 
     # Log the calculated dimensions
-    App.Console.PrintMessage(
+    _log(
         f"[parts] Module '{assembly_name}': total {total_x_in:.2f}\" x {total_y_in:.2f}\", "
         f'LVL front/back={rim_front_back_length:.2f}", joist run={joist_run:.2f}"\n'
     )
@@ -1963,6 +1996,11 @@ def create_second_floor_module_20x12(
     def make_box(x_len, y_len, z_len):
         return Part.makeBox(inch(x_len), inch(y_len), inch(z_len))
 
+    # Boards are tagged per stock row once the frame is built (2x12 rims count as joists)
+    rim_objs = []
+    joist_objs = []
+    filler_objs = []
+
     def make_rim_front_back(name, y_pos):
         """Create LVL rim running in X direction (front/back of module, FULL WIDTH)."""
         box = make_box(rim_front_back_length, rim_thick, rim_depth)
@@ -1970,7 +2008,7 @@ def create_second_floor_module_20x12(
         obj.Shape = box
         # Position at X=0 (full width), Y=y_pos
         obj.Placement.Base = App.Vector(0, inch(y_pos), 0)
-        attach_metadata(obj, rim_row, rim_label, supplier="lowes")
+        rim_objs.append(obj)
         return obj
 
     def make_rim_left_right(name, x_pos):
@@ -1981,7 +2019,7 @@ def create_second_floor_module_20x12(
         obj.Shape = box
         # Position between front/back LVL rims, raised so top aligns with LVL top
         obj.Placement.Base = App.Vector(inch(x_pos), inch(rim_thick), inch(joist_z_offset))
-        attach_metadata(obj, joist_row, joist_label_use, supplier="lowes")
+        joist_objs.append(obj)
         return obj
 
     # Calculate Z offset to align joist tops with LVL beam tops
@@ -2010,7 +2048,7 @@ def create_second_floor_module_20x12(
         obj.Placement.Base = App.Vector(
             inch(x_pos - joist_thick / 2.0), inch(rim_thick), inch(joist_z_offset)
         )
-        attach_metadata(obj, joist_row, joist_label_use, supplier="lowes")
+        joist_objs.append(obj)
         return obj
 
     def make_filler_strip(name, x_pos, length_in=None):
@@ -2032,8 +2070,7 @@ def create_second_floor_module_20x12(
         obj.Placement.Base = App.Vector(
             inch(x_pos - joist_thick / 2.0), inch(rim_thick + hanger_seat_depth), 0
         )
-        if filler_row:
-            attach_metadata(obj, filler_row, filler_label, supplier="lowes")
+        filler_objs.append(obj)
         return obj
 
     created = []
@@ -2078,6 +2115,7 @@ def create_second_floor_module_20x12(
     # Hardware group
     hanger_grp = doc.addObject("App::DocumentObjectGroup", f"{assembly_name}_Hangers")
 
+    hanger_specs = []
     for i, x_center in enumerate(positions):
         joist = make_joist_y(f"{assembly_name}_Joist_{i+1}", x_center)
         created.append(joist)
@@ -2087,56 +2125,54 @@ def create_second_floor_module_20x12(
             if filler:
                 created.append(filler)
 
-        # Hangers at front and back LVL rims using new explicit placement function
-        # Front hanger: joist meets front LVL rim at Y = rim_thick (south face of rim)
-        # Joist is SOUTH of rim face, hanger opens NORTH toward rim
-        hanger_grp.addObject(
-            make_hanger_for_joist(
-                doc,
-                f"{assembly_name}_Hanger_Front_{i+1}",
-                joist_x_in=x_center,
-                joist_y_in=rim_thick,  # Y where joist starts (south face of front rim)
-                joist_z_in=joist_z_offset,  # Joist bottom Z
-                joist_thick_in=joist_thick,
-                joist_depth_in=joist_depth,
-                rim_face_position_in=rim_thick,  # South face of front LVL rim
-                rim_axis="X",  # Front LVL rim runs E-W
-                rim_side="south",  # Joist is south of rim face
-                hanger_thickness_in=hanger_thickness,
-                hanger_height_in=hanger_height,
-                hanger_seat_depth_in=hanger_seat_depth,
-                hanger_label=hanger_label,
-            )
+        # Hangers at front and back LVL rims using explicit placement
+        # Front hanger: joist meets front LVL rim at Y = rim_thick, hanger opens NORTH
+        hanger_specs.append(
+            {
+                "name": f"{assembly_name}_Hanger_Front_{i+1}",
+                "joist_x_in": x_center,
+                "joist_y_in": rim_thick,
+                "joist_z_in": joist_z_offset,
+                "rim_face_position_in": rim_thick,
+                "rim_axis": "X",
+                "rim_side": "south",
+            }
+        )
+        # Back hanger: joist meets back LVL rim at Y = total_y_in - rim_thick, hanger opens SOUTH
+        hanger_specs.append(
+            {
+                "name": f"{assembly_name}_Hanger_Back_{i+1}",
+                "joist_x_in": x_center,
+                "joist_y_in": total_y_in - rim_thick,
+                "joist_z_in": joist_z_offset,
+                "rim_face_position_in": total_y_in - rim_thick,
+                "rim_axis": "X",
+                "rim_side": "north",
+            }
         )
 
-        # Back hanger: joist meets back LVL rim at Y = total_y_in - rim_thick (north face of rim)
-        # Joist is NORTH of rim face, hanger opens SOUTH toward rim
-        hanger_grp.addObject(
-            make_hanger_for_joist(
-                doc,
-                f"{assembly_name}_Hanger_Back_{i+1}",
-                joist_x_in=x_center,
-                joist_y_in=total_y_in - rim_thick,  # Y where joist ends (north face of back rim)
-                joist_z_in=joist_z_offset,  # Joist bottom Z
-                joist_thick_in=joist_thick,
-                joist_depth_in=joist_depth,
-                rim_face_position_in=total_y_in - rim_thick,  # North face of back LVL rim
-                rim_axis="X",  # Back LVL rim runs E-W
-                rim_side="north",  # Joist is north of rim face
-                hanger_thickness_in=hanger_thickness,
-                hanger_height_in=hanger_height,
-                hanger_seat_depth_in=hanger_seat_depth,
-                hanger_label=hanger_label,
-            )
+    hanger_grp.addObjects(
+        make_hangers_for_joists(
+            doc,
+            hanger_specs,
+            joist_thick_in=joist_thick,
+            joist_depth_in=joist_depth,
+            hanger_thickness_in=hanger_thickness,
+            hanger_height_in=hanger_height,
+            hanger_seat_depth_in=hanger_seat_depth,
+            hanger_label=hanger_label,
         )
+    )
+
+    attach_metadata_bulk(rim_objs, rim_row, rim_label, supplier="lowes")
+    attach_metadata_bulk(joist_objs, joist_row, joist_label_use, supplier="lowes")
+    attach_metadata_bulk(filler_objs, filler_row, filler_label, supplier="lowes")
 
     # NOTE: Sheathing is added separately after all joist modules are placed
 
     # Create assembly
     assembly = create_assembly(doc, assembly_name)
-    for obj in created:
-        if hasattr(obj, "Shape"):
-            assembly.addObject(obj)
+    assembly.addObjects([obj for obj in created if hasattr(obj, "Shape")])
     assembly.addObject(hanger_grp)
 
     # Add LCS markers for snapping
@@ -2163,7 +2199,7 @@ def create_second_floor_module_20x12(
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f"[parts] ✓ Second floor module '{assembly_name}' complete: "
         f'{bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
@@ -2273,30 +2309,28 @@ def create_sheathing_for_floor(
     sheathing_x_min_in = floor_x_min_in + exclude_left_in
     sheathing_x_span_in = floor_x_span_in - exclude_left_in - exclude_right_in
 
-    App.Console.PrintMessage(
+    _log(
         f"[create_sheathing] Floor bbox (mm): X={floor_bbox.XMin:.1f} to {floor_bbox.XMax:.1f} ({floor_bbox.XLength:.1f}), "
         f"Y={floor_bbox.YMin:.1f} to {floor_bbox.YMax:.1f} ({floor_bbox.YLength:.1f})\n"
     )
-    App.Console.PrintMessage(
+    _log(
         f'[create_sheathing] Floor dimensions: {floor_x_span_in:.2f}" x {floor_y_span_in:.2f}" '
         f'at Z={floor_z_top_in:.2f}"\n'
     )
     if exclude_left_in > 0 or exclude_right_in > 0:
-        App.Console.PrintMessage(
+        _log(
             f'[create_sheathing] Exclusion zones: left {exclude_left_in:.2f}", right {exclude_right_in:.2f}"\n'
         )
-        App.Console.PrintMessage(
+        _log(
             f'[create_sheathing] Sheathing area: {sheathing_x_span_in:.2f}" (from X={sheathing_x_min_in:.2f}")\n'
         )
-    App.Console.PrintMessage(
-        f'[create_sheathing] Panel size: {panel_width_in:.2f}" x {panel_length_in:.2f}"\n'
-    )
+    _log(f'[create_sheathing] Panel size: {panel_width_in:.2f}" x {panel_length_in:.2f}"\n')
 
     created = []
 
     # Calculate number of columns (panels across X direction) using sheathing area (not full floor)
     cols = int(math.ceil(sheathing_x_span_in / panel_width_in))
-    App.Console.PrintMessage(
+    _log(
         f'[create_sheathing] Calculated {cols} columns ({sheathing_x_span_in:.2f}" / {panel_width_in:.2f}")\n'
     )
 
@@ -2366,21 +2400,20 @@ def create_sheathing_for_floor(
     existing = doc.getObject(group_name)
     if existing:
         doc.removeObject(existing.Name)
-        App.Console.PrintMessage(f"[create_sheathing] Removed existing assembly: {group_name}\n")
+        _log(f"[create_sheathing] Removed existing assembly: {group_name}\n")
 
     # Create assembly container (App::Part has spatial properties)
     assembly = doc.addObject("App::Part", group_name)
     assembly.Label = group_name
 
     # Add all panels to assembly
-    for panel in created:
-        assembly.addObject(panel)
+    assembly.addObjects(created)
 
     # Recompute to update bounding box
     doc.recompute()
 
     bbox = get_assembly_bbox(assembly)
-    App.Console.PrintMessage(
+    _log(
         f"[create_sheathing] ✓ Created {len(created)} sheathing panels ({group_name}): "
         f'{bbox.XLength / 25.4:.2f}" x {bbox.YLength / 25.4:.2f}" x {bbox.ZLength / 25.4:.2f}"\n'
     )
@@ -628,8 +628,7 @@ def create_deck_railings(
     assembly = doc.addObject("App::Part", assembly_name)
     assembly.Label = assembly_name
 
-    for obj in all_posts + all_rails + all_balusters:
-        assembly.addObject(obj)
+    assembly.addObjects(all_posts + all_rails + all_balusters)
 
     App.Console.PrintMessage(
         f"[railing] ✓ Deck railings complete: {assembly_name} "
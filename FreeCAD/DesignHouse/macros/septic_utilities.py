@@ -591,7 +591,7 @@ def create_pile_sill_seal(
 
             # Add custom property for cut length
             try:
-                if "cut_length_ft" not in foam_obj.PropertiesList:
+                if not hasattr(foam_obj, "cut_length_ft"):
                     foam_obj.addProperty("App::PropertyString", "cut_length_ft")
                 foam_obj.cut_length_ft = f"{perimeter_ft:.2f}"
             except Exception:
@@ -745,6 +745,7 @@ def create_concrete_slab(doc, config, pile_positions_ft=None, pile_size_in=12.0)
 
     # Cut out piles if positions provided
     if pile_positions_ft:
+        cutouts = []
         for pile_x_ft, pile_y_ft in pile_positions_ft:
             # Check if pile is within slab bounds
             if (
@@ -767,8 +768,12 @@ def create_concrete_slab(doc, config, pile_positions_ft=None, pile_size_in=12.0)
                     bc.inch(-thickness_in - 0.5),  # Start below slab
                 )
 
-                # Cut pile from slab
-                slab_box = slab_box.cut(cutout)
+                cutouts.append(cutout)
+
+        # Cut all piles from slab in one boolean
+        if cutouts:
+            tool = cutouts[0] if len(cutouts) == 1 else Part.makeCompound(cutouts)
+            slab_box = slab_box.cut(tool)
 
     # Create slab object
     slab = doc.addObject("Part::Feature", "Concrete_Slab_6in")
@@ -3192,9 +3197,9 @@ def create_exterior_stairs(doc, stairs_config, floor_z_ft=20.0, slab_z_ft=0.0):
                 attach_metadata(tread, tread_row, tread_label, supplier="lowes")
                 # Add cut length property
                 try:
-                    if "cut_length_in" not in tread.PropertiesList:
-                        tread.addProperty("App::PropertyString", "cut_length_in")
-                    tread.cut_length_in = f"{tread_length_in:.2f}"
+                    if not hasattr(tread, "cut_length_in"):
+                        tread.addProperty("App::PropertyFloat", "cut_length_in")
+                    tread.cut_length_in = round(tread_length_in, 2)
                 except Exception:
                     pass
 
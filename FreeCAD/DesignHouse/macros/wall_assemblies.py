@@ -184,7 +184,7 @@ def create_window_wall_double_3x5(
         )
         lc.attach_metadata(obj, jack_row, jack_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = f"{jack_height}"
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = jack_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_JACK)
@@ -207,9 +207,7 @@ def create_window_wall_double_3x5(
         )
         lc.attach_metadata(obj, header_row, header_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{header_length}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = header_length
         except Exception:
             pass
         apply_debug_color(obj, color)
@@ -228,9 +226,7 @@ def create_window_wall_double_3x5(
     )
     lc.attach_metadata(ply_obj, ply_row, ply_key, supplier="lowes")
     try:
-        ply_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{header_length}"
-        )
+        ply_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = header_length
     except Exception:
         pass
     apply_debug_color(ply_obj, COLOR_PLY)
@@ -255,8 +251,8 @@ def create_window_wall_double_3x5(
     )
     lc.attach_metadata(cap_plate_obj, plate_row, plate_key, supplier="lowes")
     try:
-        cap_plate_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{header_length}"
+        cap_plate_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = (
+            header_length
         )
     except Exception:
         pass
@@ -277,9 +273,7 @@ def create_window_wall_double_3x5(
         )
         lc.attach_metadata(obj, plate_row, plate_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{block_height}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = block_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_BLOCK)
@@ -305,9 +299,7 @@ def create_window_wall_double_3x5(
         )
         lc.attach_metadata(obj, plate_row, plate_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{short_height}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = short_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_BOTTOM_SHORT)
@@ -336,8 +328,8 @@ def create_window_wall_double_3x5(
     )
     lc.attach_metadata(cap_bottom_obj, plate_row, plate_key, supplier="lowes")
     try:
-        cap_bottom_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{cap_bottom_length}"
+        cap_bottom_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = (
+            cap_bottom_length
         )
     except Exception:
         pass
@@ -354,8 +346,8 @@ def create_window_wall_double_3x5(
     )
     lc.attach_metadata(cap_second_obj, plate_row, plate_key, supplier="lowes")
     try:
-        cap_second_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{cap_bottom_length}"
+        cap_second_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = (
+            cap_bottom_length
         )
     except Exception:
         pass
@@ -389,9 +381,7 @@ def create_window_wall_double_3x5(
         )
         lc.attach_metadata(obj, plate_row, plate_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{stud60_height}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = stud60_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_KING)
@@ -410,8 +400,8 @@ def create_window_wall_double_3x5(
     )
     lc.attach_metadata(cap_top_obj, plate_row, plate_key, supplier="lowes")
     try:
-        cap_top_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{cap_bottom_length}"
+        cap_top_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = (
+            cap_bottom_length
         )
     except Exception:
         pass
@@ -420,8 +410,7 @@ def create_window_wall_double_3x5(
 
     # Add all parts to assembly
     App.Console.PrintMessage(f"[wall_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     App.Console.PrintMessage(
         f"[wall_assemblies] ✓ Assembly complete: {assembly_name} ({len(created)} parts)\n"
@@ -580,7 +569,7 @@ def create_sliding_door_72x80(
         )
         lc.attach_metadata(obj, jack_row, jack_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = f"{jack_height}"
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = jack_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_JACK)
@@ -608,7 +597,7 @@ def create_sliding_door_72x80(
         )
         lc.attach_metadata(obj, jack_row, jack_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = f"{jack_height}"
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = jack_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_JACK)
@@ -627,9 +616,7 @@ def create_sliding_door_72x80(
         )
         lc.attach_metadata(obj, header_row, header_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{header_length}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = header_length
         except Exception:
             pass
         apply_debug_color(obj, color)
@@ -647,9 +634,7 @@ def create_sliding_door_72x80(
     )
     lc.attach_metadata(ply_obj, ply_row, ply_key, supplier="lowes")
     try:
-        ply_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{header_length}"
-        )
+        ply_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = header_length
     except Exception:
         pass
     apply_debug_color(ply_obj, COLOR_PLY)
@@ -674,8 +659,8 @@ def create_sliding_door_72x80(
     )
     lc.attach_metadata(cap_plate_obj, plate_row, plate_key, supplier="lowes")
     try:
-        cap_plate_obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-            f"{header_length}"
+        cap_plate_obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = (
+            header_length
         )
     except Exception:
         pass
@@ -696,9 +681,7 @@ def create_sliding_door_72x80(
         )
         lc.attach_metadata(obj, plate_row, plate_key, supplier="lowes")
         try:
-            obj.addProperty("App::PropertyString", "cut_length_in").cut_length_in = (
-                f"{block_height}"
-            )
+            obj.addProperty("App::PropertyFloat", "cut_length_in").cut_length_in = block_height
         except Exception:
             pass
         apply_debug_color(obj, COLOR_BLOCK)
@@ -713,8 +696,7 @@ def create_sliding_door_72x80(
 
     # Add all parts to assembly
     App.Console.PrintMessage(f"[wall_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     App.Console.PrintMessage(
         f"[wall_assemblies] ✓ Assembly complete: {assembly_name} ({len(created)} parts)\n"
@@ -875,8 +857,7 @@ def create_solid_stud_wall(
 
     # Add all parts to assembly
     App.Console.PrintMessage(f"[wall_assemblies] Adding {len(created)} parts to assembly...\n")
-    for obj in created:
-        assembly.addObject(obj)
+    assembly.addObjects(created)
 
     App.Console.PrintMessage(
         f"[wall_assemblies] ✓ Assembly complete: {assembly_name} ({len(created)} parts)\n"